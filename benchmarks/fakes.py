@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""In-process fakes of the REANA services used by the workflow engine."""
+
+import os
+import shlex
+import subprocess
+import threading
+import time
+from types import SimpleNamespace
+
+
+class FakeJobControllerAPIClient:
+    """In-process replacement of ``JobControllerAPIClient``.
+
+    Jobs do not run in containers: they finish ``job_duration`` seconds after
+    being submitted, at which point their ``touch`` commands are applied, or
+    their commands are run otherwise. Requests take ``submit_latency`` and
+    ``status_latency`` seconds. The fake records when jobs are submitted and
+    how long it takes the engine to detect that they are done.
+    """
+
+    def __init__(
+        self, workspace, job_duration=0.0, submit_latency=0.0, status_latency=0.0
+    ):
+        """Initialise the fake job controller."""
+        self.workspace = workspace
+        self.job_duration = job_duration
+        self.submit_latency = submit_latency
+        self.status_latency = status_latency
+        self.jobs = {}
+        self.submission_times = []
+        self.detection_lags = []
+        self._lock = threading.Lock()
+        self._client = SimpleNamespace(
+            swagger_spec=SimpleNamespace(
+                api_url="http://job-controller",
+                http_client=SimpleNamespace(request=self._request),
+            )
+        )
+
+    def submit(self, **job_request_body):
+        """Start a fake job."""
+        time.sleep(self.submit_latency)
+        return {"job_id": self._start_job(job_request_body)}
+
+    def submit_batch(self, job_request_bodies):
+        """Start many fake jobs."""
+        time.sleep(self.submit_latency)
+        return [{"job_id": self._start_job(body)} for body in job_request_bodies]
+
+    def _start_job(self, job_request_body):
+        now = time.monotonic()
+        with self._lock:
+            job_id = str(len(self.jobs) + 1)
+            self.jobs[job_id] = {
+                "cmd": job_request_body["cmd"],
+                "ends_at": now + self.job_duration,
+                "done": False,
+            }
+            self.submission_times.append(now)
+        return job_id
+
+    def _get_status(self, job_id):
+        job = self.jobs[job_id]
+        now = time.monotonic()
+        if now < job["ends_at"]:
+            return "running"
+        if not job["done"]:
+            returncode = self._run_command(job["cmd"])
+            with self._lock:
+                if not job["done"]:
+                    job["done"] = True
+                    job["status"] = "finished" if returncode == 0 else "failed"
+                    self.detection_lags.append(now - job["ends_at"])
+        return job["status"]
+
+    def _run_command(self, cmd):
+        """Apply ``touch`` commands directly, run the other commands."""
+        command = shlex.split(cmd.split("&&")[-1])
+        if command and command[0] == "touch":
+            for path in command[1:]:
+                path = os.path.join(self.workspace, path)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                open(path, "a").close()
+            return 0
+        return subprocess.run(cmd, shell=True).returncode
+
+    def check_status(self, job_id):
+        """Return the status of a fake job."""
+        time.sleep(self.status_latency)
+        return SimpleNamespace(status=self._get_status(job_id))
+
+    def _request(self, request_params):
+        """Return the status of all fake jobs, as a bravado future."""
+        time.sleep(self.status_latency)
+        jobs = {
+            job_id: {"job_id": job_id, "status": self._get_status(job_id)}
+            for job_id in list(self.jobs)
+        }
+        response = SimpleNamespace(json=lambda: {"jobs": jobs})
+        return SimpleNamespace(result=lambda timeout=None: response)
+
+
+class FakeWorkflowStatusPublisher:
+    """In-process replacement of ``WorkflowStatusPublisher`` counting messages."""
+
+    def __init__(self):
+        """Initialise the fake publisher."""
+        self.messages = 0
+
+    def publish_workflow_status(self, workflow_uuid, status, logs="", message=None):
+        """Count the published message."""
+        self.messages += 1
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Benchmark building the DAG of a workspace with many files."""
+
+import os
+import tempfile
+import time
+
+import click
+from snakemake import io as snakemake_io
+from snakemake import snakemake
+
+from reana_workflow_engine_snakemake.file_status import WorkspaceSnapshot
+
+SNAKEFILE = """\
+rule all:
+    input: expand("data/{{group}}/{{sample}}.txt", group=range({groups}), sample=range({samples}))
+
+rule sample:
+    output: "data/{{group}}/{{sample}}.txt"
+    shell: "echo {{wildcards.sample}} > {{output}}"
+"""
+
+
+def create_workspace(workspace, groups, samples):
+    """Create a workspace where all the outputs of the workflow exist."""
+    with open(os.path.join(workspace, "Snakefile"), "w") as snakefile:
+        snakefile.write(SNAKEFILE.format(groups=groups, samples=samples))
+    for group in range(groups):
+        os.makedirs(os.path.join(workspace, "data", str(group)), exist_ok=True)
+        for sample in range(samples):
+            path = os.path.join(workspace, "data", str(group), f"{sample}.txt")
+            with open(path, "w") as output:
+                output.write(f"{sample}\n")
+
+
+def slow_down(function, latency):
+    """Add a latency to a file system call, as on network file systems."""
+
+    def slow_function(*args, **kwargs):
+        time.sleep(latency)
+        return function(*args, **kwargs)
+
+    return slow_function
+
+
+def build_dag(workspace, prefetch, threads):
+    """Build the DAG of the workflow without running it."""
+    iocache_class = snakemake_io.IOCache
+    if prefetch:
+        snapshot = WorkspaceSnapshot(
+            workspace, excluded_paths=(".snakemake",), threads=threads
+        )
+        snapshot.scan()
+        snakemake_io.IOCache = snapshot.wrap_iocache(iocache_class)
+    try:
+        assert snakemake(
+            os.path.join(workspace, "Snakefile"),
+            workdir=workspace,
+            dryrun=True,
+            quiet=True,
+            cores=1,
+        )
+    finally:
+        snakemake_io.IOCache = iocache_class
+
+
+@click.command()
+@click.option("--groups", default=100, show_default=True)
+@click.option("--samples", default=100, show_default=True)
+@click.option(
+    "--workspace",
+    type=click.Path(file_okay=False),
+    help="Directory where to create the workspace, e.g. on a network file system.",
+)
+@click.option(
+    "--stat-latency",
+    default=0.0,
+    show_default=True,
+    help="Seconds added to every stat and directory listing.",
+)
+@click.option("--threads", default=16, show_default=True)
+def main(groups, samples, workspace, stat_latency, threads):
+    """Compare building the DAG with and without prefetching the file status.
+
+    The workflow has ``groups`` times ``samples`` outputs, which all exist, so
+    that Snakemake checks every one of them to find that nothing has to run.
+    """
+    workspace = tempfile.mkdtemp(dir=workspace)
+    create_workspace(workspace, groups, samples)
+    if stat_latency:
+        os.stat = slow_down(os.stat, stat_latency)
+        os.scandir = slow_down(os.scandir, stat_latency)
+    for name, prefetch in (("serial", False), ("prefetched", True)):
+        start = time.monotonic()
+        build_dag(workspace, prefetch, threads)
+        click.echo(
+            f"{name}: {groups * samples} files, DAG built in "
+            f"{time.monotonic() - start:.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
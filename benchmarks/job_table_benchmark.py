@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Benchmark the tracking of active jobs by the executor status sweeps."""
+
+import gc
+import time
+import tracemalloc
+from collections import namedtuple
+
+import click
+
+from reana_workflow_engine_snakemake.job_table import JobTable
+
+# how active jobs were tracked before the job table
+REANAClusterJob = namedtuple("REANAClusterJob", "job callback error_callback")
+
+
+class FakeJob:
+    """Snakemake job with its job-controller id."""
+
+    __slots__ = ("reana_job_id",)
+
+    def __init__(self, reana_job_id):
+        """Initialise the job."""
+        self.reana_job_id = reana_job_id
+
+
+def _callback(job):
+    pass
+
+
+def _get_done_jobs(job_ids, sweeps, finished_per_sweep, events_per_wakeup, wakeups):
+    """Generate the ids of the jobs done at each sweep.
+
+    Polling sweeps detect the oldest jobs as finished, and the sweeps woken up
+    by job status events the newest ones.
+    """
+    newest = len(job_ids)
+    for sweep in range(sweeps):
+        for _ in range(wakeups):
+            yield False, set(job_ids[newest - events_per_wakeup : newest])
+            newest -= events_per_wakeup
+        oldest = sweep * finished_per_sweep
+        yield True, set(job_ids[oldest : oldest + finished_per_sweep])
+
+
+def sweep_list(jobs, sweeps, finished_per_sweep, events_per_wakeup, wakeups):
+    """Follow the jobs with a list swapped out and extended back every sweep."""
+    active_jobs = [REANAClusterJob(job, _callback, _callback) for job in jobs]
+    job_ids = [job.reana_job_id for job in jobs]
+    for _, done in _get_done_jobs(
+        job_ids, sweeps, finished_per_sweep, events_per_wakeup, wakeups
+    ):
+        # status events are matched by scanning all the active jobs
+        events = dict.fromkeys(done, "finished")
+        checked, active_jobs = active_jobs, []
+        job_status_events = {
+            active_job.job.reana_job_id: events.pop(active_job.job.reana_job_id)
+            for active_job in checked
+            if active_job.job.reana_job_id in events
+        }
+        still_running = []
+        for active_job in checked:
+            if active_job.job.reana_job_id in job_status_events:
+                active_job.callback(active_job.job)
+            else:
+                still_running.append(active_job)
+        active_jobs.extend(still_running)
+    return active_jobs
+
+
+def sweep_table(jobs, sweeps, finished_per_sweep, events_per_wakeup, wakeups):
+    """Follow the jobs with the job table, checking only event jobs on wake-ups."""
+    table = JobTable()
+    for job in jobs:
+        table.add(job, job.reana_job_id, _callback, _callback)
+    job_ids = [job.reana_job_id for job in jobs]
+    for polled, done in _get_done_jobs(
+        job_ids, sweeps, finished_per_sweep, events_per_wakeup, wakeups
+    ):
+        checked = table.start_sweep() if polled else table.start_sweep(done)
+        for active_job in checked:
+            if active_job.job_id in done:
+                table.remove(active_job)
+                active_job.callback(active_job.job)
+        table.end_sweep()
+    return table
+
+
+def measure(sweep, jobs, **kwargs):
+    """Measure the time and the peak memory used to follow the jobs."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.process_time()
+    sweep(jobs, **kwargs)
+    cpu_time = time.process_time() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return cpu_time, peak / 1024**2
+
+
+@click.command()
+@click.option("--jobs", "job_count", default=100000, show_default=True)
+@click.option("--sweeps", default=10, show_default=True)
+@click.option("--finished-per-sweep", default=1000, show_default=True)
+@click.option(
+    "--wakeups",
+    default=10,
+    show_default=True,
+    help="Number of job status event wake-ups between two polling sweeps.",
+)
+@click.option("--events-per-wakeup", default=10, show_default=True)
+def main(job_count, sweeps, finished_per_sweep, wakeups, events_per_wakeup):
+    """Compare following active jobs with a list and with the job table.
+
+    Every polling sweep detects some finished jobs, and between polling sweeps
+    the executor is woken up by job status events. CPU times do not include
+    job-controller requests. Peak memory includes the active jobs.
+    """
+    jobs = [FakeJob(f"job-{i}") for i in range(job_count)]
+    kwargs = dict(
+        sweeps=sweeps,
+        finished_per_sweep=finished_per_sweep,
+        events_per_wakeup=events_per_wakeup,
+        wakeups=wakeups,
+    )
+    for name, sweep in (("list", sweep_list), ("job table", sweep_table)):
+        cpu_time, peak_mb = measure(sweep, jobs, **kwargs)
+        click.echo(
+            f"{name}: {job_count} active jobs, CPU {cpu_time:.2f}s, "
+            f"peak memory {peak_mb:.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Run the REANA-Workflow-Engine-Snakemake scaling benchmarks."""
+
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import click
+
+from fakes import FakeJobControllerAPIClient, FakeWorkflowStatusPublisher
+from file_status_benchmark import slow_down
+from workflows import WORKFLOWS
+
+
+def run_benchmark(
+    workflow, jobs, job_duration, submit_latency, status_latency, stat_latency=0.0
+):
+    """Run one workflow with the fake services and measure the engine."""
+    if stat_latency:
+        os.stat = slow_down(os.stat, stat_latency)
+        os.scandir = slow_down(os.scandir, stat_latency)
+    # imported here, so that the engine reads the configuration of the run
+    from reana_workflow_engine_snakemake.executor import run_jobs
+    from reana_workflow_engine_snakemake.metrics import CHECKPOINT_UPDATE_DURATION
+
+    with tempfile.TemporaryDirectory() as workspace:
+        with open(os.path.join(workspace, "Snakefile"), "w") as snakefile:
+            snakefile.write(WORKFLOWS[workflow])
+        os.environ["workflow_workspace"] = workspace
+        os.environ["workflow_uuid"] = "benchmark"
+        rjc_api_client = FakeJobControllerAPIClient(
+            workspace,
+            job_duration=job_duration,
+            submit_latency=submit_latency,
+            status_latency=status_latency,
+        )
+        publisher = FakeWorkflowStatusPublisher()
+
+        usage_start = resource.getrusage(resource.RUSAGE_SELF)
+        start = time.monotonic()
+        success = run_jobs(
+            rjc_api_client,
+            publisher,
+            workspace,
+            "Snakefile",
+            {"jobs": jobs},
+            operational_options={"report_mode": "skip"},
+        )
+        makespan = time.monotonic() - start
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+
+    submissions = rjc_api_client.submission_times
+    submission_period = submissions[-1] - submissions[0] if submissions else 0
+    lags = rjc_api_client.detection_lags
+    return {
+        "workflow": workflow,
+        "jobs": jobs,
+        "success": bool(success),
+        "makespan": makespan,
+        "cpu_time": (usage.ru_utime - usage_start.ru_utime)
+        + (usage.ru_stime - usage_start.ru_stime),
+        # kilobytes on Linux, bytes on macOS
+        "peak_rss_mb": usage.ru_maxrss
+        / (1024**2 if sys.platform == "darwin" else 1024),
+        "submitted_jobs": len(submissions),
+        "submission_throughput": (
+            len(submissions) / submission_period if submission_period else None
+        ),
+        "detection_lag_mean": statistics.mean(lags) if lags else None,
+        "detection_lag_max": max(lags) if lags else None,
+        "published_messages": publisher.messages,
+        "checkpoint_dag_updates": CHECKPOINT_UPDATE_DURATION.count,
+        "checkpoint_dag_update_time": CHECKPOINT_UPDATE_DURATION.sum,
+    }
+
+
+def _send_benchmark_result(connection, *args):
+    connection.send(run_benchmark(*args))
+    connection.close()
+
+
+def run_benchmark_in_process(*args):
+    """Run one benchmark in a new process, to measure its peak memory usage."""
+    context = multiprocessing.get_context("spawn")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_send_benchmark_result, args=(sender, *args))
+    process.start()
+    sender.close()
+    try:
+        return receiver.recv()
+    finally:
+        process.join()
+
+
+def compare(results, previous_results):
+    """Print the relative change of the results with respect to previous ones."""
+    previous = {(r["workflow"], r["jobs"]): r for r in previous_results["results"]}
+    for result in results["results"]:
+        before = previous.get((result["workflow"], result["jobs"]))
+        if not before:
+            continue
+        changes = ", ".join(
+            f"{metric} {100 * (result[metric] / before[metric] - 1):+.1f}%"
+            for metric in ("makespan", "cpu_time", "peak_rss_mb")
+            if before[metric]
+        )
+        click.echo(f"{result['workflow']} ({result['jobs']} jobs): {changes}")
+
+
+@click.command()
+@click.option(
+    "--workflow",
+    "workflows",
+    multiple=True,
+    type=click.Choice(list(WORKFLOWS)),
+    help="Workflow to benchmark, all of them by default.",
+)
+@click.option(
+    "--jobs",
+    "job_counts",
+    multiple=True,
+    type=int,
+    default=(10, 100, 1000),
+    show_default=True,
+    help="Number of jobs of the benchmarked workflows.",
+)
+@click.option("--job-duration", default=0.0, show_default=True)
+@click.option("--submit-latency", default=0.0, show_default=True)
+@click.option("--status-latency", default=0.0, show_default=True)
+@click.option(
+    "--stat-latency",
+    default=0.0,
+    show_default=True,
+    help="Seconds added to every stat and directory listing of the engine.",
+)
+@click.option(
+    "--output",
+    default="benchmark-results.json",
+    show_default=True,
+    type=click.Path(dir_okay=False),
+    help="File where the results are written as JSON.",
+)
+@click.option(
+    "--compare-to",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Results of a previous run to compare the new results to.",
+)
+def main(
+    workflows,
+    job_counts,
+    job_duration,
+    submit_latency,
+    status_latency,
+    stat_latency,
+    output,
+    compare_to,
+):
+    """Benchmark the workflow engine on generated workflows of growing size.
+
+    Each benchmark runs in a new process, so that its peak memory usage can be
+    measured. The engine configuration can be changed with the usual
+    environment variables.
+    """
+    from reana_workflow_engine_snakemake.version import __version__
+    from snakemake import __version__ as snakemake_version
+
+    results = {
+        "date": datetime.now(timezone.utc).isoformat(),
+        "version": __version__,
+        "snakemake_version": snakemake_version,
+        "python_version": platform.python_version(),
+        "parameters": {
+            "job_duration": job_duration,
+            "submit_latency": submit_latency,
+            "status_latency": status_latency,
+            "stat_latency": stat_latency,
+        },
+        # engine configuration set through the environment
+        "environment": {
+            name: value
+            for name, value in os.environ.items()
+            if name.startswith(("SNAKEMAKE_", "POLL_JOBS_", "JOB_CONTROLLER_"))
+        },
+        "results": [],
+    }
+    for workflow in workflows or WORKFLOWS:
+        for jobs in job_counts:
+            result = run_benchmark_in_process(
+                workflow,
+                jobs,
+                job_duration,
+                submit_latency,
+                status_latency,
+                stat_latency,
+            )
+            click.echo(
+                f"{workflow} ({jobs} jobs): makespan {result['makespan']:.2f}s, "
+                f"CPU {result['cpu_time']:.2f}s, "
+                f"peak RSS {result['peak_rss_mb']:.0f} MB"
+            )
+            results["results"].append(result)
+
+    with open(output, "w") as output_file:
+        json.dump(results, output_file, indent=2)
+    click.echo(f"Results written to {output}.")
+    if compare_to:
+        with open(compare_to) as previous_file:
+            compare(results, json.load(previous_file))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Generated Snakefiles of the REANA-Workflow-Engine-Snakemake benchmarks.
+
+Every rule only touches its outputs, so that the benchmarks measure the
+workflow engine and not the jobs. The number of jobs is read from the
+``jobs`` configuration value.
+"""
+
+CHAIN = """
+N = int(config["jobs"])
+
+rule all:
+    input: f"chain/{N - 1}.txt"
+
+rule first:
+    output: "chain/0.txt"
+    shell: "touch {output}"
+
+rule step:
+    input: lambda wildcards: f"chain/{int(wildcards.i) - 1}.txt"
+    output: "chain/{i,[1-9][0-9]*}.txt"
+    shell: "touch {output}"
+"""
+"""Jobs running one after the other."""
+
+SCATTER_GATHER = """
+N = int(config["jobs"]) - 1
+
+rule all:
+    input: "gather.txt"
+
+rule scatter:
+    output: "scatter/{i}.txt"
+    shell: "touch {output}"
+
+rule gather:
+    input: expand("scatter/{i}.txt", i=range(N))
+    output: "gather.txt"
+    shell: "touch {output}"
+"""
+"""Independent jobs all followed by one job."""
+
+DIAMOND = """
+N = max(int(config["jobs"]) // 3, 1)
+
+rule all:
+    input: f"diamond/{N}/join.txt"
+
+rule start:
+    output: "diamond/0/join.txt"
+    shell: "touch {output}"
+
+rule branch:
+    input: lambda wildcards: f"diamond/{int(wildcards.i) - 1}/join.txt"
+    output: "diamond/{i}/{side,left|right}.txt"
+    shell: "touch {output}"
+
+rule join:
+    input: "diamond/{i}/left.txt", "diamond/{i}/right.txt"
+    output: "diamond/{i,[1-9][0-9]*}/join.txt"
+    shell: "touch {output}"
+"""
+"""Jobs forking into two branches joined again, one diamond after the other."""
+
+CHECKPOINTS = """
+N = max(int(config["jobs"]) // 10, 1)
+
+rule all:
+    input: expand("checkpoints/{i}/done.txt", i=range(N))
+
+checkpoint discover:
+    output: directory("checkpoints/{i}/samples")
+    shell: "mkdir -p {output} && for n in 1 2 3 4 5 6 7 8; do touch {output}/$n; done"
+
+def processed_samples(wildcards):
+    samples = checkpoints.discover.get(i=wildcards.i).output[0]
+    names = glob_wildcards(os.path.join(samples, "{name}")).name
+    return [
+        f"checkpoints/{wildcards.i}/processed/{name}.txt"
+        for name in names
+        if name[0] != "."
+    ]
+
+rule process:
+    input: "checkpoints/{i}/samples/{name}"
+    output: "checkpoints/{i}/processed/{name}.txt"
+    shell: "touch {output}"
+
+rule gather:
+    input: processed_samples
+    output: "checkpoints/{i}/done.txt"
+    shell: "touch {output}"
+"""
+"""Checkpoints discovering files, each followed by jobs processing them."""
+
+WORKFLOWS = {
+    "chain": CHAIN,
+    "scatter-gather": SCATTER_GATHER,
+    "diamond": DIAMOND,
+    "checkpoints": CHECKPOINTS,
+}
+"""Snakefiles of the benchmarked workflows, by name."""
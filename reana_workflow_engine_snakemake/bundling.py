@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake bundling of short jobs into REANA jobs."""
+
+import os
+import shlex
+import shutil
+from typing import Dict, List
+
+# fields of job-controller requests that can differ between bundled jobs
+BUNDLE_MEMBER_FIELDS = ("cmd", "prettified_cmd", "job_name")
+
+# fields of job-controller requests limiting the runtime of REANA jobs
+TIME_LIMIT_FIELDS = ("kubernetes_job_timeout", "htcondor_max_runtime", "slurm_time")
+
+
+def _parse_slurm_time(slurm_time) -> int:
+    """Get the seconds of a Slurm time limit, e.g. ``30``, ``1:30:00`` or ``2-12``."""
+    days, _, time = str(slurm_time).rpartition("-")
+    parts = [int(part) for part in time.split(":")]
+    if days:
+        # days-hours[:minutes[:seconds]]
+        hours, minutes, seconds = (parts + [0, 0])[:3]
+    elif len(parts) == 3:
+        hours, minutes, seconds = parts
+    else:
+        # minutes[:seconds]
+        hours, minutes, seconds = 0, parts[0], (parts + [0])[1]
+    return ((int(days or 0) * 24 + hours) * 60 + minutes) * 60 + seconds
+
+
+def _format_slurm_time(seconds: int) -> str:
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+    return f"{days}-{hours:02}:{minutes:02}:{seconds:02}"
+
+
+def sum_time_limits(job_request_bodies: List[Dict]) -> Dict:
+    """Get the time limits of a REANA job running the given jobs one by one.
+
+    :return: The time limits set for the jobs, added up.
+    :raises ValueError: If the time limits cannot be added up, e.g. when only
+        some of the jobs have one, or for HTCondor job flavours.
+    """
+    limits = {}
+    for field in TIME_LIMIT_FIELDS:
+        values = [body.get(field) for body in job_request_bodies]
+        if not any(values):
+            continue
+        if not all(values):
+            raise ValueError(f"Only some of the jobs have a '{field}' time limit.")
+        if field == "slurm_time":
+            limits[field] = _format_slurm_time(sum(map(_parse_slurm_time, values)))
+        elif field == "htcondor_max_runtime":
+            limits[field] = str(sum(int(value) for value in values))
+        else:
+            limits[field] = sum(int(value) for value in values)
+    return limits
+
+
+def get_bundle_key(job_request_body: Dict) -> tuple:
+    """Get the key of the job request, equal for jobs that can be bundled."""
+    return tuple(
+        sorted(
+            (field, str(value))
+            for field, value in job_request_body.items()
+            if field not in BUNDLE_MEMBER_FIELDS
+        )
+    )
+
+
+class JobBundle:
+    """Snakemake jobs submitted to job-controller as one REANA job.
+
+    The commands of the jobs are run one after the other, with the sum of
+    their time limits, or all at the same time if ``parallel`` is set. The exit
+    code of every command is written in ``status_dir``, so that the jobs can
+    succeed or fail independently.
+    """
+
+    is_norun = False
+
+    def __init__(self, submissions: List, status_dir: str, parallel: bool = False):
+        """Initialise the job bundle.
+
+        :param submissions: Submissions of the bundled Snakemake jobs, with
+            ``job`` and ``job_request_body`` fields.
+        :param status_dir: Directory where the exit codes of the jobs are kept.
+        :param parallel: Whether to run the commands of the jobs in parallel.
+        """
+        self.submissions = submissions
+        self.status_dir = status_dir
+        self.parallel = parallel
+        self._name = f"{submissions[0].job.name}-bundle"
+
+    @property
+    def jobs(self) -> List:
+        """Get the bundled Snakemake jobs."""
+        return [submission.job for submission in self.submissions]
+
+    @property
+    def name(self) -> str:
+        """Get the name of the bundle, after its first job."""
+        return self._name
+
+    def _get_status_file(self, job) -> str:
+        return os.path.join(self.status_dir, str(job.jobid))
+
+    def get_request_body(self) -> Dict:
+        """Build the job-controller request running the commands of all jobs."""
+        status_files = [shlex.quote(self._get_status_file(job)) for job in self.jobs]
+        commands = [
+            f"( {submission.job_request_body['cmd']} ); echo $? > {status_file}"
+            for submission, status_file in zip(self.submissions, status_files)
+        ]
+        if self.parallel:
+            commands = [f"{{ {command}; }} &" for command in commands] + ["wait;"]
+        else:
+            commands = [f"{command};" for command in commands]
+        check = (
+            f"for status_file in {' '.join(status_files)}; do "
+            '[ "$(cat $status_file)" = 0 ] || exit 1; done'
+        )
+        job_request_bodies = [
+            submission.job_request_body for submission in self.submissions
+        ]
+        return {
+            **job_request_bodies[0],
+            **({} if self.parallel else sum_time_limits(job_request_bodies)),
+            "cmd": " ".join(
+                [f"mkdir -p {shlex.quote(self.status_dir)};", *commands, check]
+            ),
+            "prettified_cmd": "\n".join(
+                submission.job_request_body["prettified_cmd"]
+                for submission in self.submissions
+            ),
+            "job_name": self.name,
+        }
+
+    def release_request_bodies(self) -> None:
+        """Forget the requests of the bundled jobs, once the bundle one is built."""
+        self.submissions = [
+            submission._replace(job_request_body=None)
+            for submission in self.submissions
+        ]
+
+    def get_job_results(self) -> List[bool]:
+        """Get whether each bundled job succeeded, removing their exit codes."""
+        results = []
+        for job in self.jobs:
+            try:
+                with open(self._get_status_file(job)) as status_file:
+                    results.append(status_file.read().strip() == "0")
+            except OSError:
+                # the bundle stopped before running the job
+                results.append(False)
+        shutil.rmtree(self.status_dir, ignore_errors=True)
+        return results
@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake cache of job results shared across runs."""
+
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import uuid
+from typing import Callable, Dict, Iterable, List, Optional
+
+from reana_workflow_engine_snakemake.config import LOGGING_MODULE
+
+log = logging.getLogger(LOGGING_MODULE)
+
+JOB_CACHE_LINK_MODES = ("reflink", "copy")
+"""Ways of putting files in the cache and restoring them in workspaces.
+
+Hard links are not offered, as jobs writing to their outputs in place and
+restored outputs getting new modification times would change the cached files
+of every workspace sharing them.
+"""
+
+# fields of job-controller requests that change between runs of the same job
+RUN_SPECIFIC_FIELDS = (
+    "cmd",
+    "job_name",
+    "prettified_cmd",
+    "workflow_uuid",
+    "workflow_workspace",
+)
+
+MANIFEST_FILE = "manifest.json"
+
+# `ioctl` request cloning a file on Linux file systems supporting it
+FICLONE = 0x40049409
+
+
+def _reflink(src: str, dst: str) -> None:
+    """Clone the file, sharing its data until one of the copies is modified."""
+    with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+        fcntl.ioctl(dst_file.fileno(), FICLONE, src_file.fileno())
+    shutil.copystat(src, dst)
+
+
+def get_relative_path(path: str, workflow_workspace: str) -> Optional[str]:
+    """Get the path relative to the workspace, or ``None`` if it is outside of it."""
+    path = os.path.relpath(os.path.join(workflow_workspace, path), workflow_workspace)
+    return None if path.startswith(os.pardir) else path
+
+
+def _get_relative_path(path: str, workflow_workspace: str) -> str:
+    return get_relative_path(path, workflow_workspace) or os.path.normpath(
+        os.path.join(workflow_workspace, path)
+    )
+
+
+def _get_size(path: str) -> int:
+    if not os.path.isdir(path):
+        return os.path.getsize(path)
+    return sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, files in os.walk(path)
+        for name in files
+    )
+
+
+class JobResultCache:
+    """Outputs of jobs stored by a hash of everything they depend on.
+
+    A job is identified by its container image, command, resources and the
+    contents of its input files and other dependencies, so that identical jobs
+    of different workflow runs can reuse the outputs of the first one instead
+    of running again.
+
+    Cached outputs are shared between workspaces with reflinks when the file
+    system allows it, otherwise they are copied. The least
+    recently used results are evicted when the cache grows over ``max_size``
+    bytes.
+    """
+
+    def __init__(self, cache_dir: str, max_size: int, link_mode: str = "reflink"):
+        """Initialise the job result cache.
+
+        :param cache_dir: Directory shared by the workflow runs keeping results.
+        :param max_size: Maximum size of the cached results, in bytes.
+        :param link_mode: One of ``JOB_CACHE_LINK_MODES``.
+        """
+        if link_mode not in JOB_CACHE_LINK_MODES:
+            raise ValueError(
+                f"Unknown job cache link mode '{link_mode}', "
+                f"valid modes are {', '.join(JOB_CACHE_LINK_MODES)}."
+            )
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.link_mode = link_mode
+        self.stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+        self._lock = threading.Lock()
+        # path -> (size, modification time, digest) of the hashed input files
+        self._digests: Dict[str, tuple] = {}
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _copy_file(self, src: str, dst: str) -> str:
+        """Copy a file with the configured link mode, falling back to copying."""
+        copy_functions: List[Callable] = [shutil.copy2]
+        if self.link_mode == "reflink":
+            copy_functions.insert(0, _reflink)
+        for copy_function in copy_functions[:-1]:
+            try:
+                copy_function(src, dst)
+                return dst
+            except OSError:
+                # e.g. the file system does not support reflinks
+                if os.path.lexists(dst):
+                    os.remove(dst)
+        return shutil.copy2(src, dst)
+
+    def _copy(self, src: str, dst: str) -> None:
+        os.makedirs(os.path.dirname(dst) or ".", exist_ok=True)
+        if os.path.isdir(src):
+            shutil.copytree(src, dst, copy_function=self._copy_file)
+        else:
+            self._copy_file(src, dst)
+
+    def _hash_file(self, path: str) -> str:
+        """Hash the contents of a file, reusing the digest if it did not change."""
+        stat = os.stat(path)
+        with self._lock:
+            cached = self._digests.get(path)
+        if cached and cached[:2] == (stat.st_size, stat.st_mtime_ns):
+            return cached[2]
+        digest = hashlib.sha256()
+        with open(path, "rb") as input_file:
+            for chunk in iter(lambda: input_file.read(1024 * 1024), b""):
+                digest.update(chunk)
+        with self._lock:
+            self._digests[path] = (stat.st_size, stat.st_mtime_ns, digest.hexdigest())
+        return digest.hexdigest()
+
+    def _hash_path(self, path: str) -> str:
+        if not os.path.isdir(path):
+            return self._hash_file(path)
+        digest = hashlib.sha256()
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                file_path = os.path.join(root, name)
+                digest.update(os.path.relpath(file_path, path).encode())
+                digest.update(self._hash_file(file_path).encode())
+        return digest.hexdigest()
+
+    def get_key(
+        self,
+        job_request_body: Dict,
+        command: str,
+        input_files: Iterable[str],
+        output_files: Iterable[str],
+        workflow_workspace: str,
+        dependencies: Iterable[str] = (),
+    ) -> str:
+        """Compute the key identifying the results of a job.
+
+        Paths are taken relative to the workspace, so that the same job run in
+        another workspace has the same key.
+
+        :param job_request_body: Job-controller request submitting the job.
+        :param command: Shell command of the job.
+        :param input_files: Paths of the input files of the job.
+        :param output_files: Paths of the output files of the job.
+        :param dependencies: Paths of other files the job depends on, e.g. its
+            scripts and software environment files.
+        """
+        workspace = os.path.join(workflow_workspace, "")
+        input_files = [
+            _get_relative_path(path, workflow_workspace) for path in input_files
+        ]
+        dependencies = [
+            _get_relative_path(path, workflow_workspace) for path in dependencies
+        ]
+        job_description = {
+            "request": {
+                field: value
+                for field, value in job_request_body.items()
+                if field not in RUN_SPECIFIC_FIELDS
+            },
+            "command": command.replace(workspace, "").replace(workflow_workspace, ""),
+            "inputs": sorted(
+                (path, self._hash_path(os.path.join(workflow_workspace, path)))
+                for path in input_files
+            ),
+            "outputs": sorted(
+                _get_relative_path(path, workflow_workspace) for path in output_files
+            ),
+            "dependencies": sorted(
+                (path, self._hash_path(os.path.join(workflow_workspace, path)))
+                for path in dependencies
+            ),
+        }
+        return hashlib.sha256(
+            json.dumps(job_description, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    def _get_entry_dir(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def restore(
+        self, key: str, output_files: Iterable[str], workflow_workspace: str
+    ) -> bool:
+        """Restore the cached outputs of a job in the workspace.
+
+        :return: Whether the outputs were found in the cache.
+        """
+        entry_dir = self._get_entry_dir(key)
+        manifest = os.path.join(entry_dir, MANIFEST_FILE)
+        restored = []
+        try:
+            # mark the entry as recently used
+            os.utime(manifest)
+            for output_file in output_files:
+                dst = os.path.join(workflow_workspace, output_file)
+                restored.append(dst)
+                self._copy(os.path.join(entry_dir, "outputs", output_file), dst)
+                # restored outputs are newer than the inputs, as if the job ran,
+                # which does not change the cached files as they are not linked
+                os.utime(dst)
+        except OSError as exception:
+            if restored:
+                # e.g. the entry was evicted while being restored
+                log.warning(f"Could not restore cached job results {key}: {exception}")
+            for path in restored:
+                self._remove(path)
+            self._count("misses")
+            return False
+        self._count("hits")
+        return True
+
+    def store(
+        self, key: str, output_files: Iterable[str], workflow_workspace: str
+    ) -> None:
+        """Store the outputs of a job in the cache, evicting old results if needed."""
+        entry_dir = self._get_entry_dir(key)
+        if os.path.exists(entry_dir):
+            return
+        tmp_dir = os.path.join(self.cache_dir, f"tmp-{uuid.uuid4()}")
+        try:
+            size = 0
+            for output_file in output_files:
+                src = os.path.join(workflow_workspace, output_file)
+                self._copy(src, os.path.join(tmp_dir, "outputs", output_file))
+                size += _get_size(src)
+            with open(os.path.join(tmp_dir, MANIFEST_FILE), "w") as manifest:
+                json.dump({"size": size, "outputs": sorted(output_files)}, manifest)
+            os.makedirs(os.path.dirname(entry_dir), exist_ok=True)
+            # entries appear atomically for the other workflow runs
+            os.rename(tmp_dir, entry_dir)
+        except OSError as exception:
+            # e.g. another workflow run stored the same results in the meantime
+            if not os.path.exists(entry_dir):
+                log.warning(f"Could not cache job results {key}: {exception}")
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return
+        self._count("stores")
+        self.evict()
+
+    def _read_entries(self) -> List[tuple]:
+        """Get the last use time, size and directory of all cached results."""
+        entries = []
+        for prefix in os.listdir(self.cache_dir):
+            prefix_dir = os.path.join(self.cache_dir, prefix)
+            if prefix.startswith("tmp-") or not os.path.isdir(prefix_dir):
+                continue
+            for key in os.listdir(prefix_dir):
+                manifest = os.path.join(prefix_dir, key, MANIFEST_FILE)
+                try:
+                    with open(manifest) as manifest_file:
+                        size = json.load(manifest_file)["size"]
+                    entries.append((os.path.getmtime(manifest), size, manifest))
+                except (OSError, ValueError, KeyError):
+                    continue
+        return entries
+
+    def evict(self) -> None:
+        """Remove the least recently used results until the cache is small enough."""
+        entries = sorted(self._read_entries())
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, manifest in entries:
+            if total_size <= self.max_size:
+                break
+            shutil.rmtree(os.path.dirname(manifest), ignore_errors=True)
+            total_size -= size
+            self._count("evictions")
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        if os.path.isdir(path) and not os.path.islink(path):
+            shutil.rmtree(path, ignore_errors=True)
+        elif os.path.lexists(path):
+            os.remove(path)
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self.stats[stat] += 1
+
+    def get_hit_ratio(self) -> Optional[float]:
+        """Get the ratio of the jobs found in the cache."""
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / lookups if lookups else None
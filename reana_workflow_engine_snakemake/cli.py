@@ -20,7 +20,11 @@ from reana_commons.config import (
 from reana_commons.workflow_engine import create_workflow_engine_command
 
 from reana_workflow_engine_snakemake.config import LOGGING_MODULE
-from reana_workflow_engine_snakemake.executor import run_jobs
+from reana_workflow_engine_snakemake.executor import (
+    generate_report,
+    get_report_mode,
+    run_jobs,
+)
 
 
 logging.basicConfig(level=REANA_LOG_LEVEL, format=REANA_LOG_FORMAT)
@@ -62,6 +66,13 @@ def run_snakemake_workflow_engine_adapter(
         publisher.publish_workflow_status(
             workflow_uuid, failed_status, logs="Workflow exited unexpectedly."
         )
+    if get_report_mode(operational_options) == "deferred":
+        generate_report(
+            workflow_workspace,
+            workflow_file,
+            workflow_parameters,
+            operational_options=operational_options,
+        )
 
 
 run_snakemake_workflow = create_workflow_engine_command(
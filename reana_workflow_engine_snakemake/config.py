@@ -23,11 +23,366 @@ LOGGING_MODULE = "reana-workflow-engine-snakemake"
 DEFAULT_SNAKEMAKE_REPORT_FILENAME = "report.html"
 """Snakemake report default filename."""
 
+SNAKEMAKE_REPORT_MODES = ("sync", "deferred", "skip")
+"""Supported modes of generating the Snakemake report.
+
+- ``sync``: generate the report before publishing the final workflow status.
+- ``deferred``: publish the final workflow status first, then generate the report.
+- ``skip``: do not generate the report.
+"""
+
+SNAKEMAKE_REPORT_MODE = os.getenv("SNAKEMAKE_REPORT_MODE", "sync")
+"""Default mode of generating the Snakemake report.
+
+Can be overridden with the ``report_mode`` operational option.
+"""
+
+SNAKEMAKE_REPORT_TIMEOUT_IN_SECONDS = float(
+    os.getenv("SNAKEMAKE_REPORT_TIMEOUT_IN_SECONDS", "1800")
+)
+"""Maximum time to wait for the Snakemake report to be generated."""
+
 SNAKEMAKE_MAX_PARALLEL_JOBS = int(os.getenv("SNAKEMAKE_MAX_PARALLEL_JOBS", "300"))
 """Snakemake maximum number of jobs that can run in parallel."""
 
-POLL_JOBS_STATUS_SLEEP_IN_SECONDS = 10
-"""Time to sleep between polling for job status."""
+SNAKEMAKE_RESUME = bool(strtobool(os.getenv("SNAKEMAKE_RESUME", "false")))
+"""Whether to resume interrupted workflow runs instead of starting them afresh.
+
+Jobs that are still running are followed again instead of being submitted
+again. Can be overridden with the ``resume`` operational option.
+"""
+
+SNAKEMAKE_MAX_LOCAL_JOBS = int(os.getenv("SNAKEMAKE_MAX_LOCAL_JOBS", "4"))
+"""Maximum number of jobs running in parallel inside the workflow engine.
+
+Jobs of rules listed in ``localrules`` or with the ``local`` resource set run
+inside the workflow engine instead of being submitted to job-controller.
+"""
+
+SNAKEMAKE_LOCAL_RUN_JOBS = bool(
+    strtobool(os.getenv("SNAKEMAKE_LOCAL_RUN_JOBS", "false"))
+)
+"""Whether to run the jobs of rules with Python ``run`` blocks inside the engine."""
+
+POLL_JOBS_STATUS_SLEEP_IN_SECONDS = float(
+    os.getenv("POLL_JOBS_STATUS_SLEEP_IN_SECONDS", "10")
+)
+"""Maximum time to sleep between polling for job status."""
+
+POLL_JOBS_STATUS_MIN_SLEEP_IN_SECONDS = float(
+    os.getenv("POLL_JOBS_STATUS_MIN_SLEEP_IN_SECONDS", "1")
+)
+"""Minimum time to sleep between polling for job status.
+
+Used right after jobs finish or are submitted while none is running, and when
+running jobs are expected to finish soon.
+"""
+
+POLL_JOBS_STATUS_BACKOFF_FACTOR = float(
+    os.getenv("POLL_JOBS_STATUS_BACKOFF_FACTOR", "2")
+)
+"""Factor by which the time between polling for job status grows when idle."""
+
+SNAKEMAKE_PROGRESS_MAX_EVENTS = int(os.getenv("SNAKEMAKE_PROGRESS_MAX_EVENTS", "100"))
+"""Maximum number of job progress updates merged into one workflow status message."""
+
+SNAKEMAKE_PROGRESS_MAX_DELAY_IN_SECONDS = float(
+    os.getenv("SNAKEMAKE_PROGRESS_MAX_DELAY_IN_SECONDS", "2")
+)
+"""Maximum time job progress updates are held before being published."""
+
+SNAKEMAKE_JOB_STATUS_QUEUE = os.getenv("SNAKEMAKE_JOB_STATUS_QUEUE", "")
+"""Prefix of the message queues where job status events are consumed from.
+
+The events of a workflow are consumed from the ``<prefix>.<workflow_uuid>``
+queue. If set, finished and failed jobs are detected as soon as their status
+events are received, and job-controller is only polled as a safety net.
+"""
+
+SNAKEMAKE_JOB_STATUS_EVENTS_MAX_AGE_IN_SECONDS = float(
+    os.getenv("SNAKEMAKE_JOB_STATUS_EVENTS_MAX_AGE_IN_SECONDS", "600")
+)
+"""Maximum time job status events of unknown jobs are kept.
+
+Events can arrive before the submission of their job returns, they are only
+kept while jobs are being submitted.
+"""
+
+POLL_JOBS_STATUS_EVENTS_SLEEP_IN_SECONDS = float(
+    os.getenv("POLL_JOBS_STATUS_EVENTS_SLEEP_IN_SECONDS", "60")
+)
+"""Time to sleep between polling for job status when consuming job status events."""
+
+SNAKEMAKE_MAX_STATUS_CHECK_WORKERS = int(
+    os.getenv("SNAKEMAKE_MAX_STATUS_CHECK_WORKERS", "10")
+)
+"""Maximum number of job status requests sent concurrently to job-controller."""
+
+SNAKEMAKE_MAX_SUBMISSION_WORKERS = int(
+    os.getenv("SNAKEMAKE_MAX_SUBMISSION_WORKERS", "10")
+)
+"""Maximum number of jobs submitted concurrently to job-controller."""
+
+SNAKEMAKE_BATCH_SUBMISSION = bool(
+    strtobool(os.getenv("SNAKEMAKE_BATCH_SUBMISSION", "false"))
+)
+"""Whether to submit the jobs that are ready at the same time in one request.
+
+Only for job-controller clients providing ``submit_batch``, jobs are otherwise
+submitted one by one.
+"""
+
+SNAKEMAKE_SUBMISSION_BATCH_SIZE = int(
+    os.getenv("SNAKEMAKE_SUBMISSION_BATCH_SIZE", "50")
+)
+"""Maximum number of jobs submitted to job-controller in one request."""
+
+SNAKEMAKE_JOB_BUNDLE_SIZE = int(os.getenv("SNAKEMAKE_JOB_BUNDLE_SIZE", "1"))
+"""Maximum number of jobs ready at the same time bundled into one REANA job.
+
+Only jobs with the same job-controller settings, such as the container image,
+are bundled. Can be overridden for each rule with the ``bundle_size`` resource.
+"""
+
+SNAKEMAKE_JOB_BUNDLE_PARALLEL = bool(
+    strtobool(os.getenv("SNAKEMAKE_JOB_BUNDLE_PARALLEL", "false"))
+)
+"""Whether to run the commands of bundled jobs in parallel instead of in sequence.
+
+Jobs with a ``kubernetes_memory_limit`` are always run in sequence, as the
+limit of one job applies to the whole bundle.
+"""
+
+SNAKEMAKE_JOB_BUNDLE_MAX_RUNTIME_IN_MINUTES = float(
+    os.getenv("SNAKEMAKE_JOB_BUNDLE_MAX_RUNTIME_IN_MINUTES", "60")
+)
+"""Maximum total ``runtime`` resource of the jobs run in sequence in a bundle."""
+
+SNAKEMAKE_BULK_STATUS_CHECK = bool(
+    strtobool(os.getenv("SNAKEMAKE_BULK_STATUS_CHECK", "true"))
+)
+"""Whether to get the statuses of all active jobs from job-controller at once.
+
+If job-controller cannot list its jobs, job statuses are checked one by one.
+"""
+
+SNAKEMAKE_MAX_JOBS_PER_COMPUTE_BACKEND = os.getenv(
+    "SNAKEMAKE_MAX_JOBS_PER_COMPUTE_BACKEND", ""
+)
+"""Maximum number of jobs in flight per compute backend, e.g. ``slurm:50,htcondor:500``.
+
+Jobs over the limit wait in the workflow engine until other jobs of the same
+backend are done. The jobs of a rule can also be limited with the
+``max_running_jobs`` resource.
+"""
+
+SNAKEMAKE_SUBMISSION_LATENCY_TARGET_IN_SECONDS = float(
+    os.getenv("SNAKEMAKE_SUBMISSION_LATENCY_TARGET_IN_SECONDS", "5")
+)
+"""Job submission latency over which submissions are slowed down."""
+
+SNAKEMAKE_SUBMISSION_MAX_DELAY_IN_SECONDS = float(
+    os.getenv("SNAKEMAKE_SUBMISSION_MAX_DELAY_IN_SECONDS", "30")
+)
+"""Maximum delay between job submissions when job-controller is under load."""
+
+SNAKEMAKE_SUBMISSION_MAX_RETRIES = int(
+    os.getenv("SNAKEMAKE_SUBMISSION_MAX_RETRIES", "5")
+)
+"""Number of times a job submission is retried when job-controller rejects it.
+
+Only submissions refused with 429 or 503 responses, or that could not connect to
+job-controller, are retried, as others may have created the job already.
+"""
+
+SNAKEMAKE_MAX_JOBS_PER_SWEEP = int(os.getenv("SNAKEMAKE_MAX_JOBS_PER_SWEEP", "0"))
+"""Maximum number of active jobs checked by each job status sweep, 0 for all.
+
+The jobs that have waited for the longest are checked first, so that sweeps go
+through all the active jobs in turn.
+"""
+
+JOB_CONTROLLER_POOL_SIZE = int(
+    os.getenv(
+        "JOB_CONTROLLER_POOL_SIZE",
+        str(SNAKEMAKE_MAX_STATUS_CHECK_WORKERS + SNAKEMAKE_MAX_SUBMISSION_WORKERS),
+    )
+)
+"""Maximum number of keep-alive connections kept open to job-controller.
+
+Defaults to the maximum number of concurrent requests sent by the engine, as
+job statuses are checked while jobs are submitted, so that requests do not
+wait for connections held by the other thread pool.
+"""
+
+JOB_CONTROLLER_CONNECT_TIMEOUT_IN_SECONDS = float(
+    os.getenv("JOB_CONTROLLER_CONNECT_TIMEOUT_IN_SECONDS", "10")
+)
+"""Maximum time to wait for a connection to job-controller to be established."""
+
+JOB_CONTROLLER_READ_TIMEOUT_IN_SECONDS = float(
+    os.getenv("JOB_CONTROLLER_READ_TIMEOUT_IN_SECONDS", "60")
+)
+"""Maximum time to wait for job-controller to answer a request.
+
+Job submissions are not limited, as job-controller may still create a job
+whose submission timed out.
+"""
+
+SNAKEMAKE_JOB_CACHE_DIR = os.getenv("SNAKEMAKE_JOB_CACHE_DIR", "")
+"""Directory shared by workflow runs caching job results, empty to disable it.
+
+Jobs of rules opting in with the ``job_cache=1`` resource, with the same
+container image, command, resources, input file contents and dependencies as a
+cached job get their outputs restored from the cache instead of running. Their
+dependencies are the workspace files named in their command and their software
+environment file, other files they read have to be declared as inputs. Their
+container images have to be pinned by digest. Every user has their own cache.
+"""
+
+SNAKEMAKE_JOB_CACHE_MAX_SIZE_IN_MB = int(
+    os.getenv("SNAKEMAKE_JOB_CACHE_MAX_SIZE_IN_MB", "10240")
+)
+"""Size over which the least recently used job results are evicted from the cache."""
+
+SNAKEMAKE_JOB_CACHE_LINK_MODE = os.getenv("SNAKEMAKE_JOB_CACHE_LINK_MODE", "reflink")
+"""How job results are shared between the cache and the workspaces.
+
+One of ``reflink`` or ``copy``. Files are copied when reflinks are not supported,
+e.g. when the cache is on another file system.
+"""
+
+SNAKEMAKE_STARTUP_CACHE = bool(strtobool(os.getenv("SNAKEMAKE_STARTUP_CACHE", "false")))
+"""Whether to cache parsed Snakefiles and skip runs of unchanged workspaces.
+
+A run is skipped when the requested Snakefile and its includes, the workflow
+parameters, the engine configuration such as the default container image, the
+config files, the input and output files of the jobs and the names of the files
+next to them did not change since the last successful run. Other workspace
+files are not checked.
+Can be overridden with the ``startup_cache`` operational option.
+"""
+
+SNAKEMAKE_STARTUP_CACHE_DIR = os.getenv(
+    "SNAKEMAKE_STARTUP_CACHE_DIR", ".snakemake/reana/startup-cache"
+)
+"""Directory of the startup cache, relative to the workspace unless absolute."""
+
+SNAKEMAKE_FILE_STATUS_PREFETCH = bool(
+    strtobool(os.getenv("SNAKEMAKE_FILE_STATUS_PREFETCH", "false"))
+)
+"""Whether to read the status of all workspace files in parallel up front.
+
+Speeds up building the DAG of workflows with many files on network file systems,
+where Snakemake would otherwise check the files one by one. Can be overridden
+with the ``file_status_prefetch`` operational option.
+"""
+
+SNAKEMAKE_FILE_STATUS_THREADS = int(os.getenv("SNAKEMAKE_FILE_STATUS_THREADS", "16"))
+"""Number of threads reading the status of workspace files when prefetching."""
+
+SNAKEMAKE_CRITICAL_PATH_PRIORITY = bool(
+    strtobool(os.getenv("SNAKEMAKE_CRITICAL_PATH_PRIORITY", "false"))
+)
+"""Whether to run first the jobs with the longest estimated path to the end.
+
+The path of a job is estimated with the runtimes of the rules observed by the
+previous runs of the workflow, and estimated again as the jobs of the run end.
+Jobs keep the priority of their rule, the path only orders jobs of the same
+priority. Can be overridden with the ``critical_path_priority`` operational
+option.
+"""
+
+SNAKEMAKE_CRITICAL_PATH_UPDATE_INTERVAL_IN_SECONDS = float(
+    os.getenv("SNAKEMAKE_CRITICAL_PATH_UPDATE_INTERVAL_IN_SECONDS", "30")
+)
+"""Minimum time between two estimations of the paths as runtimes are observed.
+
+Estimating the paths goes over the whole DAG, so that estimations are also
+apart by at least ten times the duration of the last one.
+"""
+
+SNAKEMAKE_RULE_RUNTIMES_DIR = os.getenv("SNAKEMAKE_RULE_RUNTIMES_DIR", "")
+"""Directory keeping the observed runtimes of the rules between workflow runs.
+
+Every REANA run starts in a new workspace, so that it has to be a volume mounted
+by all the workflow engines. Defaults to the ``rule-runtimes`` directory of the
+job result cache if enabled, otherwise to the workspace, where runtimes are only
+kept for the restarts of the workflow. Runtimes are kept per user, Snakefile and
+rules of the workflows.
+"""
+
+SNAKEMAKE_MEMORY_PROFILE_INTERVAL_IN_SECONDS = float(
+    os.getenv("SNAKEMAKE_MEMORY_PROFILE_INTERVAL_IN_SECONDS", "0")
+)
+"""Seconds between two snapshots of the memory allocations of the engine.
+
+The lines of code holding the most memory are written to
+``SNAKEMAKE_MEMORY_PROFILE_DIR`` at each snapshot. Tracing allocations slows
+the engine down, so memory is not profiled if the interval is 0. Can be
+overridden with the ``memory_profile_interval`` operational option.
+"""
+
+SNAKEMAKE_MEMORY_PROFILE_DIR = os.getenv(
+    "SNAKEMAKE_MEMORY_PROFILE_DIR", ".snakemake/reana/memory"
+)
+"""Directory, relative to the workspace, of the snapshots of the memory profile."""
+
+SNAKEMAKE_MEMORY_PROFILE_TOP = int(os.getenv("SNAKEMAKE_MEMORY_PROFILE_TOP", "25"))
+"""Number of lines of code allocating the most memory listed in each snapshot."""
+
+SNAKEMAKE_MEMORY_PROFILE_FRAMES = int(os.getenv("SNAKEMAKE_MEMORY_PROFILE_FRAMES", "1"))
+"""Number of frames kept for each allocation, to find where it comes from."""
+
+SNAKEMAKE_RELEASE_FINISHED_JOBS = bool(
+    strtobool(os.getenv("SNAKEMAKE_RELEASE_FINISHED_JOBS", "true"))
+)
+"""Whether to drop the parameters, resources and logs of the finished jobs.
+
+Snakemake keeps them for all the jobs of the workflow until the end of the run,
+which adds up on workflows with many jobs. They are expanded again if needed,
+e.g. to generate the report, so rules whose parameters are expensive to compute
+may be better off keeping them.
+"""
+
+SNAKEMAKE_CHECKPOINT_FILE_CACHE = bool(
+    strtobool(os.getenv("SNAKEMAKE_CHECKPOINT_FILE_CACHE", "true"))
+)
+"""Whether to cache the status of the files while the DAG is updated after checkpoints.
+
+Snakemake checks again the files of all the jobs of the DAG once a checkpoint is
+finished. With the cache, each file is checked at most once per update, and not
+at all if the status of the workspace files is prefetched.
+"""
+
+SNAKEMAKE_MAX_LOGGED_COMMAND_LENGTH = int(
+    os.getenv("SNAKEMAKE_MAX_LOGGED_COMMAND_LENGTH", "1000")
+)
+"""Maximum number of characters of the job commands written to the logs.
+
+Longer commands are truncated, 0 logs them in full. The commands submitted to
+job-controller are never truncated.
+"""
+
+SNAKEMAKE_METRICS_PORT = int(os.getenv("SNAKEMAKE_METRICS_PORT", "0"))
+"""Port serving the executor metrics in the Prometheus format, if not ``0``."""
+
+SNAKEMAKE_METRICS_SUMMARY_FILE = os.getenv(
+    "SNAKEMAKE_METRICS_SUMMARY_FILE", ".snakemake/reana/metrics.json"
+)
+"""Path, relative to the workspace, of the JSON summary of the executor metrics.
+
+The summary is written at the end of the workflow run, unless the path is empty.
+"""
+
+SNAKEMAKE_TRACE_FILE = os.getenv("SNAKEMAKE_TRACE_FILE", "")
+"""Path, relative to the workspace, of the trace of the lifecycle of the jobs.
+
+The trace is written at the end of the workflow run in the Chrome trace event
+format, which can be opened with Perfetto, together with a summary of the
+critical path of the run in a ``.summary.json`` file next to it. Jobs are not
+traced if the path is empty.
+"""
 
 
 # defined in reana-db component, in reana_db/models.py file as JobStatus
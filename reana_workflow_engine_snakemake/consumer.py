@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake job status consumer."""
+
+import json
+import logging
+import threading
+import time
+from typing import Callable, Container, Dict, Tuple
+
+from kombu import Exchange, Queue
+from reana_commons.config import MQ_DEFAULT_EXCHANGE
+from reana_commons.consumer import BaseConsumer
+
+from reana_workflow_engine_snakemake.config import LOGGING_MODULE
+
+log = logging.getLogger(LOGGING_MODULE)
+
+
+def get_job_status_queue(queue: str, workflow_uuid: str) -> str:
+    """Get the queue, and routing key, of the job status events of a workflow."""
+    return f"{queue}.{workflow_uuid}"
+
+
+class JobStatusConsumer(BaseConsumer):
+    """Consume job status events of the workflow jobs from the message queue.
+
+    Every workflow consumes its own queue, see ``get_job_status_queue``, so
+    that workflows running at the same time do not take each other's events.
+    Messages are expected to be JSON objects with ``job_id`` and ``status``
+    fields, and optionally a ``workflow_uuid`` field. Messages about jobs of
+    other workflows were routed to the wrong queue, and are rejected.
+    """
+
+    def __init__(
+        self,
+        queue: str,
+        workflow_uuid: str,
+        on_job_status: Callable[[str, str], None],
+        connection=None,
+    ):
+        """Initialise the JobStatusConsumer class.
+
+        :param queue: Prefix of the queues where job status events are published.
+        :param workflow_uuid: UUID of the workflow whose jobs are followed.
+        :param on_job_status: Function called with the job id and the status
+            of every received job status event.
+        :param connection: A class:`kombu.Connection`, if not provided a
+            class:`kombu.Connection` with the default configuration will
+            be instantiated.
+        """
+        exchange = Exchange(MQ_DEFAULT_EXCHANGE, type="direct")
+        workflow_queue = get_job_status_queue(queue, workflow_uuid)
+        super().__init__(
+            queue=Queue(
+                workflow_queue,
+                exchange=exchange,
+                routing_key=workflow_queue,
+                durable=False,
+            ),
+            connection=connection,
+        )
+        self.workflow_uuid = workflow_uuid
+        self.on_job_status = on_job_status
+        self._thread = None
+
+    def get_consumers(self, Consumer, channel):
+        """Map the job status queue to the message handler."""
+        return [
+            Consumer(
+                queues=[self.queue],
+                callbacks=[self.on_message],
+                accept=[self.message_default_format],
+            )
+        ]
+
+    def on_message(self, body, message):
+        """Forward job status events to the executor."""
+        try:
+            msg = json.loads(body) if isinstance(body, (str, bytes)) else body
+            if msg.get("workflow_uuid", self.workflow_uuid) != self.workflow_uuid:
+                log.warning(f"Rejecting job status event of another workflow: {body}")
+                message.reject()
+                return
+            self.on_job_status(str(msg["job_id"]), msg["status"])
+        except Exception as exception:
+            log.error(f"Could not process job status event {body}: {exception}")
+        message.ack()
+
+    def start(self) -> None:
+        """Start consuming job status events in a background thread."""
+        self._thread = threading.Thread(
+            target=self.run, name="reana-job-status-consumer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop consuming job status events."""
+        self.should_stop = True
+        if self._thread:
+            self._thread.join()
+
+
+class JobStatusEvents:
+    """Job status events waiting for the executor to handle their jobs.
+
+    Events can arrive before the submission of their job returns, so that the
+    events of unknown jobs are kept while jobs are being submitted, for at most
+    ``max_age`` seconds. Otherwise, they are about jobs already detected as
+    done, e.g. duplicated events, and are dropped.
+
+    Events are not thread-safe, callers have to hold the executor lock.
+    """
+
+    def __init__(self, max_age: float):
+        """Initialise the job status events."""
+        self.max_age = max_age
+        # job id -> (status, monotonic time the event was received)
+        self._events: Dict[str, Tuple[str, float]] = {}
+
+    def __len__(self) -> int:
+        """Get the number of events waiting."""
+        return len(self._events)
+
+    def add(self, job_id: str, status: str) -> None:
+        """Keep the last status event of a job."""
+        self._events[job_id] = (status, time.monotonic())
+
+    def pop(self, active_job_ids: Container[str], submitting: bool) -> Dict[str, str]:
+        """Take the statuses of the active jobs, dropping the stale events.
+
+        :param active_job_ids: Job ids of the jobs followed by the executor.
+        :param submitting: Whether jobs are being submitted, whose ids are not
+            known yet.
+        """
+        now = time.monotonic()
+        statuses = {}
+        for job_id, (status, received_at) in list(self._events.items()):
+            if job_id in active_job_ids:
+                statuses[job_id] = status
+            elif submitting and now - received_at < self.max_age:
+                continue
+            del self._events[job_id]
+        return statuses
@@ -11,43 +11,487 @@
 import os
 import logging
 import asyncio
+import multiprocessing
+import shlex
+import sys
+import threading
+import time
+import uuid
 from collections import namedtuple
-from typing import Callable
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
 
 from bravado.exception import HTTPNotFound
 from reana_commons.config import REANA_DEFAULT_SNAKEMAKE_ENV_IMAGE
-from reana_commons.utils import build_progress_message
 from snakemake import snakemake
+from snakemake import io as snakemake_io  # for monkeypatch
+from snakemake import workflow as snakemake_workflow  # for monkeypatch
 from snakemake.common import async_lock
-from snakemake.executors import ClusterExecutor, GenericClusterExecutor
-from snakemake.jobs import Job
+from snakemake.exceptions import WorkflowError
+from snakemake.executors import ClusterExecutor, CPUExecutor, GenericClusterExecutor
+from snakemake.jobs import GroupJob, Job
+from snakemake.report import auto_report
 from snakemake.resources import DefaultResources
+from snakemake.sourcecache import LocalSourceFile
 from snakemake import scheduler  # for monkeypatch
 
 from reana_workflow_engine_snakemake.config import (
     DEFAULT_SNAKEMAKE_REPORT_FILENAME,
     LOGGING_MODULE,
     MOUNT_CVMFS,
+    SNAKEMAKE_LOCAL_RUN_JOBS,
+    SNAKEMAKE_MAX_JOBS_PER_COMPUTE_BACKEND,
+    SNAKEMAKE_MAX_JOBS_PER_SWEEP,
+    SNAKEMAKE_MAX_LOCAL_JOBS,
+    SNAKEMAKE_MAX_LOGGED_COMMAND_LENGTH,
     SNAKEMAKE_MAX_PARALLEL_JOBS,
+    SNAKEMAKE_MEMORY_PROFILE_DIR,
+    SNAKEMAKE_MEMORY_PROFILE_FRAMES,
+    SNAKEMAKE_MEMORY_PROFILE_INTERVAL_IN_SECONDS,
+    SNAKEMAKE_MEMORY_PROFILE_TOP,
+    SNAKEMAKE_MAX_STATUS_CHECK_WORKERS,
+    SNAKEMAKE_MAX_SUBMISSION_WORKERS,
+    SNAKEMAKE_METRICS_PORT,
+    SNAKEMAKE_METRICS_SUMMARY_FILE,
+    SNAKEMAKE_SUBMISSION_BATCH_SIZE,
+    SNAKEMAKE_SUBMISSION_LATENCY_TARGET_IN_SECONDS,
+    SNAKEMAKE_SUBMISSION_MAX_DELAY_IN_SECONDS,
+    SNAKEMAKE_SUBMISSION_MAX_RETRIES,
+    SNAKEMAKE_TRACE_FILE,
+    SNAKEMAKE_BATCH_SUBMISSION,
+    SNAKEMAKE_CHECKPOINT_FILE_CACHE,
+    SNAKEMAKE_CRITICAL_PATH_PRIORITY,
+    SNAKEMAKE_CRITICAL_PATH_UPDATE_INTERVAL_IN_SECONDS,
+    SNAKEMAKE_BULK_STATUS_CHECK,
+    SNAKEMAKE_JOB_CACHE_DIR,
+    SNAKEMAKE_JOB_CACHE_LINK_MODE,
+    SNAKEMAKE_JOB_CACHE_MAX_SIZE_IN_MB,
+    SNAKEMAKE_JOB_BUNDLE_MAX_RUNTIME_IN_MINUTES,
+    SNAKEMAKE_JOB_BUNDLE_PARALLEL,
+    SNAKEMAKE_JOB_BUNDLE_SIZE,
+    SNAKEMAKE_JOB_STATUS_EVENTS_MAX_AGE_IN_SECONDS,
+    SNAKEMAKE_JOB_STATUS_QUEUE,
+    SNAKEMAKE_PROGRESS_MAX_DELAY_IN_SECONDS,
+    SNAKEMAKE_PROGRESS_MAX_EVENTS,
+    SNAKEMAKE_REPORT_MODE,
+    SNAKEMAKE_REPORT_MODES,
+    SNAKEMAKE_REPORT_TIMEOUT_IN_SECONDS,
+    SNAKEMAKE_RESUME,
+    SNAKEMAKE_RELEASE_FINISHED_JOBS,
+    SNAKEMAKE_RULE_RUNTIMES_DIR,
+    SNAKEMAKE_FILE_STATUS_PREFETCH,
+    SNAKEMAKE_FILE_STATUS_THREADS,
+    SNAKEMAKE_STARTUP_CACHE,
+    SNAKEMAKE_STARTUP_CACHE_DIR,
+    POLL_JOBS_STATUS_BACKOFF_FACTOR,
+    POLL_JOBS_STATUS_EVENTS_SLEEP_IN_SECONDS,
+    POLL_JOBS_STATUS_MIN_SLEEP_IN_SECONDS,
     POLL_JOBS_STATUS_SLEEP_IN_SECONDS,
     WORKFLOW_KERBEROS,
     JobStatus,
     RunStatus,
 )
+from reana_workflow_engine_snakemake.bundling import (
+    TIME_LIMIT_FIELDS,
+    JobBundle,
+    get_bundle_key,
+    sum_time_limits,
+)
+from reana_workflow_engine_snakemake.cache import JobResultCache, get_relative_path
+from reana_workflow_engine_snakemake.consumer import (
+    JobStatusConsumer,
+    JobStatusEvents,
+)
+from reana_workflow_engine_snakemake.file_status import WorkspaceSnapshot
+from reana_workflow_engine_snakemake.http_client import (
+    configure_http_client,
+    log_http_client_stats,
+)
+from reana_workflow_engine_snakemake.job_table import ActiveJob, JobTable
+from reana_workflow_engine_snakemake.memory import MemoryProfiler
+from reana_workflow_engine_snakemake.metrics import (
+    ACTIVE_JOBS,
+    CHECKPOINT_UPDATE_DURATION,
+    DETECTION_LAG,
+    JOB_CACHE_HITS,
+    JOB_CACHE_MISSES,
+    JOB_LIST_LATENCY,
+    JOBS_FAILED,
+    JOBS_FINISHED,
+    JOBS_SUBMITTED,
+    POLL_SWEEP_DURATION,
+    REPORT_DURATION,
+    STATUS_CHECK_LATENCY,
+    SUBMIT_LATENCY,
+    TimedPublisher,
+    metrics,
+)
+from reana_workflow_engine_snakemake.polling import AdaptivePollScheduler
+from reana_workflow_engine_snakemake.progress import JobProgressAggregator
+from reana_workflow_engine_snakemake.resume import prepare_resume
+from reana_workflow_engine_snakemake.runtimes import (
+    RuleRuntimes,
+    get_remaining_paths,
+    get_runtimes_file,
+)
+from reana_workflow_engine_snakemake.startup_cache import StartupCache
+from reana_workflow_engine_snakemake.throttling import (
+    SubmissionThrottle,
+    is_overload_error,
+    is_retriable_error,
+    parse_limits,
+)
+from reana_workflow_engine_snakemake.tracing import JobTracer
 from reana_workflow_engine_snakemake.utils import (
-    publish_job_submission,
+    get_workspace_user,
     publish_workflow_start,
+    truncate_command,
 )
 
 log = logging.getLogger(LOGGING_MODULE)
 
 
-REANAClusterJob = namedtuple("REANAClusterJob", "job callback error_callback")
+JobSubmission = namedtuple(
+    "JobSubmission",
+    "job job_request_body callback error_callback attempt",
+    defaults=(0,),
+)
 
 
 class REANAClusterExecutor(GenericClusterExecutor):
     """REANA Cluster Snakemake executor implementation."""
 
+    # job-controller ids of the jobs still running from an interrupted run
+    resumable_job_ids = set()
+    # whether the run was skipped, as nothing changed since the last one
+    workflow_up_to_date = False
+    # status of the workspace files, if prefetched
+    workspace_snapshot = None
+    # directory of the rule runtimes, if jobs are prioritised by their critical path
+    rule_runtimes_dir = None
+    # runtimes of the rules of the workflow, if jobs are prioritised
+    rule_runtimes = None
+
+    def __init__(self, *args, **kwargs):
+        """Initialise the executor and its pools of job submitters and checkers."""
+        # The executor state has to exist before calling the parent constructor,
+        # as the latter starts the thread running `_wait_for_jobs`.
+        self._status_check_pool = ThreadPoolExecutor(
+            max_workers=SNAKEMAKE_MAX_STATUS_CHECK_WORKERS,
+            thread_name_prefix="reana-job-status",
+        )
+        self._submission_pool = ThreadPoolExecutor(
+            max_workers=SNAKEMAKE_MAX_SUBMISSION_WORKERS,
+            thread_name_prefix="reana-job-submission",
+        )
+        self._pending_submissions = None
+        self._throttle = SubmissionThrottle(
+            dispatch=lambda submission: self._submission_pool.submit(
+                self._submit_job, submission
+            ),
+            backend_limits=parse_limits(SNAKEMAKE_MAX_JOBS_PER_COMPUTE_BACKEND),
+            latency_target=SNAKEMAKE_SUBMISSION_LATENCY_TARGET_IN_SECONDS,
+            max_delay=SNAKEMAKE_SUBMISSION_MAX_DELAY_IN_SECONDS,
+        )
+        self._job_cache = None
+        if SNAKEMAKE_JOB_CACHE_DIR:
+            # users do not share results, which they could tamper with
+            self._job_cache = JobResultCache(
+                os.path.join(
+                    SNAKEMAKE_JOB_CACHE_DIR,
+                    "users",
+                    get_workspace_user(os.getenv("workflow_workspace", "default"))
+                    or "unknown-user",
+                ),
+                max_size=SNAKEMAKE_JOB_CACHE_MAX_SIZE_IN_MB * 1024**2,
+                link_mode=SNAKEMAKE_JOB_CACHE_LINK_MODE,
+            )
+        # stores job results in the cache without blocking the scheduler
+        self._cache_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="reana-job-cache"
+        )
+        self._batch_submission = SNAKEMAKE_BATCH_SUBMISSION and hasattr(
+            self.rjc_api_client, "submit_batch"
+        )
+        if SNAKEMAKE_BATCH_SUBMISSION and not self._batch_submission:
+            log.warning(
+                "Batch job submission is not supported by the job-controller "
+                "client, submitting jobs one by one."
+            )
+        self._bulk_status_check = SNAKEMAKE_BULK_STATUS_CHECK
+        self._job_table = JobTable()
+        self._job_status_events = JobStatusEvents(
+            max_age=SNAKEMAKE_JOB_STATUS_EVENTS_MAX_AGE_IN_SECONDS
+        )
+        # submissions whose job-controller ids are not known yet
+        self._submissions_in_flight = 0
+        self._tracer = JobTracer(enabled=bool(SNAKEMAKE_TRACE_FILE))
+        # estimated runtime of the longest path from each job to the end
+        self._remaining_paths = {}
+        # whether runtime estimates changed since the paths were estimated
+        self._remaining_paths_outdated = False
+        # monotonic time before which the paths are not estimated again
+        self._next_path_estimation = 0.0
+        # job-controller ids and job cache keys of the jobs not finished yet,
+        # kept here rather than on the jobs, which the DAG keeps until the end
+        self._job_ids: Dict = {}
+        self._cache_keys: Dict = {}
+        self._job_status_consumer = None
+        self._total_jobs = None
+        self._dag_updated = False
+        self._progress = JobProgressAggregator(
+            self.publisher,
+            workflow_uuid=os.getenv("workflow_uuid", "default"),
+            max_events=SNAKEMAKE_PROGRESS_MAX_EVENTS,
+            max_delay=SNAKEMAKE_PROGRESS_MAX_DELAY_IN_SECONDS,
+        )
+        if SNAKEMAKE_JOB_STATUS_QUEUE:
+            # Job status events make frequent polling unnecessary, job-controller
+            # is only polled to catch jobs whose events were lost.
+            self._poll_scheduler = AdaptivePollScheduler(
+                min_interval=POLL_JOBS_STATUS_EVENTS_SLEEP_IN_SECONDS,
+                max_interval=POLL_JOBS_STATUS_EVENTS_SLEEP_IN_SECONDS,
+            )
+        else:
+            self._poll_scheduler = AdaptivePollScheduler(
+                min_interval=POLL_JOBS_STATUS_MIN_SLEEP_IN_SECONDS,
+                max_interval=POLL_JOBS_STATUS_SLEEP_IN_SECONDS,
+                backoff_factor=POLL_JOBS_STATUS_BACKOFF_FACTOR,
+            )
+        super().__init__(*args, **kwargs)
+        # runs the jobs that are not worth submitting to job-controller
+        self._local_executor = CPUExecutor(
+            self.workflow,
+            self.dag,
+            SNAKEMAKE_MAX_LOCAL_JOBS,
+            printreason=self.printreason,
+            quiet=self.quiet,
+            printshellcmds=self.printshellcmds,
+        )
+        # keep the DAG of the workflow run to generate the report afterwards
+        REANAClusterExecutor.workflow_dag = self.dag
+        # jobs of rules not running anything, left out of the progress totals
+        self._norun_jobs = {job for job in self.dag.jobs if job.rule.norun}
+        finish, cache_job = self.dag.finish, self.dag.cache_job
+
+        def _finish(job, *args, **kwargs):
+            return self._finish_job(finish, job, *args, **kwargs)
+
+        def _cache_job(job):
+            # every job added to the DAG, e.g. by checkpoints, is cached
+            cache_job(job)
+            if job.rule.norun:
+                self._norun_jobs.add(job)
+
+        self.dag.finish = _finish
+        self.dag.cache_job = _cache_job
+        if self.rule_runtimes_dir:
+            workflow_workspace = os.getenv("workflow_workspace", "default")
+            REANAClusterExecutor.rule_runtimes = RuleRuntimes(
+                get_runtimes_file(
+                    self.rule_runtimes_dir,
+                    get_workspace_user(workflow_workspace),
+                    os.path.relpath(self.workflow.main_snakefile, workflow_workspace),
+                    (rule.name for rule in self.workflow.rules),
+                )
+            )
+            update_priority = self.dag.update_priority
+
+            def _update_priority():
+                update_priority()
+                self._prioritise_critical_path()
+
+            # priorities are computed again when checkpoints change the DAG
+            self.dag.update_priority = _update_priority
+            self._prioritise_critical_path()
+
+        if SNAKEMAKE_JOB_STATUS_QUEUE:
+            self._job_status_consumer = JobStatusConsumer(
+                queue=SNAKEMAKE_JOB_STATUS_QUEUE,
+                workflow_uuid=os.getenv("workflow_uuid", "default"),
+                on_job_status=self._on_job_status_event,
+            )
+            self._job_status_consumer.start()
+
+    def _prioritise_critical_path(self) -> None:
+        """Give priority to the jobs with the longest estimated path to the end.
+
+        Snakemake selects the ready jobs with the highest priority first. The
+        remaining path of the jobs is added to their priority as a fraction, so
+        that it only orders jobs whose rules have the same priority.
+        """
+        dag = self.dag
+        start = time.monotonic()
+        self._remaining_paths_outdated = False
+        self._remaining_paths = get_remaining_paths(
+            dag.toposorted(list(dag.needrun_jobs())),
+            lambda job: dag.depending[job],
+            lambda job: self.rule_runtimes.estimate(job.rule.name),
+        )
+        now = time.monotonic()
+        self._next_path_estimation = now + max(
+            SNAKEMAKE_CRITICAL_PATH_UPDATE_INTERVAL_IN_SECONDS, 10 * (now - start)
+        )
+        longest = max(self._remaining_paths.values(), default=0.0)
+        if longest <= 0:
+            # e.g. all the known rules take no time, nothing to order jobs by
+            return
+        for job, remaining in self._remaining_paths.items():
+            if dag.priority(job) != Job.HIGHEST_PRIORITY:
+                dag._priority[job] = job.rule.priority + remaining / (2 * longest)
+
+    def _finish_job(self, finish: Callable, job: Job, *args, **kwargs) -> bool:
+        """Let Snakemake finish a job, timing the DAG update after checkpoints.
+
+        Snakemake updates the DAG once a checkpoint is finished, during which
+        no other job can be finished or scheduled.
+        """
+        if not job.is_checkpoint:
+            potential_new_ready_jobs = finish(job, *args, **kwargs)
+        else:
+            start = time.monotonic()
+            with self._cache_file_status():
+                potential_new_ready_jobs = finish(job, *args, **kwargs)
+            duration = time.monotonic() - start
+            CHECKPOINT_UPDATE_DURATION.observe(duration)
+            log.info(
+                f"DAG updated after checkpoint '{job.name}' in {duration:.2f}s, "
+                f"{len(self.dag)} jobs."
+            )
+        if SNAKEMAKE_RELEASE_FINISHED_JOBS:
+            self._release_job(job)
+        if (
+            self._remaining_paths_outdated
+            and time.monotonic() >= self._next_path_estimation
+        ):
+            # the ready jobs are selected once the finished jobs are handled
+            self._prioritise_critical_path()
+        return potential_new_ready_jobs
+
+    @contextmanager
+    def _cache_file_status(self):
+        """Cache the status of the files while Snakemake updates the DAG.
+
+        Snakemake only uses its IO cache while the DAG is first built, so that
+        the files of all the jobs are otherwise checked one by one at every
+        update. The cache is filled from the workspace snapshot, if any.
+        """
+        iocache = self.workflow.iocache
+        if not SNAKEMAKE_CHECKPOINT_FILE_CACHE or iocache.active:
+            yield
+            return
+        inventories = (
+            iocache.exists_local.has_inventory,
+            iocache.exists_remote.has_inventory,
+        )
+        # Snakemake keeps the directories it listed, whose files have changed
+        # since, and would take the files missing from them for absent ones
+        for inventory in inventories:
+            inventory.clear()
+        iocache.clear()
+        iocache.active = True
+        try:
+            if self.workspace_snapshot:
+                self.workspace_snapshot.refresh()
+                self.workspace_snapshot.fill_iocache(iocache)
+            yield
+        finally:
+            iocache.deactivate()
+            for inventory in inventories:
+                inventory.clear()
+
+    def _count_jobs(self) -> int:
+        """Count the jobs of the workflow DAG, leaving out the ones not running code.
+
+        Snakemake keeps the number of jobs of the DAG up to date, so that only
+        the jobs of rules not running anything are counted here.
+        """
+        dag = self.dag
+        self._norun_jobs = {job for job in self._norun_jobs if job in dag.dependencies}
+        return len(dag) - sum(
+            1 for job in self._norun_jobs if dag.needrun(job) or dag.finished(job)
+        )
+
+    def _release_job(self, job: Job) -> None:
+        """Drop the state of a finished job that is only needed while it runs.
+
+        Snakemake keeps all the jobs of the DAG until the end of the workflow
+        run, together with the parameters, resources and logs they were
+        expanded with. These are expanded again if they are needed later on,
+        e.g. by the report.
+        """
+        self._remaining_paths.pop(job, None)
+        for member in job if job.is_group() else [job]:
+            member._params = member._log = member._benchmark = None
+            member._resources = member._scheduler_resources = None
+
+    def _observe_runtime(self, active_job: ActiveJob) -> None:
+        """Record the runtime of a job, from its submission to its detected end."""
+        if not self.rule_runtimes or active_job.submitted_at is None:
+            return
+        job, runtime = active_job.job, time.monotonic() - active_job.submitted_at
+        changed = False
+        if isinstance(job, JobBundle):
+            for member in job.jobs:
+                changed |= self.rule_runtimes.observe(
+                    member.rule.name,
+                    runtime if job.parallel else runtime / len(job.jobs),
+                )
+        elif not job.is_group():
+            changed = self.rule_runtimes.observe(job.rule.name, runtime)
+        if changed:
+            # jobs are prioritised again by the scheduler, which owns the DAG
+            self._remaining_paths_outdated = True
+
+    def shutdown(self):
+        """Override shutdown method to also stop job submitters and checkers."""
+        self._submission_pool.shutdown(wait=True)
+        self._local_executor.shutdown()
+        self._cache_pool.shutdown(wait=True)
+        if self._throttle.overloads or self._throttle.max_queued:
+            log.info(
+                f"Job-controller was overloaded {self._throttle.overloads} times, "
+                f"up to {self._throttle.max_queued} jobs waited for a free slot."
+            )
+        if self._job_cache:
+            stats = self._job_cache.stats
+            log.info(
+                f"Job result cache: {stats['hits']} hits, {stats['misses']} misses, "
+                f"{stats['stores']} results stored, {stats['evictions']} evicted."
+            )
+        with self.lock:
+            self.wait = False
+        # do not wait for the next polling sweep to stop `_wait_for_jobs`
+        self._poll_scheduler.wake_up()
+        super().shutdown()
+        if self._job_status_consumer:
+            self._job_status_consumer.stop()
+        self._status_check_pool.shutdown(wait=True)
+        self._progress.close()
+        if self._tracer.enabled:
+            self._tracer.write(
+                os.path.join(
+                    os.getenv("workflow_workspace", "default"), SNAKEMAKE_TRACE_FILE
+                )
+            )
+        log.info(
+            f"Published {self._progress.messages} job progress messages for "
+            f"{self._progress.events} job updates, "
+            f"{self._progress.saved_messages} messages saved."
+        )
+        if CHECKPOINT_UPDATE_DURATION.count:
+            log.info(
+                f"Updated the DAG after {CHECKPOINT_UPDATE_DURATION.count} "
+                f"checkpoints in {CHECKPOINT_UPDATE_DURATION.sum:.1f}s, up to "
+                f"{CHECKPOINT_UPDATE_DURATION.max:.1f}s each."
+            )
+        log.info(
+            f"Detected {self._poll_scheduler.detected_jobs} finished jobs with up "
+            f"to {self._poll_scheduler.saved_latency:.1f}s less latency than "
+            f"polling every {self._poll_scheduler.max_interval}s."
+        )
+
     def run(
         self,
         job: Job,
@@ -56,64 +500,623 @@ class REANAClusterExecutor(GenericClusterExecutor):
         error_callback: Callable = None,
     ):
         """Override GenericClusterExecutor run method."""
+        self._trace_job(job)
+        job_id = self._get_resumable_job_id(job)
+        if job_id:
+            self._publish_workflow_start()
+            self._reattach_job(job, job_id, callback, error_callback)
+            return
+
+        if self._runs_locally(job):
+            self._publish_workflow_start()
+            self._run_locally(job, callback, error_callback)
+            return
+
         super()._run(job)
 
-        workflow_workspace = os.getenv("workflow_workspace", "default")
-        workflow_uuid = os.getenv("workflow_uuid", "default")
-        publish_workflow_start(
-            workflow_uuid=workflow_uuid, publisher=self.publisher, job=job
-        )
+        self._publish_workflow_start()
         try:
-            job.reana_job_id = None
-            log.info(f"Job '{job.name}' received, command: {job.shellcmd}")
-            container_image = self._get_container_image(job)
+            if job.is_group():
+                # Jobs of a Snakemake group run together in one REANA job
+                submission = JobSubmission(
+                    job, self._get_group_request_body(job), callback, error_callback
+                )
+                self._submit(submission)
+                return
+            log.info(
+                f"Job '{job.name}' received, command: "
+                f"{truncate_command(job.shellcmd, SNAKEMAKE_MAX_LOGGED_COMMAND_LENGTH)}"
+            )
             if job.is_shell:
                 # Shell command
-                job_request_body = {
-                    "workflow_uuid": workflow_uuid,
-                    "image": container_image,
-                    "cmd": f"cd {workflow_workspace} && {job.shellcmd}",
-                    "prettified_cmd": job.shellcmd,
-                    "workflow_workspace": workflow_workspace,
-                    "job_name": job.name,
-                    "cvmfs_mounts": MOUNT_CVMFS,
-                    "compute_backend": job.resources.get("compute_backend", ""),
-                    "kerberos": job.resources.get("kerberos", WORKFLOW_KERBEROS),
-                    "unpacked_img": job.resources.get("unpacked_img", False),
-                    "kubernetes_uid": job.resources.get("kubernetes_uid"),
-                    "kubernetes_memory_limit": job.resources.get(
-                        "kubernetes_memory_limit"
-                    ),
-                    "kubernetes_job_timeout": job.resources.get(
-                        "kubernetes_job_timeout"
-                    ),
-                    "voms_proxy": job.resources.get("voms_proxy", False),
-                    "rucio": job.resources.get("rucio", False),
-                    "htcondor_max_runtime": job.resources.get(
-                        "htcondor_max_runtime", ""
-                    ),
-                    "htcondor_accounting_group": job.resources.get(
-                        "htcondor_accounting_group", ""
-                    ),
-                    "slurm_partition": job.resources.get("slurm_partition"),
-                    "slurm_time": job.resources.get("slurm_time"),
-                }
-                job_id = submit_job(
-                    self.rjc_api_client, self.publisher, job_request_body
+                job_request_body = self._get_job_request_body(job)
+                submission = JobSubmission(
+                    job, job_request_body, callback, error_callback
                 )
-                job.reana_job_id = job_id
-                self.workflow.persistence.started(job, external_jobid=job.reana_job_id)
+                if self._is_cacheable(job, job_request_body):
+                    # input files are hashed without blocking the scheduler
+                    self._submission_pool.submit(self._submit_cacheable_job, submission)
+                    return
+                if self._pending_submissions is None:
+                    self._submit(submission)
+                else:
+                    self._pending_submissions.append(submission)
+                return
             elif job.is_run:
                 # Python code
                 log.error("Python code execution is not supported yet.")
 
         except Exception as excep:
             log.error(f"Error submitting job {job.name}: {excep}")
-            error_callback(job)
+        error_callback(job)
+
+    def _trace_job(self, job: Job) -> None:
+        """Start tracing the job, with the jobs it depends on."""
+        if not self._tracer.enabled:
             return
+        members = list(job) if job.is_group() else [job]
+        self._tracer.add_job(
+            job,
+            {
+                dependency
+                for member in members
+                for dependency in self.dag.dependencies[member]
+            },
+        )
+
+    def _get_resumable_job_id(self, job: Job) -> Optional[str]:
+        """Get the id of the job if it is still running from an interrupted run."""
+        if not self.resumable_job_ids:
+            return None
+        try:
+            job_id = self.dag.incomplete_external_jobid(job)
+        except WorkflowError:
+            # the outputs of the job were produced by different REANA jobs
+            return None
+        return job_id if job_id in self.resumable_job_ids else None
 
+    def _reattach_job(
+        self, job: Job, job_id: str, callback: Callable, error_callback: Callable
+    ) -> None:
+        """Follow a job still running from an interrupted run, without resubmitting it.
+
+        The outputs of the job are not prepared again, as it is still writing them.
+        The jobs of a bundle were all started with the job-controller id of the
+        bundle, so that the jobs sharing an id are followed as one bundle.
+        """
+        self.printjob(job)
+        log.info(f"Job '{job.name}' is still running in job-controller: {job_id}")
+        submission = JobSubmission(job, None, callback, error_callback)
         with self.lock:
-            self.active_jobs.append(REANAClusterJob(job, callback, error_callback))
+            active_job = self._job_table.get(job_id)
+            reattached = active_job is not None and isinstance(
+                active_job.job, JobBundle
+            )
+            if reattached:
+                active_job.job.submissions.append(submission)
+                self._job_ids[job] = job_id
+        if reattached:
+            self._tracer.record([job], "submitted", job_id=job_id)
+            self._progress.add(JobStatus.running, job_id)
+            return
+        bundle = JobBundle([submission], status_dir="")
+        self._job_submitted(
+            JobSubmission(
+                bundle, None, self._reattached_jobs_done, self._reattached_jobs_failed
+            ),
+            job_id,
+        )
+
+    @staticmethod
+    def _reattached_jobs_done(bundle: JobBundle) -> None:
+        """Report the success of the jobs followed again after an interruption.
+
+        The exit codes of the jobs of a bundle were kept by the interrupted
+        run, but its REANA job only finishes if all of them succeeded.
+        """
+        for submission in bundle.submissions:
+            submission.callback(submission.job)
+
+    @staticmethod
+    def _reattached_jobs_failed(bundle: JobBundle) -> None:
+        """Report the failure of the jobs followed again after an interruption."""
+        for submission in bundle.submissions:
+            submission.error_callback(submission.job)
+
+    def _get_cached_outputs(self, job: Job) -> Optional[List[str]]:
+        """Get the outputs of the job to cache, or `None` if it is not cached."""
+        if not self._job_cache or not job.resources.get("job_cache", False):
+            return None
+        workflow_workspace = os.getenv("workflow_workspace", "default")
+        outputs = [get_relative_path(f, workflow_workspace) for f in job.output]
+        # only outputs in the workspace can be restored in other workspaces
+        if not outputs or None in outputs:
+            return None
+        return outputs
+
+    def _is_cacheable(self, job: Job, job_request_body: Dict) -> bool:
+        """Check whether the results of the job can be taken from the cache.
+
+        Jobs opt in with the ``job_cache`` resource, and have to use container
+        images pinned by digest, as images behind tags can change.
+        """
+        if self._get_cached_outputs(job) is None:
+            return False
+        if "@sha256:" not in job_request_body["image"]:
+            log.warning(
+                f"Job '{job.name}' is not cached, as its container image "
+                f"{job_request_body['image']} is not pinned by digest."
+            )
+            return False
+        return True
+
+    @staticmethod
+    def _get_cache_dependencies(job: Job) -> List[str]:
+        """Get the files the job depends on besides its inputs.
+
+        These are the files of the workspace named in its command, e.g. the
+        scripts it runs, and its software environment file.
+        """
+        workflow_workspace = os.getenv("workflow_workspace", "default")
+        outputs = {os.path.normpath(output) for output in job.output}
+        try:
+            words = shlex.split(job.shellcmd)
+        except ValueError:
+            words = job.shellcmd.split()
+        dependencies = [
+            word
+            for word in dict.fromkeys(words)
+            if get_relative_path(word, workflow_workspace) is not None
+            and os.path.normpath(word) not in outputs
+            and os.path.isfile(os.path.join(workflow_workspace, word))
+        ]
+        conda_env_file = getattr(job.conda_env_spec, "file", None)
+        if isinstance(conda_env_file, LocalSourceFile):
+            dependencies.append(conda_env_file.get_path_or_uri())
+        return dependencies
+
+    def _submit_cacheable_job(self, submission: JobSubmission) -> None:
+        """Restore the outputs of the job from the cache, or submit it."""
+        job = submission.job
+        try:
+            if self._restore_from_cache(job, submission.job_request_body):
+                submission.callback(job)
+                return
+        except Exception as excep:
+            log.error(f"Error submitting job {job.name}: {excep}")
+            submission.error_callback(job)
+            return
+        self._submit(submission)
+
+    def _restore_from_cache(self, job: Job, job_request_body: Dict) -> bool:
+        """Restore the outputs of the job from the job result cache, if found there.
+
+        Otherwise, the cache key of the job is kept to cache its outputs once
+        the job is finished.
+        """
+        outputs = self._get_cached_outputs(job)
+        workflow_workspace = os.getenv("workflow_workspace", "default")
+        try:
+            key = self._job_cache.get_key(
+                job_request_body,
+                job.shellcmd,
+                job.input,
+                outputs,
+                workflow_workspace,
+                dependencies=self._get_cache_dependencies(job),
+            )
+        except OSError as exception:
+            log.warning(f"Could not look up job '{job.name}' in the cache: {exception}")
+            return False
+        if not self._job_cache.restore(key, outputs, workflow_workspace):
+            JOB_CACHE_MISSES.inc()
+            self._cache_keys[job] = key
+            return False
+        JOB_CACHE_HITS.inc()
+        # restored jobs have no job-controller id, but are counted like the others
+        self._job_ids[job] = None
+        log.info(f"Job '{job.name}' outputs restored from the job result cache.")
+        self._progress.add(JobStatus.running, None)
+        return True
+
+    def _runs_locally(self, job: Job) -> bool:
+        """Check whether the job has to run inside the workflow engine."""
+        if job.is_group():
+            return False
+        return bool(job.resources.get("local", False)) or (
+            job.is_run and SNAKEMAKE_LOCAL_RUN_JOBS
+        )
+
+    def _run_locally(
+        self, job: Job, callback: Callable, error_callback: Callable
+    ) -> None:
+        """Run the job inside the workflow engine, skipping job-controller."""
+        # local jobs have no job-controller id, but are counted like the others
+        self._job_ids[job] = None
+        log.info(f"Job '{job.name}' running in the workflow engine.")
+        self._progress.add(JobStatus.running, None)
+        self._local_executor.run(job, callback=callback, error_callback=error_callback)
+
+    def _get_group_request_body(self, job: GroupJob) -> Dict:
+        """Build the job-controller request running the jobs of a group in order.
+
+        The jobs of a group must have the same environment and resources, as
+        they run in the same REANA job, whose time limits are their sum.
+        """
+        jobs = list(job)
+        log.info(
+            f"Group '{job.name}' received, jobs: {', '.join(j.name for j in jobs)}"
+        )
+        if not all(j.is_shell for j in jobs):
+            raise ValueError("Only jobs with shell commands can be grouped.")
+        job_request_bodies = [self._get_job_request_body(j) for j in jobs]
+        settings = {
+            get_bundle_key(
+                {
+                    field: value
+                    for field, value in job_request_body.items()
+                    if field not in TIME_LIMIT_FIELDS
+                }
+            )
+            for job_request_body in job_request_bodies
+        }
+        if len(settings) > 1:
+            raise ValueError(
+                "Only jobs with the same environment and resources can be grouped."
+            )
+        job_request_body = {
+            **job_request_bodies[0],
+            **sum_time_limits(job_request_bodies),
+        }
+        job_request_body["cmd"] = " && ".join(
+            f"( {body['cmd']} )" for body in job_request_bodies
+        )
+        job_request_body["prettified_cmd"] = "\n".join(j.shellcmd for j in jobs)
+        job_request_body["job_name"] = job.name
+        return job_request_body
+
+    def _get_job_request_body(self, job: Job) -> Dict:
+        """Build the job-controller request to submit a shell job."""
+        workflow_workspace = os.getenv("workflow_workspace", "default")
+        workflow_uuid = os.getenv("workflow_uuid", "default")
+        container_image = self._get_container_image(job)
+        return {
+            "workflow_uuid": workflow_uuid,
+            "image": container_image,
+            "cmd": f"cd {workflow_workspace} && {job.shellcmd}",
+            "prettified_cmd": job.shellcmd,
+            "workflow_workspace": workflow_workspace,
+            "job_name": job.name,
+            "cvmfs_mounts": MOUNT_CVMFS,
+            "compute_backend": job.resources.get("compute_backend", ""),
+            "kerberos": job.resources.get("kerberos", WORKFLOW_KERBEROS),
+            "unpacked_img": job.resources.get("unpacked_img", False),
+            "kubernetes_uid": job.resources.get("kubernetes_uid"),
+            "kubernetes_memory_limit": job.resources.get("kubernetes_memory_limit"),
+            "kubernetes_job_timeout": job.resources.get("kubernetes_job_timeout"),
+            "voms_proxy": job.resources.get("voms_proxy", False),
+            "rucio": job.resources.get("rucio", False),
+            "htcondor_max_runtime": job.resources.get("htcondor_max_runtime", ""),
+            "htcondor_accounting_group": job.resources.get(
+                "htcondor_accounting_group", ""
+            ),
+            "slurm_partition": job.resources.get("slurm_partition"),
+            "slurm_time": job.resources.get("slurm_time"),
+        }
+
+    def run_jobs(
+        self,
+        jobs: List[Job],
+        callback: Callable = None,
+        submit_callback: Callable = None,
+        error_callback: Callable = None,
+    ):
+        """Override run_jobs method to submit the jobs that are ready in batches.
+
+        If job-controller does not support batch submission, the jobs are
+        submitted one by one.
+        """
+        self._pending_submissions = []
+        try:
+            super().run_jobs(
+                jobs,
+                callback=callback,
+                submit_callback=submit_callback,
+                error_callback=error_callback,
+            )
+        finally:
+            submissions, self._pending_submissions = self._pending_submissions, None
+            if self._remaining_paths:
+                # jobs on the critical path are submitted first
+                submissions.sort(
+                    key=lambda submission: self._remaining_paths.get(submission.job, 0),
+                    reverse=True,
+                )
+            submissions = [
+                submission
+                for submission in self._bundle_submissions(submissions)
+                if self._admit(submission)
+            ]
+            if self._batch_submission and len(submissions) > 1:
+                for i in range(0, len(submissions), SNAKEMAKE_SUBMISSION_BATCH_SIZE):
+                    self._submission_pool.submit(
+                        self._submit_job_batch,
+                        submissions[i : i + SNAKEMAKE_SUBMISSION_BATCH_SIZE],
+                    )
+            else:
+                for submission in submissions:
+                    self._submission_pool.submit(self._submit_job, submission)
+
+    def _bundle_submissions(
+        self, submissions: List[JobSubmission]
+    ) -> List[JobSubmission]:
+        """Bundle the submissions of jobs with the same job-controller settings.
+
+        Bundles are limited to the bundle size of the rule, and jobs run in
+        sequence are also limited by the sum of their ``runtime`` resources.
+        Jobs with a memory limit are run in sequence, as the bundle gets the
+        memory limit of one job. Bundles run in sequence get the sum of the time
+        limits of their jobs, jobs whose time limits cannot be added up are not
+        bundled then.
+        """
+        bundled = {}
+        result = []
+        for submission in submissions:
+            bundle_size = int(
+                submission.job.resources.get("bundle_size", SNAKEMAKE_JOB_BUNDLE_SIZE)
+            )
+            if bundle_size <= 1:
+                result.append(submission)
+                continue
+            key = (bundle_size, get_bundle_key(submission.job_request_body))
+            bundled.setdefault(key, []).append(submission)
+
+        for (bundle_size, _), members in bundled.items():
+            memory_limit = members[0].job_request_body.get("kubernetes_memory_limit")
+            parallel = SNAKEMAKE_JOB_BUNDLE_PARALLEL and not memory_limit
+            if not parallel:
+                try:
+                    # the jobs of a bundle have the same time limits
+                    sum_time_limits([members[0].job_request_body])
+                except ValueError as exception:
+                    log.debug(f"Not bundling jobs in sequence: {exception}")
+                    result.extend(members)
+                    continue
+            bundle, runtime = [], 0
+            for submission in members:
+                job_runtime = submission.job.resources.get("runtime", 0) or 0
+                if bundle and (
+                    len(bundle) >= bundle_size
+                    or not parallel
+                    and runtime + job_runtime
+                    > SNAKEMAKE_JOB_BUNDLE_MAX_RUNTIME_IN_MINUTES
+                ):
+                    result.append(self._get_bundle_submission(bundle, parallel))
+                    bundle, runtime = [], 0
+                bundle.append(submission)
+                runtime += job_runtime
+            result.append(self._get_bundle_submission(bundle, parallel))
+        return result
+
+    def _get_bundle_submission(
+        self, submissions: List[JobSubmission], parallel: bool
+    ) -> JobSubmission:
+        """Get the submission of a bundle of jobs, or of the only job given."""
+        if len(submissions) == 1:
+            return submissions[0]
+        workflow_workspace = os.getenv("workflow_workspace", "default")
+        bundle = JobBundle(
+            submissions,
+            # job ids are reused by the next runs of the workflow, whose
+            # bundles must not read the exit codes of earlier ones
+            status_dir=os.path.join(
+                workflow_workspace,
+                ".snakemake",
+                "reana",
+                "bundles",
+                f"{submissions[0].job.jobid}-{uuid.uuid4().hex}",
+            ),
+            parallel=parallel,
+        )
+        log.info(
+            f"Bundling {len(submissions)} jobs into one REANA job: "
+            f"{', '.join(str(job.jobid) for job in bundle.jobs)}"
+        )
+        job_request_body = bundle.get_request_body()
+        # the requests of the jobs are not needed anymore while the bundle runs
+        bundle.release_request_bodies()
+        return JobSubmission(
+            bundle, job_request_body, self._bundle_done, self._bundle_done
+        )
+
+    def _bundle_done(self, bundle: JobBundle) -> None:
+        """Report the result of each job of a bundle once the bundle is done."""
+        for submission, succeeded in zip(bundle.submissions, bundle.get_job_results()):
+            if succeeded:
+                submission.callback(submission.job)
+            else:
+                submission.error_callback(submission.job)
+
+    def _admit(self, submission: JobSubmission) -> bool:
+        """Check whether the job can be submitted now, otherwise queue it.
+
+        Queued jobs are submitted once jobs of the same compute backend or rule
+        are done. Group jobs are admitted for the rules of all their jobs.
+        """
+        job = submission.job
+        if isinstance(job, JobBundle):
+            jobs = job.jobs[:1]
+        elif job.is_group():
+            jobs = job.jobs
+        else:
+            jobs = [job]
+        rule_limits = {}
+        for member in jobs:
+            rule_limits[member.rule.name] = max(
+                rule_limits.get(member.rule.name, 0),
+                member.resources.get("max_running_jobs", 0),
+            )
+        return self._throttle.admit(
+            submission,
+            job,
+            submission.job_request_body.get("compute_backend", ""),
+            rule_limits,
+        )
+
+    def _submit(self, submission: JobSubmission) -> None:
+        """Submit the job in the submission thread pool, once it is admitted."""
+        if self._admit(submission):
+            self._submission_pool.submit(self._submit_job, submission)
+
+    def _submission_failed(self, submission: JobSubmission) -> None:
+        self._throttle.release(submission.job)
+        submission.error_callback(submission.job)
+
+    def _retry_submission(self, submission: JobSubmission, excep: Exception) -> bool:
+        """Submit the job again later if job-controller did not take it."""
+        if (
+            not is_retriable_error(excep)
+            or submission.attempt >= SNAKEMAKE_SUBMISSION_MAX_RETRIES
+        ):
+            return False
+        log.warning(
+            f"Job-controller is overloaded, submitting job {submission.job.name} "
+            f"again. Details: {excep}"
+        )
+        self._submission_pool.submit(
+            self._submit_job, submission._replace(attempt=submission.attempt + 1)
+        )
+        return True
+
+    @contextmanager
+    def _submitting(self, count: int = 1):
+        """Count the jobs being submitted, until they are in the job table."""
+        with self.lock:
+            self._submissions_in_flight += count
+        try:
+            yield
+        finally:
+            with self.lock:
+                self._submissions_in_flight -= count
+
+    def _submit_job(self, submission: JobSubmission) -> None:
+        """Submit a job to job-controller and start following its status.
+
+        This runs in the submission thread pool, so that jobs that are ready at
+        the same time are submitted concurrently. Submissions are slowed down
+        when job-controller is overloaded, and retried only when it rejected
+        them without creating the job.
+        """
+        self._throttle.wait()
+        with self._submitting():
+            start = time.monotonic()
+            try:
+                job_id = submit_job(self.rjc_api_client, submission.job_request_body)
+            except Exception as excep:
+                self._throttle.record_submission(
+                    time.monotonic() - start, overloaded=is_overload_error(excep)
+                )
+                if self._retry_submission(submission, excep):
+                    return
+                log.error(f"Error submitting job {submission.job.name}: {excep}")
+                self._submission_failed(submission)
+                return
+            self._throttle.record_submission(time.monotonic() - start)
+            self._job_submitted(submission, job_id)
+
+    def _submit_job_batch(self, submissions: List[JobSubmission]) -> None:
+        """Submit many jobs to job-controller in one request.
+
+        If job-controller does not support batch submission, disable it for the
+        rest of the workflow run and submit the jobs one by one instead.
+        """
+        self._throttle.wait()
+        with self._submitting(len(submissions)):
+            start = time.monotonic()
+            try:
+                job_ids = submit_job_batch(
+                    self.rjc_api_client,
+                    [submission.job_request_body for submission in submissions],
+                )
+            except (NotImplementedError, HTTPNotFound) as excep:
+                log.warning(
+                    "Batch job submission is not supported by job-controller, "
+                    f"submitting jobs one by one. Details: {excep}"
+                )
+                self._batch_submission = False
+                for submission in submissions:
+                    self._submission_pool.submit(self._submit_job, submission)
+                return
+            except Exception as excep:
+                # the latency of a batch is not comparable to the one of a job
+                self._throttle.record_submission(0, overloaded=is_overload_error(excep))
+                if is_retriable_error(excep):
+                    for submission in submissions:
+                        if not self._retry_submission(submission, excep):
+                            self._submission_failed(submission)
+                    return
+                log.error(f"Error submitting batch of {len(submissions)} jobs: {excep}")
+                for submission in submissions:
+                    self._submission_failed(submission)
+                return
+            self._throttle.record_submission(
+                (time.monotonic() - start) / max(len(submissions), 1)
+            )
+
+            for submission, job_id in zip(submissions, job_ids):
+                self._job_submitted(submission, job_id)
+
+    def _job_submitted(self, submission: JobSubmission, job_id: str) -> None:
+        """Start following the status of a submitted job."""
+        job = submission.job
+        jobs = job.jobs if isinstance(job, JobBundle) else [job]
+        try:
+            for j in jobs:
+                self._job_ids[j] = job_id
+                self.workflow.persistence.started(j, external_jobid=job_id)
+        except Exception as excep:
+            log.error(f"Error submitting job {job.name}: {excep}")
+            self._submission_failed(submission)
+            return
+
+        self._tracer.record(jobs, "submitted", job_id=job_id)
+        self._progress.add(
+            JobStatus.running,
+            job_id,
+            count=sum(len(j) if j.is_group() else 1 for j in jobs),
+        )
+        self._poll_scheduler.job_submitted(job_id, job.name)
+        with self.lock:
+            self._job_table.add(
+                job,
+                job_id,
+                submission.callback,
+                submission.error_callback,
+                # reattached jobs of interrupted runs were submitted earlier
+                submitted_at=(
+                    time.monotonic()
+                    if submission.job_request_body is not None
+                    else None
+                ),
+            )
+
+    def _publish_workflow_start(self) -> None:
+        """Publish the start of the workflow with its total number of jobs.
+
+        The total is published once, and again after checkpoints, as they can
+        add new jobs to the DAG.
+        """
+        if self._total_jobs is not None and not self._dag_updated:
+            return
+        self._dag_updated = False
+        total_jobs = self._count_jobs()
+        if total_jobs != self._total_jobs:
+            self._total_jobs = total_jobs
+            publish_workflow_start(
+                workflow_uuid=os.getenv("workflow_uuid", "default"),
+                publisher=self._progress,
+                job_count=total_jobs,
+            )
 
     @staticmethod
     def _get_container_image(job: Job) -> str:
@@ -129,18 +1132,17 @@ class REANAClusterExecutor(GenericClusterExecutor):
         self, job: Job, job_status: JobStatus, workflow_status: RunStatus
     ) -> None:
         workflow_uuid = os.getenv("workflow_uuid", "default")
-        job_id = job.reana_job_id
+        # jobs that were not submitted are missing, e.g. on submission errors
+        followed = job in self._job_ids
+        job_id = self._job_ids.pop(job, None)
         log.info(f"{job.name} job is {job_status.name}. job_id: {job_id}")
-        message = None
-        if job_id:
-            message = {
-                "progress": build_progress_message(
-                    **{job_status.name: {"total": 1, "job_ids": [job_id]}}
-                )
-            }
-        self.publisher.publish_workflow_status(
-            workflow_uuid, workflow_status.value, message=message
-        )
+        if followed:
+            # jobs of a group are counted one by one
+            self._progress.add(
+                job_status, job_id, count=len(job) if job.is_group() else 1
+            )
+        else:
+            self._progress.publish_workflow_status(workflow_uuid, workflow_status.value)
 
     def handle_job_success(self, job: Job) -> None:
         """Override job success method to publish job status."""
@@ -149,6 +1151,28 @@ class REANAClusterExecutor(GenericClusterExecutor):
         super(ClusterExecutor, self).handle_job_success(
             job, upload_remote=False, handle_log=False, handle_touch=True
         )
+        self._tracer.record([job], "done")
+        if job.is_checkpoint:
+            # the DAG is updated by Snakemake once the checkpoint is finished
+            self._dag_updated = True
+        if self.workspace_snapshot:
+            workflow_workspace = os.getenv("workflow_workspace", "default")
+            self.workspace_snapshot.invalidate(
+                path
+                for path in (
+                    get_relative_path(product, workflow_workspace)
+                    for product in job.products()
+                )
+                if path
+            )
+        cache_key = self._cache_keys.pop(job, None)
+        if cache_key:
+            self._cache_pool.submit(
+                self._job_cache.store,
+                cache_key,
+                self._get_cached_outputs(job),
+                os.getenv("workflow_workspace", "default"),
+            )
 
         self._handle_job_status(
             job, job_status=JobStatus.finished, workflow_status=RunStatus.running
@@ -157,6 +1181,7 @@ class REANAClusterExecutor(GenericClusterExecutor):
     def handle_job_error(self, job: Job) -> None:
         """Override job error method to publish job status."""
         super().handle_job_error(job)
+        self._tracer.record([job], "done")
 
         self._handle_job_status(
             job, job_status=JobStatus.failed, workflow_status=RunStatus.failed
@@ -168,7 +1193,8 @@ class REANAClusterExecutor(GenericClusterExecutor):
         If error occurs, return `failed` status.
         """
         try:
-            response = self.rjc_api_client.check_status(job_id)
+            with STATUS_CHECK_LATENCY.time():
+                response = self.rjc_api_client.check_status(job_id)
         except HTTPNotFound:
             log.error(
                 f"Job {job_id} was not found in job-controller. Return job failed status."
@@ -189,70 +1215,232 @@ class REANAClusterExecutor(GenericClusterExecutor):
             )
             return JobStatus.failed.name
 
+    def _on_job_status_event(self, job_id: str, status: str) -> None:
+        """Record a job status event and wake up `_wait_for_jobs` to handle it."""
+        if status not in (
+            JobStatus.finished.name,
+            JobStatus.failed.name,
+            JobStatus.stopped.name,
+        ):
+            return
+        self._tracer.record_job_id(job_id, "finished")
+        with self.lock:
+            # Events can arrive before the job is added to the job table, so they
+            # are kept until the job is found in `_wait_for_jobs`.
+            self._job_status_events.add(job_id, status)
+        self._poll_scheduler.wake_up()
+
+    def _get_all_job_statuses_from_controller(self) -> Optional[Dict[str, str]]:
+        """Get the statuses of all the jobs known by job-controller in one request.
+
+        If job-controller does not support listing its jobs, disable bulk status
+        checking for the rest of the workflow run. Return `None` if the jobs
+        could not be listed, so that their statuses are checked one by one.
+        """
+        try:
+            return list_job_statuses(self.rjc_api_client)
+        except (NotImplementedError, HTTPNotFound) as exception:
+            log.warning(
+                "Listing jobs is not supported by job-controller, checking job "
+                f"statuses one by one. Details: {exception}"
+            )
+            self._bulk_status_check = False
+        except Exception as exception:
+            log.warning(
+                "Could not list jobs in job-controller, checking job statuses "
+                f"one by one. Details: {exception}"
+            )
+        return None
+
+    async def _get_job_statuses(
+        self,
+        job_ids: List[str],
+        known_statuses: Dict[str, str],
+        poll_controller: bool = True,
+    ) -> List[Optional[str]]:
+        """Get job statuses from controller concurrently.
+
+        The requests to job-controller are blocking, so they are run in the
+        status checking thread pool in order not to block the event loop.
+        When bulk status checking is enabled, the statuses of all jobs are
+        requested at once and only the jobs missing from the response are
+        checked one by one.
+
+        Jobs whose status is already known from job status events are not
+        checked. If job-controller is not polled, the status of the other jobs
+        is `None`.
+        """
+        loop = asyncio.get_running_loop()
+        statuses = dict(known_statuses)
+        if not poll_controller:
+            return [statuses.get(job_id) for job_id in job_ids]
+        if self._bulk_status_check and len(statuses) < len(job_ids):
+            statuses = {
+                **(
+                    await loop.run_in_executor(
+                        self._status_check_pool,
+                        self._get_all_job_statuses_from_controller,
+                    )
+                    or {}
+                ),
+                **statuses,
+            }
+
+        async def _get_job_status(job_id: str) -> str:
+            if job_id in statuses:
+                return statuses[job_id]
+            return await loop.run_in_executor(
+                self._status_check_pool,
+                self._get_job_status_from_controller,
+                job_id,
+            )
+
+        return await asyncio.gather(*(_get_job_status(job_id) for job_id in job_ids))
+
     async def _wait_for_jobs(self):
         """Override _wait_for_jobs method to poll job-controller for job statuses.
 
         Original GenericClusterExecutor._wait_for_jobs method checks success/failure via .jobfinished or .jobfailed files.
         """
+        poll_controller = True
+        last_sweep = time.monotonic()
         while True:
             async with async_lock(self.lock):
                 if not self.wait:
                     return
-                active_jobs = self.active_jobs
-                self.active_jobs = []
-                still_running = []
-
-            for active_job in active_jobs:
-                job_id = active_job.job.reana_job_id
-
-                status = self._get_job_status_from_controller(job_id)
+                job_status_events = self._job_status_events.pop(
+                    self._job_table, submitting=self._submissions_in_flight > 0
+                )
+                # Jobs with status events are checked right away, the others
+                # only when job-controller is polled.
+                active_jobs = self._job_table.start_sweep(job_status_events)
+                if poll_controller:
+                    active_jobs += self._job_table.start_sweep(
+                        limit=SNAKEMAKE_MAX_JOBS_PER_SWEEP
+                    )
 
-                if status == JobStatus.finished.name or active_job.job.is_norun:
-                    active_job.callback(active_job.job)
+            sweep_start = time.monotonic()
+            statuses = await self._get_job_statuses(
+                [active_job.job_id for active_job in active_jobs],
+                known_statuses=job_status_events,
+                poll_controller=poll_controller,
+            )
+            done_jobs = []
+            for active_job, status in zip(active_jobs, statuses):
+                if status == JobStatus.finished.name or getattr(
+                    active_job.job, "is_norun", False
+                ):
+                    self._poll_scheduler.job_done(active_job.job_id)
+                    JOBS_FINISHED.inc()
+                    DETECTION_LAG.observe(sweep_start - last_sweep)
+                    self._observe_runtime(active_job)
+                    done_jobs.append((active_job, active_job.callback))
                 elif status in (
                     JobStatus.failed.name,
                     JobStatus.stopped.name,
                 ):
-                    active_job.error_callback(active_job.job)
-                else:
-                    still_running.append(active_job)
+                    self._poll_scheduler.job_done(active_job.job_id, finished=False)
+                    JOBS_FAILED.inc()
+                    DETECTION_LAG.observe(sweep_start - last_sweep)
+                    done_jobs.append((active_job, active_job.error_callback))
+                elif self._tracer.enabled and status:
+                    if status in (JobStatus.started.name, JobStatus.running.name):
+                        self._tracer.record_job_id(
+                            active_job.job_id, "started", overwrite=False
+                        )
+                    self._tracer.record_job_id(active_job.job_id, "seen_active")
+            if active_jobs:
+                POLL_SWEEP_DURATION.observe(time.monotonic() - sweep_start)
+            last_sweep = sweep_start
 
             async with async_lock(self.lock):
-                # Even though we have set active_jobs to a new empty list at the
-                # beginning of _wait_for_jobs, here that list might not be empty anymore
-                # as more jobs might have been added while we were fetching the job
-                # statuses from r-j-controller. For this reason we have to extend the
-                # list, instead of simply setting active_jobs to still_running.
-                self.active_jobs.extend(still_running)
+                # The jobs submitted during the sweep were added to the table
+                # in the meantime, only the checked jobs change state here.
+                for active_job, _ in done_jobs:
+                    self._job_table.remove(active_job)
+                    self._throttle.release(active_job.job)
+                self._job_table.end_sweep()
+                ACTIVE_JOBS.set(len(self._job_table))
+            for active_job, callback in done_jobs:
+                traced_jobs = _get_traced_jobs(active_job.job)
+                self._tracer.record(traced_jobs, "detected")
+                callback(active_job.job)
+                self._tracer.record(traced_jobs, "done")
 
-            await asyncio.sleep(POLL_JOBS_STATUS_SLEEP_IN_SECONDS)
+            if poll_controller:
+                self._poll_scheduler.sweep_done()
+            poll_controller = await self._poll_scheduler.wait()
 
 
-def submit_job(rjc_api_client, publisher, job_request_body):
+def _get_traced_jobs(job) -> List:
+    """Get the traced jobs of a job-controller job, i.e. all the jobs of bundles."""
+    return job.jobs if isinstance(job, JobBundle) else [job]
+
+
+def submit_job(rjc_api_client, job_request_body):
     """Submit job to REANA Job Controller."""
-    response = rjc_api_client.submit(**job_request_body)
+    with SUBMIT_LATENCY.time():
+        response = rjc_api_client.submit(**job_request_body)
     job_id = str(response["job_id"])
+    JOBS_SUBMITTED.inc()
 
     log.info(f"submitted job: {job_id}")
-    publish_job_submission(
-        workflow_uuid=job_request_body["workflow_uuid"],
-        publisher=publisher,
-        reana_job_id=job_id,
-    )
     return job_id
 
 
-def run_jobs(
-    rjc_api_client,
-    publisher,
-    workflow_workspace,
-    workflow_file,
-    workflow_parameters,
-    operational_options={},
-):
-    """Run Snakemake jobs using custom REANA executor."""
+def list_job_statuses(rjc_api_client) -> Dict[str, str]:
+    """Get the statuses of all the jobs known by REANA Job Controller, by job id.
+
+    The job-controller client of REANA-Commons cannot list jobs, so that they
+    are requested with its HTTP client. Job-controller answers with a ``jobs``
+    mapping of job ids to jobs, while its OpenAPI specification announces a
+    list of jobs, hence the response is read as is rather than validated.
+    """
+    try:
+        swagger_spec = rjc_api_client._client.swagger_spec
+        request = swagger_spec.http_client.request
+    except AttributeError:
+        raise NotImplementedError("The job-controller client cannot list jobs.")
+    with JOB_LIST_LATENCY.time():
+        # without an operation, bravado raises HTTP errors but returns the
+        # response as is
+        response = request(
+            {"method": "GET", "url": f"{swagger_spec.api_url.rstrip('/')}/jobs"}
+        ).result()
+    jobs = response.json().get("jobs") or {}
+    return {
+        str(job_id): job["status"]
+        for job_id, job in jobs.items()
+        if isinstance(job, dict) and job.get("status")
+    }
+
+
+def submit_job_batch(rjc_api_client, job_request_bodies):
+    """Submit many jobs to REANA Job Controller in one request.
+
+    The client has to provide a ``submit_batch`` method taking a list of job
+    requests and returning the responses of each job submission, in order.
+    """
+    with SUBMIT_LATENCY.time():
+        responses = rjc_api_client.submit_batch(job_request_bodies)
+    if len(responses) != len(job_request_bodies):
+        raise ValueError(
+            f"Submitted {len(job_request_bodies)} jobs but received "
+            f"{len(responses)} job ids."
+        )
+    job_ids = [str(response["job_id"]) for response in responses]
+    JOBS_SUBMITTED.inc(len(job_ids))
+
+    log.info(f"submitted jobs: {', '.join(job_ids)}")
+    return job_ids
+
+
+def _get_common_snakemake_args(
+    workflow_workspace, workflow_file, workflow_parameters
+) -> Dict:
+    """Get the Snakemake arguments shared by workflow runs and reports."""
     workflow_file_path = os.path.join(workflow_workspace, workflow_file)
-    common_snakemake_args = dict(
+    return dict(
         snakefile=workflow_file_path,
         config=workflow_parameters,
         workdir=workflow_workspace,
@@ -266,32 +1454,248 @@ def run_jobs(
         default_resources=DefaultResources(mode="bare"),
     )
 
-    def _generate_report():
-        """Generate HTML report."""
-        success = snakemake(
-            **common_snakemake_args,
-            report=operational_options.get("report", DEFAULT_SNAKEMAKE_REPORT_FILENAME),
-        )
-        if not success:
-            log.error("Error generating workflow HTML report.")
-
-    # Inject RJC API client and workflow status publisher in the REANA executor
-    REANAClusterExecutor.rjc_api_client = rjc_api_client
-    REANAClusterExecutor.publisher = publisher
-    # Monkeypatch GenericClusterExecutor class in `scheduler` module
-    scheduler.GenericClusterExecutor = REANAClusterExecutor
-
-    success = snakemake(
-        **common_snakemake_args,
-        printshellcmds=True,
-        # FIXME: Can be anything as it's not directly used. It's supposed
-        # to be the shell command to submit to job e.g. `condor_q`,
-        # but we call RJC API client instead.
-        cluster="reana",
-        notemp=True,
-        nodes=SNAKEMAKE_MAX_PARALLEL_JOBS,  # enables DAG parallelization
+
+def _get_rule_runtimes_dir() -> str:
+    """Get the directory keeping the rule runtimes, relative to the workspace."""
+    if SNAKEMAKE_RULE_RUNTIMES_DIR:
+        return SNAKEMAKE_RULE_RUNTIMES_DIR
+    if SNAKEMAKE_JOB_CACHE_DIR:
+        return os.path.join(SNAKEMAKE_JOB_CACHE_DIR, "rule-runtimes")
+    return os.path.join(".snakemake", "reana", "rule-runtimes")
+
+
+def _get_engine_config(operational_options) -> Dict:
+    """Get the engine configuration that changes the jobs of workflow runs."""
+    return {
+        "default_env_image": REANA_DEFAULT_SNAKEMAKE_ENV_IMAGE,
+        "local_run_jobs": SNAKEMAKE_LOCAL_RUN_JOBS,
+        "operational_options": operational_options,
+    }
+
+
+def get_report_mode(operational_options={}) -> str:
+    """Get when the workflow HTML report has to be generated."""
+    report_mode = operational_options.get("report_mode", SNAKEMAKE_REPORT_MODE)
+    if report_mode not in SNAKEMAKE_REPORT_MODES:
+        log.warning(
+            f"Unknown report mode '{report_mode}', falling back to "
+            f"'{SNAKEMAKE_REPORT_MODE}'."
+        )
+        report_mode = SNAKEMAKE_REPORT_MODE
+    return report_mode
+
+
+def generate_report(
+    workflow_workspace,
+    workflow_file,
+    workflow_parameters,
+    operational_options={},
+    timeout=SNAKEMAKE_REPORT_TIMEOUT_IN_SECONDS,
+) -> bool:
+    """Generate the workflow HTML report, giving up after ``timeout`` seconds.
+
+    The report is generated from the DAG of the workflow run that just
+    finished. If the run did not get to build it, Snakemake is run again in
+    report mode to build it from scratch.
+
+    Rendering runs in a forked process working in the workspace, as the paths
+    of the DAG are relative to it, so that the working directory of the engine
+    does not change under its threads, and so that a stuck report is stopped
+    after the timeout.
+    """
+    report = operational_options.get("report", DEFAULT_SNAKEMAKE_REPORT_FILENAME)
+    report_path = os.path.join(os.path.abspath(workflow_workspace), report)
+    if REANAClusterExecutor.workflow_up_to_date and os.path.exists(report_path):
+        log.info("Workflow HTML report of the last run is up to date.")
+        return True
+    dag = REANAClusterExecutor.workflow_dag
+    snapshot = REANAClusterExecutor.workspace_snapshot
+
+    def _render_report():
+        if snapshot:
+            snapshot.refresh()
+        if dag is None:
+            if snapshot:
+                snakemake_io.IOCache = snapshot.wrap_iocache(snakemake_io.IOCache)
+            success = snakemake(
+                **_get_common_snakemake_args(
+                    workflow_workspace, workflow_file, workflow_parameters
+                ),
+                report=report_path,
+            )
+            sys.exit(0 if success else 1)
+        if snapshot:
+            # nothing else is using the DAG in this process, so that the report
+            # can be rendered with the file status of the snapshot
+            dag.workflow.iocache.active = True
+            snapshot.fill_iocache(dag.workflow.iocache)
+        os.chdir(workflow_workspace)
+        try:
+            auto_report(dag, report_path)
+        except Exception as exception:
+            log.error(f"Error rendering workflow HTML report: {exception}")
+            sys.exit(1)
+
+    start = time.monotonic()
+    report_process = multiprocessing.get_context("fork").Process(
+        target=_render_report, name="reana-report", daemon=True
     )
-    # Once the workflow is finished, generate the report,
-    # taking into account the metadata generated.
-    _generate_report()
+    report_process.start()
+    report_process.join(timeout)
+    duration = time.monotonic() - start
+    REPORT_DURATION.observe(duration)
+    if report_process.is_alive():
+        report_process.kill()
+        report_process.join()
+        log.error(f"Workflow HTML report generation timed out after {duration:.1f}s.")
+        return False
+    if report_process.exitcode != 0:
+        log.error("Error generating workflow HTML report.")
+        return False
+    log.info(f"Workflow HTML report generated in {duration:.1f}s.")
+    return True
+
+
+def run_jobs(
+    rjc_api_client,
+    publisher,
+    workflow_workspace,
+    workflow_file,
+    workflow_parameters,
+    operational_options={},
+):
+    """Run Snakemake jobs using custom REANA executor.
+
+    The workflow HTML report is generated afterwards only in the ``sync``
+    report mode, otherwise the caller is responsible for generating it.
+    """
+    REANAClusterExecutor.workflow_dag = None
+    REANAClusterExecutor.workflow_up_to_date = False
+    REANAClusterExecutor.workspace_snapshot = None
+    REANAClusterExecutor.rule_runtimes_dir = None
+    REANAClusterExecutor.rule_runtimes = None
+    startup_cache = None
+    if operational_options.get("startup_cache", SNAKEMAKE_STARTUP_CACHE):
+        startup_cache = StartupCache(
+            os.path.join(workflow_workspace, SNAKEMAKE_STARTUP_CACHE_DIR),
+            excluded_paths=(
+                ".snakemake",
+                SNAKEMAKE_STARTUP_CACHE_DIR,
+                operational_options.get("report", DEFAULT_SNAKEMAKE_REPORT_FILENAME),
+            ),
+        )
+        engine_config = _get_engine_config(operational_options)
+        if startup_cache.is_up_to_date(
+            workflow_workspace, workflow_file, workflow_parameters, engine_config
+        ):
+            log.info("Nothing changed since the last successful run, skipping it.")
+            REANAClusterExecutor.workflow_up_to_date = True
+            return True
+
+    metrics.reset()
+    if SNAKEMAKE_METRICS_PORT:
+        metrics.start_http_server(SNAKEMAKE_METRICS_PORT)
+    # the metrics server is stopped whatever happens to the workflow run
+    try:
+        # Inject RJC API client and workflow status publisher in the REANA executor
+        REANAClusterExecutor.rjc_api_client = rjc_api_client
+        REANAClusterExecutor.publisher = TimedPublisher(publisher)
+        REANAClusterExecutor.resumable_job_ids = set()
+        if operational_options.get(
+            "critical_path_priority", SNAKEMAKE_CRITICAL_PATH_PRIORITY
+        ):
+            REANAClusterExecutor.rule_runtimes_dir = os.path.join(
+                workflow_workspace, _get_rule_runtimes_dir()
+            )
+        if operational_options.get("resume", SNAKEMAKE_RESUME):
+            REANAClusterExecutor.resumable_job_ids = prepare_resume(
+                rjc_api_client, workflow_workspace
+            )
+        # Monkeypatch GenericClusterExecutor class in `scheduler` module
+        scheduler.GenericClusterExecutor = REANAClusterExecutor
+        http_adapter = configure_http_client(rjc_api_client)
+        parse = snakemake_workflow.parse
+        if startup_cache:
+            snakemake_workflow.parse = startup_cache.wrap_parse(parse)
+        iocache_class = snakemake_io.IOCache
+        if operational_options.get(
+            "file_status_prefetch", SNAKEMAKE_FILE_STATUS_PREFETCH
+        ):
+            snapshot = WorkspaceSnapshot(
+                workflow_workspace,
+                excluded_paths=(".snakemake",),
+                threads=SNAKEMAKE_FILE_STATUS_THREADS,
+            )
+            snapshot.scan()
+            REANAClusterExecutor.workspace_snapshot = snapshot
+            snakemake_io.IOCache = snapshot.wrap_iocache(iocache_class)
+        memory_profiler = None
+        memory_profile_interval = float(
+            operational_options.get(
+                "memory_profile_interval", SNAKEMAKE_MEMORY_PROFILE_INTERVAL_IN_SECONDS
+            )
+        )
+        if memory_profile_interval > 0:
+            memory_profiler = MemoryProfiler(
+                os.path.join(workflow_workspace, SNAKEMAKE_MEMORY_PROFILE_DIR),
+                interval=memory_profile_interval,
+                top=SNAKEMAKE_MEMORY_PROFILE_TOP,
+                frames=SNAKEMAKE_MEMORY_PROFILE_FRAMES,
+            )
+            memory_profiler.start()
+
+        try:
+            success = snakemake(
+                **_get_common_snakemake_args(
+                    workflow_workspace, workflow_file, workflow_parameters
+                ),
+                printshellcmds=True,
+                # FIXME: Can be anything as it's not directly used. It's supposed
+                # to be the shell command to submit to job e.g. `condor_q`,
+                # but we call RJC API client instead.
+                cluster="reana",
+                notemp=True,
+                nodes=SNAKEMAKE_MAX_PARALLEL_JOBS,  # enables DAG parallelization
+                local_cores=SNAKEMAKE_MAX_LOCAL_JOBS,  # for jobs of `localrules`
+            )
+        finally:
+            snakemake_workflow.parse = parse
+            snakemake_io.IOCache = iocache_class
+            if memory_profiler:
+                memory_profiler.stop()
+        log_http_client_stats(http_adapter)
+        if REANAClusterExecutor.rule_runtimes:
+            REANAClusterExecutor.rule_runtimes.save()
+        # Once the workflow is finished, generate the report,
+        # taking into account the metadata generated.
+        if get_report_mode(operational_options) == "sync":
+            generate_report(
+                workflow_workspace,
+                workflow_file,
+                workflow_parameters,
+                operational_options=operational_options,
+            )
+        if success and startup_cache:
+            dag = REANAClusterExecutor.workflow_dag
+            startup_cache.record_run(
+                workflow_workspace,
+                workflow_file,
+                workflow_parameters,
+                engine_config,
+                files=(
+                    None
+                    if dag is None
+                    else [
+                        *dag.workflow.configfiles,
+                        *(path for job in dag.jobs for path in job.input),
+                        *(path for job in dag.jobs for path in job.output),
+                    ]
+                ),
+            )
+    finally:
+        if SNAKEMAKE_METRICS_SUMMARY_FILE:
+            metrics.write_summary(
+                os.path.join(workflow_workspace, SNAKEMAKE_METRICS_SUMMARY_FILE)
+            )
+        metrics.stop_http_server()
     return success
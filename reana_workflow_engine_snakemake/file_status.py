@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake snapshot of the status of workspace files."""
+
+import logging
+import os
+import stat
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from snakemake.io import Mtime
+
+from reana_workflow_engine_snakemake.config import LOGGING_MODULE
+
+log = logging.getLogger(LOGGING_MODULE)
+
+TIMESTAMP_FILE = ".snakemake_timestamp"
+"""File giving its modification time to the directory outputs of Snakemake."""
+
+# directories modified this shortly before being scanned could change again
+# without their modification time changing, so they are always scanned again
+RACY_INTERVAL_NS = 2 * 10**9
+
+# maximum number of files whose status is read by each task of the thread pool
+STAT_CHUNK_SIZE = 256
+
+
+class FileStatus:
+    """Status of a file of the workspace, as seen by Snakemake."""
+
+    __slots__ = ("mtime", "target_mtime", "size", "is_dir", "is_link")
+
+    def __init__(
+        self,
+        mtime: float,
+        target_mtime: Optional[float],
+        size: int,
+        is_dir: bool,
+        is_link: bool,
+    ):
+        """Initialise the file status."""
+        self.mtime = mtime
+        self.target_mtime = target_mtime
+        self.size = size
+        self.is_dir = is_dir
+        self.is_link = is_link
+
+
+def _stat(path: str) -> Optional[FileStatus]:
+    """Get the status of a file, or ``None`` if it does not exist."""
+    try:
+        lstat = os.stat(path, follow_symlinks=False)
+        if not stat.S_ISLNK(lstat.st_mode):
+            return FileStatus(
+                lstat.st_mtime,
+                None,
+                lstat.st_size,
+                stat.S_ISDIR(lstat.st_mode),
+                False,
+            )
+        # broken links do not exist for Snakemake
+        target_stat = os.stat(path)
+    except OSError:
+        return None
+    return FileStatus(
+        lstat.st_mtime,
+        target_stat.st_mtime,
+        target_stat.st_size,
+        stat.S_ISDIR(target_stat.st_mode),
+        True,
+    )
+
+
+class WorkspaceSnapshot:
+    """Existence, modification time and size of all the files of a workspace.
+
+    Snakemake checks the files of the workflow one by one when building the
+    DAG, which is slow on network file systems where every ``stat`` is a round
+    trip to the server. The snapshot lists the directories of the workspace
+    and reads the status of their files in parallel, and then fills the IO
+    cache Snakemake uses while building the DAG.
+
+    The snapshot is kept up to date by scanning again the directories whose
+    modification time changed, i.e. where files were created or removed, and
+    the files invalidated by the executor, i.e. the outputs of finished jobs.
+    Files modified in place by jobs without being declared as their outputs
+    are not noticed.
+
+    :param workflow_workspace: Directory of the workspace.
+    :param excluded_paths: Directories relative to the workspace whose files
+        are not scanned, e.g. the Snakemake metadata.
+    :param threads: Number of threads reading the status of files.
+    """
+
+    def __init__(
+        self,
+        workflow_workspace: str,
+        excluded_paths: Iterable[str] = (),
+        threads: int = 16,
+    ):
+        """Initialise the empty workspace snapshot."""
+        self.workflow_workspace = workflow_workspace
+        self.excluded_paths = {os.path.normpath(path) for path in excluded_paths}
+        self.threads = threads
+        self.stats = {"scanned_dirs": 0, "stat_calls": 0}
+        self._lock = threading.Lock()
+        # status of the files and directories, by path relative to the workspace
+        self._files: Dict[str, FileStatus] = {}
+        # modification time of the scanned directories and time of their scan
+        self._dirs: Dict[str, Tuple[int, int]] = {}
+        # names of the entries of the scanned directories
+        self._children: Dict[str, List[str]] = {}
+        self._invalidated: Set[str] = set()
+
+    def __len__(self) -> int:
+        """Get the number of files and directories of the snapshot."""
+        return len(self._files)
+
+    def get(self, path: str) -> Optional[FileStatus]:
+        """Get the status of a file, or ``None`` if it does not exist."""
+        return self._files.get(os.path.normpath(path))
+
+    def _get_path(self, path: str) -> str:
+        return os.path.join(self.workflow_workspace, path)
+
+    def _list_dir(self, path: str) -> Optional[Tuple[int, int, List[Tuple[str, bool]]]]:
+        """List the entries of a directory, with whether they are directories."""
+        try:
+            scanned_at = time.time_ns()
+            # read before listing, so that changes made meanwhile are noticed
+            mtime = os.stat(self._get_path(path)).st_mtime_ns
+            with os.scandir(self._get_path(path)) as entries:
+                return (
+                    mtime,
+                    scanned_at,
+                    [
+                        (entry.name, entry.is_dir(follow_symlinks=False))
+                        for entry in entries
+                    ],
+                )
+        except OSError:
+            return None
+
+    def _stat_chunk(self, paths: List[str]) -> List[Optional[FileStatus]]:
+        return [_stat(self._get_path(path)) for path in paths]
+
+    def _map_chunks(self, function: Callable, paths: List[str]) -> List:
+        """Apply the function to chunks of paths in parallel, keeping their order."""
+        chunk_size = min(STAT_CHUNK_SIZE, -(-len(paths) // self.threads)) or 1
+        chunks = [paths[i : i + chunk_size] for i in range(0, len(paths), chunk_size)]
+        with ThreadPoolExecutor(
+            max_workers=self.threads, thread_name_prefix="reana-file-status"
+        ) as pool:
+            return [result for chunk in pool.map(function, chunks) for result in chunk]
+
+    def _forget(self, path: str) -> None:
+        """Remove a file, or a directory with everything inside, from the snapshot."""
+        self._files.pop(path, None)
+        if self._dirs.pop(path, None) is not None:
+            for name in self._children.pop(path, []):
+                self._forget(os.path.join(path, name))
+
+    def _is_excluded(self, path: str) -> bool:
+        return any(
+            path == excluded or path.startswith(excluded + os.sep)
+            for excluded in self.excluded_paths
+        )
+
+    def _scan_dirs(self, dirs: List[str]) -> None:
+        """Scan directories and the directories found in them, level by level."""
+        while dirs:
+            listings = self._map_chunks(
+                lambda chunk: [self._list_dir(path) for path in chunk], dirs
+            )
+            self.stats["scanned_dirs"] += len(dirs)
+            to_stat, next_dirs = [], []
+            for path, listing in zip(dirs, listings):
+                if listing is None:
+                    # removed since its parent was scanned
+                    self._forget(path)
+                    continue
+                mtime, scanned_at, entries = listing
+                names = [name for name, _ in entries]
+                for name in set(self._children.get(path, [])) - set(names):
+                    self._forget(os.path.join(path, name))
+                self._dirs[path] = (mtime, scanned_at)
+                self._children[path] = names
+                for name, is_dir in entries:
+                    child = os.path.join(path, name)
+                    to_stat.append(child)
+                    if not is_dir and child in self._dirs:
+                        # replaced by a file
+                        self._forget(child)
+                    elif (
+                        is_dir
+                        and child not in self._dirs
+                        and not self._is_excluded(child)
+                    ):
+                        next_dirs.append(child)
+            self._update(to_stat)
+            dirs = next_dirs
+
+    def _update(self, paths: List[str]) -> None:
+        """Read the status of files again."""
+        self.stats["stat_calls"] += len(paths)
+        for path, status in zip(paths, self._map_chunks(self._stat_chunk, paths)):
+            if status is None:
+                self._forget(path)
+            else:
+                self._files[path] = status
+
+    def scan(self) -> None:
+        """Read the status of all the files of the workspace."""
+        start = time.monotonic()
+        with self._lock:
+            self._files.clear()
+            self._dirs.clear()
+            self._children.clear()
+            self._invalidated.clear()
+            self._scan_dirs([""])
+        log.info(
+            f"Read the status of {len(self._files)} workspace files in "
+            f"{time.monotonic() - start:.2f}s."
+        )
+
+    def invalidate(self, paths: Iterable[str]) -> None:
+        """Mark files as modified, to read their status again at the next refresh."""
+        with self._lock:
+            self._invalidated.update(os.path.normpath(path) for path in paths)
+
+    def refresh(self) -> None:
+        """Read again the status of the files that may have changed since the scan."""
+        with self._lock:
+            dirs = list(self._dirs)
+
+            def get_mtimes(chunk):
+                mtimes = []
+                for path in chunk:
+                    try:
+                        mtimes.append(os.stat(self._get_path(path)).st_mtime_ns)
+                    except OSError:
+                        mtimes.append(None)
+                return mtimes
+
+            changed = [
+                path
+                for path, mtime in zip(dirs, self._map_chunks(get_mtimes, dirs))
+                if mtime != self._dirs[path][0]
+                or self._dirs[path][1] - mtime < RACY_INTERVAL_NS
+            ]
+            self._scan_dirs(changed)
+            changed = set(changed)
+            invalidated = [
+                path
+                for path in self._invalidated
+                if os.path.dirname(path) not in changed
+                and os.path.dirname(path) in self._dirs
+            ]
+            self._invalidated.clear()
+            self._update(invalidated)
+
+    def fill_iocache(self, iocache) -> None:
+        """Fill the IO cache of Snakemake with the status of the files.
+
+        Files missing from the scanned directories are known not to exist.
+        Directories linked to are left for Snakemake to check.
+        """
+        with self._lock:
+            for path, status in self._files.items():
+                iocache.exists_local[path] = True
+                iocache.size[path] = status.size
+                if not status.is_dir:
+                    iocache.mtime[path] = Mtime(
+                        local=status.mtime, local_target=status.target_mtime
+                    )
+                elif not status.is_link:
+                    timestamp = self._files.get(os.path.join(path, TIMESTAMP_FILE))
+                    iocache.mtime[path] = Mtime(
+                        local=(
+                            timestamp.target_mtime or timestamp.mtime
+                            if timestamp
+                            else status.mtime
+                        )
+                    )
+            iocache.exists_local.has_inventory.update(
+                path for path in self._dirs if path
+            )
+
+    def wrap_iocache(self, iocache_class: Callable) -> Callable:
+        """Make ``snakemake.io.IOCache`` create IO caches filled from the snapshot."""
+
+        def create_iocache(*args, **kwargs):
+            iocache = iocache_class(*args, **kwargs)
+            self.fill_iocache(iocache)
+            return iocache
+
+        return create_iocache
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake job-controller HTTP connection pooling."""
+
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from reana_workflow_engine_snakemake.config import (
+    JOB_CONTROLLER_CONNECT_TIMEOUT_IN_SECONDS,
+    JOB_CONTROLLER_POOL_SIZE,
+    JOB_CONTROLLER_READ_TIMEOUT_IN_SECONDS,
+    LOGGING_MODULE,
+)
+
+log = logging.getLogger(LOGGING_MODULE)
+
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+"""HTTP methods of the requests that can be given a read timeout."""
+
+_wait_time_lock = threading.Lock()
+
+
+class _TimedConnectionPoolMixin:
+    """Record the time spent waiting for a free connection of the pool."""
+
+    wait_time = 0.0
+
+    def _get_conn(self, timeout=None):
+        start = time.monotonic()
+        try:
+            return super()._get_conn(timeout)
+        finally:
+            with _wait_time_lock:
+                self.wait_time += time.monotonic() - start
+
+
+class _TimedHTTPConnectionPool(_TimedConnectionPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class _TimedHTTPSConnectionPool(_TimedConnectionPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTP adapter keeping a fixed number of keep-alive connections per host.
+
+    Requests sent while all the connections are in use wait for one of them
+    to be free, instead of opening new connections that would be closed right
+    after being used. Requests sent without a timeout get the default one,
+    without read timeout for non-idempotent requests, e.g. job submissions,
+    which could otherwise time out after job-controller created their job.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = JOB_CONTROLLER_POOL_SIZE,
+        connect_timeout: float = JOB_CONTROLLER_CONNECT_TIMEOUT_IN_SECONDS,
+        read_timeout: float = JOB_CONTROLLER_READ_TIMEOUT_IN_SECONDS,
+        **kwargs,
+    ):
+        """Initialise the pooled HTTP adapter."""
+        self.timeout = (connect_timeout, read_timeout)
+        super().__init__(pool_maxsize=pool_size, pool_block=True, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        """Create the pool manager, recording the time waited for connections."""
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+    def send(self, request, timeout=None, **kwargs):
+        """Send the request with the default timeout if none is given."""
+        if timeout is None:
+            timeout = self.timeout
+            if request.method not in IDEMPOTENT_METHODS:
+                timeout = (self.timeout[0], None)
+        return super().send(request, timeout=timeout, **kwargs)
+
+    def get_stats(self) -> Dict:
+        """Get the statistics of the connection pools.
+
+        Returns the number of requests sent, the number of connections opened,
+        the ratio of requests sent on already opened connections and the total
+        time spent waiting for a free connection.
+        """
+        pools = self.poolmanager.pools
+        requests = connections = 0
+        wait_time = 0.0
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            requests += pool.num_requests
+            connections += pool.num_connections
+            wait_time += getattr(pool, "wait_time", 0.0)
+        return {
+            "requests": requests,
+            "connections": connections,
+            "reuse_ratio": 1 - connections / requests if requests else 0.0,
+            "wait_time": wait_time,
+        }
+
+
+def configure_http_client(rjc_api_client, **kwargs) -> Optional[PooledHTTPAdapter]:
+    """Make the job-controller client use a pool of keep-alive connections.
+
+    :param rjc_api_client: Job-controller client whose HTTP connections are
+        pooled, if it sends requests with a ``requests`` session.
+    :param kwargs: Parameters of the ``PooledHTTPAdapter``.
+    :return: The mounted adapter, to get pool statistics from, or ``None`` if
+        the HTTP client of ``rjc_api_client`` is not supported.
+    """
+    try:
+        session = rjc_api_client._client.swagger_spec.http_client.session
+    except AttributeError:
+        log.debug("Job-controller client does not use a requests session.")
+        return None
+    adapter = PooledHTTPAdapter(**kwargs)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return adapter
+
+
+def log_http_client_stats(adapter: Optional[PooledHTTPAdapter]) -> None:
+    """Log the statistics of the job-controller connection pool."""
+    if adapter is None:
+        return
+    stats = adapter.get_stats()
+    log.info(
+        f"Sent {stats['requests']} requests to job-controller over "
+        f"{stats['connections']} connections "
+        f"(reuse ratio {stats['reuse_ratio']:.2f}), "
+        f"waited {stats['wait_time']:.1f}s for free connections."
+    )
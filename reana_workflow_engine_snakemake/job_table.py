@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake table of the jobs followed by the executor."""
+
+from itertools import islice
+from typing import Callable, Dict, Iterable, List, Optional
+
+WAITING = "waiting"
+"""State of the jobs waiting for their status to be checked."""
+
+CHECKING = "checking"
+"""State of the jobs whose status is being checked by a sweep."""
+
+
+class ActiveJob:
+    """Job submitted to job-controller and not detected as done yet."""
+
+    __slots__ = ("job", "job_id", "callback", "error_callback", "submitted_at")
+
+    def __init__(
+        self,
+        job,
+        job_id: str,
+        callback: Callable,
+        error_callback: Callable,
+        submitted_at: Optional[float] = None,
+    ):
+        """Initialise the active job."""
+        self.job = job
+        self.job_id = job_id
+        self.callback = callback
+        self.error_callback = error_callback
+        # monotonic time of the submission, if submitted by this run
+        self.submitted_at = submitted_at
+
+
+class JobTable:
+    """Active jobs indexed by job-controller id and by state.
+
+    Jobs move between the ``WAITING`` and ``CHECKING`` states in constant time,
+    and sweeps checking all the jobs move them at once, so that the table is
+    not copied at every sweep. Waiting jobs are kept in the order they were
+    last checked, so that sweeps checking a limited number of jobs go through
+    all of them in turn.
+
+    The table is not thread-safe, callers have to hold the executor lock.
+    """
+
+    def __init__(self):
+        """Initialise the empty job table."""
+        # the jobs of each state, by job id, in the order they entered the state
+        self._states: Dict[str, Dict[str, ActiveJob]] = {WAITING: {}, CHECKING: {}}
+        self._sweeping_all = False
+
+    def __len__(self) -> int:
+        """Get the number of active jobs."""
+        return sum(len(jobs) for jobs in self._states.values())
+
+    def __contains__(self, job_id: str) -> bool:
+        """Check whether the job is active."""
+        return any(job_id in jobs for jobs in self._states.values())
+
+    def get(self, job_id: str) -> Optional[ActiveJob]:
+        """Get the active job with the given job-controller id."""
+        for jobs in self._states.values():
+            if job_id in jobs:
+                return jobs[job_id]
+        return None
+
+    def get_state(self, job_id: str) -> Optional[str]:
+        """Get the state of the active job with the given job-controller id."""
+        for state, jobs in self._states.items():
+            if job_id in jobs:
+                return state
+        return None
+
+    def count(self, state: str) -> int:
+        """Get the number of active jobs in the given state."""
+        return len(self._states[state])
+
+    def add(
+        self,
+        job,
+        job_id: str,
+        callback: Callable,
+        error_callback: Callable,
+        submitted_at: Optional[float] = None,
+    ) -> ActiveJob:
+        """Start following a submitted job."""
+        active_job = ActiveJob(job, job_id, callback, error_callback, submitted_at)
+        self._states[WAITING][job_id] = active_job
+        return active_job
+
+    def start_sweep(
+        self, job_ids: Optional[Iterable[str]] = None, limit: int = 0
+    ) -> List[ActiveJob]:
+        """Take waiting jobs to check their status.
+
+        :param job_ids: Ids of the jobs to check, all waiting jobs by default.
+        :param limit: Maximum number of jobs to check, or 0 for no limit. The
+            jobs that have waited for the longest are checked first.
+        """
+        waiting, checking = self._states[WAITING], self._states[CHECKING]
+        if job_ids is None and not limit:
+            # all the jobs change state at once
+            taken = list(waiting.values())
+            waiting.update(checking)
+            self._states[WAITING], self._states[CHECKING] = {}, waiting
+            self._sweeping_all = True
+            return taken
+        if job_ids is None:
+            job_ids = waiting
+        taken = (job_id for job_id in job_ids if job_id in waiting)
+        taken = list(islice(taken, limit or None))
+        for job_id in taken:
+            checking[job_id] = waiting.pop(job_id)
+        return [checking[job_id] for job_id in taken]
+
+    def end_sweep(self) -> None:
+        """Make the checked jobs that are still active wait for the next sweep.
+
+        The jobs are checked again after the jobs that are already waiting.
+        """
+        waiting, checking = self._states[WAITING], self._states[CHECKING]
+        if self._sweeping_all:
+            # only the jobs submitted during the sweep are waiting, which are
+            # all checked by the next sweep
+            checking.update(waiting)
+            self._states[WAITING], self._states[CHECKING] = checking, {}
+            self._sweeping_all = False
+        else:
+            waiting.update(checking)
+            checking.clear()
+
+    def remove(self, active_job: ActiveJob) -> None:
+        """Stop following a job detected as done."""
+        for jobs in self._states.values():
+            jobs.pop(active_job.job_id, None)
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake profiling of the memory of the engine."""
+
+import logging
+import os
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+from typing import List, Optional
+
+from reana_workflow_engine_snakemake.config import LOGGING_MODULE
+
+log = logging.getLogger(LOGGING_MODULE)
+
+# allocations of the import machinery and of the profiler itself are left out
+IGNORED_FILES = ("<frozen importlib._bootstrap>", "<unknown>", tracemalloc.__file__)
+
+
+def get_peak_rss_mb() -> float:
+    """Get the peak resident set size of the process, in megabytes."""
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak_rss / (1024**2 if sys.platform == "darwin" else 1024)
+
+
+class MemoryProfiler:
+    """Take snapshots of the memory allocations of the engine at regular intervals.
+
+    Allocations are traced with ``tracemalloc``, and the lines of code holding
+    the most memory at each snapshot are written to ``memory-<n>.txt`` files,
+    together with how much they grew since the previous snapshot. Tracing
+    allocations slows the engine down, so the profiler is meant to investigate
+    the memory usage of large workflows, not to run all the time.
+
+    :param directory: Directory where the snapshots are written.
+    :param interval: Seconds between two snapshots.
+    :param top: Number of lines of code listed in each snapshot.
+    :param frames: Number of frames of the traceback of each allocation, to
+        find where the allocating functions are called from.
+    """
+
+    def __init__(self, directory: str, interval: float, top: int = 25, frames: int = 1):
+        """Initialise the memory profiler."""
+        self.directory = directory
+        self.interval = interval
+        self.top = top
+        self.frames = frames
+        self.snapshots = 0
+        self._previous: Optional[tracemalloc.Snapshot] = None
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start tracing allocations and taking snapshots in the background."""
+        os.makedirs(self.directory, exist_ok=True)
+        tracemalloc.start(self.frames)
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="reana-memory-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self.take_snapshot()
+
+    def stop(self) -> None:
+        """Take a last snapshot and stop tracing allocations."""
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+        self.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        self._previous = None
+        log.info(
+            f"Memory profile written to {self.directory}: {self.snapshots} "
+            f"snapshots, peak of {peak / 1024**2:.1f} MB traced, peak RSS "
+            f"{get_peak_rss_mb():.0f} MB."
+        )
+
+    def take_snapshot(self) -> str:
+        """Write the lines of code holding the most memory, returning the file."""
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, filename) for filename in IGNORED_FILES]
+        )
+        current, peak = tracemalloc.get_traced_memory()
+        key_type = "traceback" if self.frames > 1 else "lineno"
+        if self._previous is None:
+            stats = snapshot.statistics(key_type)
+        else:
+            stats = snapshot.compare_to(self._previous, key_type)
+        self._previous = snapshot
+        self.snapshots += 1
+        path = os.path.join(self.directory, f"memory-{self.snapshots:04d}.txt")
+        lines = [
+            f"Time: {time.strftime('%Y-%m-%dT%H:%M:%S')}",
+            f"Traced: {current / 1024**2:.1f} MB, peak {peak / 1024**2:.1f} MB",
+            f"Peak RSS: {get_peak_rss_mb():.0f} MB",
+            "",
+        ]
+        lines += _format_stats(stats[: self.top])
+        with open(path, "w") as snapshot_file:
+            snapshot_file.write("\n".join(lines) + "\n")
+        return path
+
+
+def _format_stats(stats: List) -> List[str]:
+    """Format the statistics of a snapshot, with their growth if compared."""
+    lines = []
+    for stat in stats:
+        line = f"{stat.size / 1024:.1f} KiB in {stat.count} blocks"
+        if isinstance(stat, tracemalloc.StatisticDiff):
+            line += f" ({stat.size_diff / 1024:+.1f} KiB)"
+        lines.append(line)
+        lines += [f"    {frame}" for frame in stat.traceback.format()]
+    return lines
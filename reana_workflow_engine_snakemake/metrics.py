@@ -0,0 +1,318 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake executor metrics."""
+
+import json
+import logging
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from reana_workflow_engine_snakemake.config import LOGGING_MODULE
+
+log = logging.getLogger(LOGGING_MODULE)
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+"""Default upper bounds, in seconds, of the histogram buckets."""
+
+
+class Metric:
+    """Base class of the metrics exposed by the workflow engine."""
+
+    type = ""
+
+    def __init__(self, name: str, documentation: str):
+        """Initialise the metric."""
+        self.name = name
+        self.documentation = documentation
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        """Reset the metric to its initial value."""
+
+    def samples(self) -> List[Tuple[str, float]]:
+        """Get the name and value of each Prometheus sample of the metric."""
+        return []
+
+    def summary(self):
+        """Get the value of the metric for the JSON summary."""
+
+
+class Counter(Metric):
+    """Value that can only increase, e.g. a number of requests."""
+
+    type = "counter"
+
+    def reset(self) -> None:
+        """Reset the counter to zero."""
+        with self._lock:
+            self.value = 0.0
+
+    def inc(self, amount: float = 1) -> None:
+        """Increase the counter."""
+        with self._lock:
+            self.value += amount
+
+    def samples(self) -> List[Tuple[str, float]]:
+        """Get the value of the counter."""
+        return [(self.name, self.value)]
+
+    def summary(self) -> float:
+        """Get the value of the counter."""
+        return self.value
+
+
+class Gauge(Metric):
+    """Value that can go up and down, e.g. a number of running jobs."""
+
+    type = "gauge"
+
+    def reset(self) -> None:
+        """Reset the gauge to zero."""
+        with self._lock:
+            self.value = 0.0
+            self.max = 0.0
+
+    def set(self, value: float) -> None:
+        """Set the value of the gauge."""
+        with self._lock:
+            self.value = value
+            self.max = max(self.max, value)
+
+    def samples(self) -> List[Tuple[str, float]]:
+        """Get the value of the gauge."""
+        return [(self.name, self.value)]
+
+    def summary(self) -> Dict:
+        """Get the last and maximum values of the gauge."""
+        return {"value": self.value, "max": self.max}
+
+
+class Histogram(Metric):
+    """Distribution of observed values, e.g. request latencies in seconds."""
+
+    type = "histogram"
+
+    def __init__(self, name: str, documentation: str, buckets=DEFAULT_BUCKETS):
+        """Initialise the histogram."""
+        self.buckets = tuple(buckets) + (math.inf,)
+        super().__init__(name, documentation)
+
+    def reset(self) -> None:
+        """Forget all the observed values."""
+        with self._lock:
+            self.counts = [0] * len(self.buckets)
+            self.count = 0
+            self.sum = 0.0
+            self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record an observed value."""
+        with self._lock:
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    self.counts[i] += 1
+                    break
+            self.count += 1
+            self.sum += value
+            self.max = max(self.max, value)
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Observe the time spent in the ``with`` block."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.observe(time.monotonic() - start)
+
+    def samples(self) -> List[Tuple[str, float]]:
+        """Get the cumulative bucket counts, the sum and the count."""
+        samples = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            le = "+Inf" if bound == math.inf else repr(float(bound))
+            samples.append((f'{self.name}_bucket{{le="{le}"}}', cumulative))
+        samples.append((f"{self.name}_sum", self.sum))
+        samples.append((f"{self.name}_count", self.count))
+        return samples
+
+    def summary(self) -> Dict:
+        """Get the number, total, mean and maximum of the observed values."""
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "max": self.max,
+        }
+
+
+class MetricsRegistry:
+    """Collection of the metrics of a workflow run."""
+
+    def __init__(self):
+        """Initialise the empty registry."""
+        self._metrics: Dict[str, Metric] = {}
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def _register(self, metric: Metric) -> Metric:
+        metric.reset()
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str) -> Counter:
+        """Register a counter."""
+        return self._register(Counter(name, documentation))
+
+    def gauge(self, name: str, documentation: str) -> Gauge:
+        """Register a gauge."""
+        return self._register(Gauge(name, documentation))
+
+    def histogram(self, name: str, documentation: str, **kwargs) -> Histogram:
+        """Register a histogram."""
+        return self._register(Histogram(name, documentation, **kwargs))
+
+    def reset(self) -> None:
+        """Reset all the metrics, e.g. before a new workflow run."""
+        for metric in self._metrics.values():
+            metric.reset()
+
+    def to_prometheus(self) -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.extend(f"{name} {value}" for name, value in metric.samples())
+        return "\n".join(lines) + "\n"
+
+    def to_dict(self) -> Dict:
+        """Summarise the metrics."""
+        return {name: metric.summary() for name, metric in self._metrics.items()}
+
+    def write_summary(self, path: str) -> None:
+        """Write the summary of the metrics as JSON."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as summary_file:
+            json.dump(self.to_dict(), summary_file, indent=2)
+        log.info(f"Executor metrics written to {path}.")
+
+    def start_http_server(self, port: int, address: str = "") -> int:
+        """Serve the metrics in the Prometheus format, returning the used port."""
+        registry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = registry.to_prometheus().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((address, port), MetricsHandler)
+        threading.Thread(
+            target=self._server.serve_forever, name="reana-metrics", daemon=True
+        ).start()
+        log.info(f"Serving executor metrics on port {self._server.server_port}.")
+        return self._server.server_port
+
+    def stop_http_server(self) -> None:
+        """Stop serving the metrics."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+class TimedPublisher:
+    """Workflow status publisher recording how long publishing takes."""
+
+    def __init__(self, publisher):
+        """Wrap the publisher."""
+        self.publisher = publisher
+
+    def publish_workflow_status(self, *args, **kwargs):
+        """Publish the workflow status, recording the time it took."""
+        with PUBLISH_LATENCY.time():
+            return self.publisher.publish_workflow_status(*args, **kwargs)
+
+    def __getattr__(self, name):
+        """Forward everything else to the publisher."""
+        return getattr(self.publisher, name)
+
+
+metrics = MetricsRegistry()
+"""Metrics of the current workflow run."""
+
+SUBMIT_LATENCY = metrics.histogram(
+    "reana_snakemake_job_submission_seconds",
+    "Duration of job submission requests to job-controller.",
+)
+STATUS_CHECK_LATENCY = metrics.histogram(
+    "reana_snakemake_job_status_check_seconds",
+    "Duration of job status requests to job-controller.",
+)
+JOB_LIST_LATENCY = metrics.histogram(
+    "reana_snakemake_job_list_seconds",
+    "Duration of requests listing all the jobs of job-controller.",
+)
+POLL_SWEEP_DURATION = metrics.histogram(
+    "reana_snakemake_poll_sweep_seconds",
+    "Duration of the sweeps checking the status of all the active jobs.",
+)
+DETECTION_LAG = metrics.histogram(
+    "reana_snakemake_job_detection_lag_seconds",
+    "Upper bound of the time between a job ending and the engine detecting it.",
+)
+PUBLISH_LATENCY = metrics.histogram(
+    "reana_snakemake_publish_seconds",
+    "Duration of workflow status publications.",
+)
+REPORT_DURATION = metrics.histogram(
+    "reana_snakemake_report_seconds",
+    "Duration of the workflow HTML report generation.",
+    buckets=(1, 5, 10, 30, 60, 300, 600, 1800),
+)
+CHECKPOINT_UPDATE_DURATION = metrics.histogram(
+    "reana_snakemake_checkpoint_dag_update_seconds",
+    "Duration of the DAG updates once checkpoints are finished.",
+)
+ACTIVE_JOBS = metrics.gauge(
+    "reana_snakemake_active_jobs",
+    "Number of jobs submitted to job-controller and not detected as done yet.",
+)
+JOBS_SUBMITTED = metrics.counter(
+    "reana_snakemake_jobs_submitted_total",
+    "Number of jobs submitted to job-controller.",
+)
+JOBS_FINISHED = metrics.counter(
+    "reana_snakemake_jobs_finished_total",
+    "Number of jobs detected as finished.",
+)
+JOBS_FAILED = metrics.counter(
+    "reana_snakemake_jobs_failed_total",
+    "Number of jobs detected as failed or stopped.",
+)
+JOB_CACHE_HITS = metrics.counter(
+    "reana_snakemake_job_cache_hits_total",
+    "Number of jobs whose outputs were restored from the job result cache.",
+)
+JOB_CACHE_MISSES = metrics.counter(
+    "reana_snakemake_job_cache_misses_total",
+    "Number of jobs not found in the job result cache.",
+)
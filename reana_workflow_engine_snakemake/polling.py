@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake job status polling scheduler."""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Tuple
+
+
+class AdaptivePollScheduler:
+    """Decide how long to wait between two job status polling sweeps.
+
+    Polling happens every ``min_interval`` seconds right after jobs are
+    detected as done or submitted while no other job was running, and when
+    running jobs are about to reach the runtime observed for previous jobs of
+    the same rule. Otherwise, the interval grows by ``backoff_factor`` after
+    every sweep, up to ``max_interval`` seconds, so that a steady stream of
+    submissions does not keep polling at the minimum interval.
+
+    The scheduler also keeps track of the completion-to-detection latency saved
+    with respect to polling every ``max_interval`` seconds.
+
+    Waiting for the next sweep can be interrupted from other threads with
+    ``wake_up``, e.g. when job status events are received.
+    """
+
+    def __init__(
+        self, min_interval: float, max_interval: float, backoff_factor: float = 2
+    ):
+        """Initialise the poll scheduler."""
+        self.min_interval = min(min_interval, max_interval)
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self.interval = self.min_interval
+        self.detected_jobs = 0
+        self.saved_latency = 0.0
+        self._lock = threading.Lock()
+        self._deadline = time.monotonic()
+        self._last_sweep = time.monotonic()
+        self._detected_since_sweep = 0
+        self._woken_up = False
+        self._loop = None
+        self._wakeup_event = None
+        # job id -> (rule name, submission time)
+        self._running: Dict[str, Tuple[str, float]] = {}
+        # rule name -> (number of finished jobs, mean runtime)
+        self._runtimes: Dict[str, Tuple[int, float]] = {}
+
+    def job_submitted(self, job_id: str, rule: str) -> None:
+        """Record a submitted job, polling again soon if no other job was running."""
+        now = time.monotonic()
+        with self._lock:
+            idle = not self._running
+            self._running[job_id] = (rule, now)
+            if not idle:
+                return
+            self.interval = self.min_interval
+            self._deadline = min(self._deadline, now + self.min_interval)
+        self._notify()
+
+    def job_done(self, job_id: str, finished: bool = True) -> None:
+        """Record that a job was detected as done in the current sweep."""
+        now = time.monotonic()
+        with self._lock:
+            rule, submitted_at = self._running.pop(job_id, (None, None))
+            if finished and rule is not None:
+                count, mean = self._runtimes.get(rule, (0, 0.0))
+                runtime = now - submitted_at
+                self._runtimes[rule] = (
+                    count + 1,
+                    mean + (runtime - mean) / (count + 1),
+                )
+            self._detected_since_sweep += 1
+
+    def _expected_interval(self, now: float) -> float:
+        """Return the time until the next running job is expected to finish."""
+        expected = self.max_interval
+        for rule, submitted_at in self._running.values():
+            if rule not in self._runtimes:
+                continue
+            remaining = self._runtimes[rule][1] - (now - submitted_at)
+            # jobs running a bit longer than expected are likely to finish soon
+            if remaining < 0 and -remaining < self._runtimes[rule][1]:
+                return self.min_interval
+            if remaining > 0:
+                expected = min(expected, remaining)
+        return expected
+
+    def sweep_done(self) -> float:
+        """Compute the interval until the next sweep once a sweep is done."""
+        now = time.monotonic()
+        with self._lock:
+            if self._detected_since_sweep:
+                # with a fixed interval, a job could have finished up to
+                # `max_interval` seconds before being detected
+                gap = now - self._last_sweep
+                self.detected_jobs += self._detected_since_sweep
+                self.saved_latency += self._detected_since_sweep * max(
+                    0.0, self.max_interval - gap
+                )
+                self.interval = self.min_interval
+                self._detected_since_sweep = 0
+            else:
+                self.interval = min(
+                    self.interval * self.backoff_factor, self._expected_interval(now)
+                )
+            self.interval = max(
+                self.min_interval, min(self.interval, self.max_interval)
+            )
+            self._last_sweep = now
+            self._deadline = now + self.interval
+            return self.interval
+
+    def wake_up(self) -> None:
+        """Interrupt the current wait before job-controller is due for polling."""
+        with self._lock:
+            self._woken_up = True
+        self._notify()
+
+    def _notify(self) -> None:
+        """Make the current wait re-check its deadline."""
+        if self._loop is None:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._wakeup_event.set)
+        except RuntimeError:
+            # the event loop has already been closed
+            pass
+
+    async def wait(self) -> bool:
+        """Sleep until the next sweep.
+
+        Return whether job-controller is due for polling, which is not the case
+        when the wait was interrupted by ``wake_up``.
+        """
+        if self._loop is None:
+            self._wakeup_event = asyncio.Event()
+            self._loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if self._woken_up:
+                    self._woken_up = False
+                    return False
+                remaining = self._deadline - time.monotonic()
+                self._wakeup_event.clear()
+            if remaining <= 0:
+                return True
+            try:
+                await asyncio.wait_for(self._wakeup_event.wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
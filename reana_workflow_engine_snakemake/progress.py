@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake job progress publishing."""
+
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from reana_commons.publisher import WorkflowStatusPublisher
+from reana_commons.utils import build_progress_message
+
+from reana_workflow_engine_snakemake.config import JobStatus, RunStatus
+
+
+class JobProgressAggregator:
+    """Merge job progress updates into fewer workflow status messages.
+
+    Updates are buffered and published together in one progress message once
+    ``max_events`` updates are buffered, or ``max_delay`` seconds after the
+    first buffered update. Failed jobs are published right away, together with
+    the updates buffered before them.
+
+    The totals of the messages count Snakemake jobs, while their job ids are
+    the distinct job-controller ids of the jobs. Jobs of bundles and groups
+    share the id of their REANA job, and jobs run in the workflow engine or
+    restored from the job result cache have none.
+
+    Other workflow status messages are published through the aggregator too,
+    so that a single thread at a time uses the publisher.
+    """
+
+    def __init__(
+        self,
+        publisher: WorkflowStatusPublisher,
+        workflow_uuid: str,
+        max_events: int,
+        max_delay: float,
+    ):
+        """Initialise the job progress aggregator."""
+        self.publisher = publisher
+        self.workflow_uuid = workflow_uuid
+        self.max_events = max_events
+        self.max_delay = max_delay
+        self.events = 0
+        self.messages = 0
+        # status -> (number of jobs, distinct job ids in order)
+        self._updates: Dict[str, Tuple[int, Dict[str, None]]] = {}
+        self._buffered = 0
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        # held while publishing, so that messages are sent in order and the
+        # publisher is not used by the timer and the scheduler at once
+        self._flush_lock = threading.Lock()
+
+    @property
+    def saved_messages(self) -> int:
+        """Return the number of messages saved by merging updates."""
+        return self.events - self.messages
+
+    def add(self, job_status: JobStatus, job_id: Optional[str], count: int = 1) -> None:
+        """Buffer a job progress update, publishing it when due.
+
+        :param job_status: New status of the jobs.
+        :param job_id: Job-controller id of the jobs, if any.
+        :param count: Number of Snakemake jobs run by the job-controller job.
+        """
+        with self._lock:
+            total, job_ids = self._updates.get(job_status.name, (0, {}))
+            if job_id is not None:
+                job_ids[job_id] = None
+            self._updates[job_status.name] = (total + count, job_ids)
+            self.events += 1
+            self._buffered += 1
+            flush = job_status == JobStatus.failed or self._buffered >= self.max_events
+            if not flush and self._timer is None:
+                self._timer = threading.Timer(self.max_delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if flush:
+            self.flush()
+
+    def flush(self) -> None:
+        """Publish all the buffered job progress updates in one message."""
+        with self._flush_lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        with self._lock:
+            updates, self._updates = self._updates, {}
+            self._buffered = 0
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if not updates:
+            return
+        workflow_status = (
+            RunStatus.failed if JobStatus.failed.name in updates else RunStatus.running
+        )
+        progress = {
+            status: {"total": total, "job_ids": list(job_ids)}
+            for status, (total, job_ids) in updates.items()
+        }
+        self.publisher.publish_workflow_status(
+            self.workflow_uuid,
+            workflow_status.value,
+            message={"progress": build_progress_message(**progress)},
+        )
+        self.messages += 1
+
+    def publish_workflow_status(
+        self, workflow_uuid: str, status: int, logs: str = "", message=None
+    ) -> None:
+        """Publish a workflow status after the buffered job progress updates.
+
+        All the messages of the workflow run go through here, as the publisher
+        cannot be used by several threads at once.
+        """
+        with self._flush_lock:
+            self._flush()
+            self.publisher.publish_workflow_status(
+                workflow_uuid, status, logs=logs, message=message
+            )
+
+    def close(self) -> None:
+        """Publish the remaining job progress updates."""
+        self.flush()
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake resuming of interrupted workflow runs."""
+
+import binascii
+import json
+import logging
+import os
+import shutil
+from base64 import urlsafe_b64decode
+from typing import Dict, List, Set, Tuple
+
+from reana_workflow_engine_snakemake.config import LOGGING_MODULE, JobStatus
+
+log = logging.getLogger(LOGGING_MODULE)
+
+# statuses of jobs that can still finish on their own
+ACTIVE_JOB_STATUSES = (
+    JobStatus.created.name,
+    JobStatus.queued.name,
+    JobStatus.started.name,
+    JobStatus.running.name,
+)
+
+
+def _get_snakemake_dir(workflow_workspace: str) -> str:
+    return os.path.join(workflow_workspace, ".snakemake")
+
+
+def read_incomplete_jobs(
+    workflow_workspace: str,
+) -> Dict[str, List[Tuple[str, str]]]:
+    """Read the output files of the jobs Snakemake marked as started.
+
+    Snakemake keeps a record for every output file of the jobs that were
+    started and did not finish yet, holding the job-controller id of the job.
+
+    :return: Mapping of job-controller job ids to the paths of the incomplete
+        output files of the jobs, with the paths of their records. Outputs of
+        jobs whose id was not recorded are mapped to ``None``.
+    """
+    incomplete_dir = os.path.join(_get_snakemake_dir(workflow_workspace), "incomplete")
+    jobs: Dict[str, List[Tuple[str, str]]] = {}
+    for root, _, files in os.walk(incomplete_dir):
+        for name in files:
+            record_path = os.path.join(root, name)
+            # long file names are split in directories prefixed with `@`
+            b64id = "".join(
+                part.lstrip("@")
+                for part in os.path.relpath(record_path, incomplete_dir).split(os.sep)
+            )
+            try:
+                output_file = urlsafe_b64decode(b64id).decode()
+                with open(record_path) as record:
+                    job_id = json.load(record).get("external_jobid")
+            except (binascii.Error, UnicodeDecodeError, ValueError, OSError):
+                # e.g. a record being written
+                continue
+            jobs.setdefault(job_id, []).append((output_file, record_path))
+    return jobs
+
+
+def _remove_records(records, workflow_workspace: str, remove_outputs: bool) -> None:
+    for output_file, record_path in records:
+        if remove_outputs:
+            path = os.path.join(workflow_workspace, output_file)
+            if os.path.isdir(path) and not os.path.islink(path):
+                shutil.rmtree(path, ignore_errors=True)
+            elif os.path.lexists(path):
+                os.remove(path)
+        os.remove(record_path)
+
+
+def prepare_resume(rjc_api_client, workflow_workspace: str) -> Set[str]:
+    """Prepare the workspace of an interrupted workflow run to be run again.
+
+    The jobs that were running when the workflow engine stopped are checked
+    with job-controller:
+
+    - finished jobs are considered done, their outputs are kept;
+    - failed, stopped or unknown jobs have their outputs removed, so that
+      Snakemake runs them again;
+    - jobs that are still active are left as they are, so that the executor
+      follows them instead of submitting them again.
+
+    The Snakemake locks of the interrupted run are removed as well.
+
+    :return: The job-controller ids of the jobs that are still active.
+    """
+    shutil.rmtree(
+        os.path.join(_get_snakemake_dir(workflow_workspace), "locks"),
+        ignore_errors=True,
+    )
+    active_job_ids = set()
+    for job_id, records in read_incomplete_jobs(workflow_workspace).items():
+        status = None
+        if job_id is not None:
+            try:
+                status = rjc_api_client.check_status(job_id).status
+            except Exception as exception:
+                log.warning(f"Could not get the status of job {job_id}: {exception}")
+        if status in ACTIVE_JOB_STATUSES:
+            log.info(f"Job {job_id} is still {status}, following it again.")
+            active_job_ids.add(job_id)
+        elif status == JobStatus.finished.name:
+            log.info(f"Job {job_id} finished while the workflow engine was down.")
+            _remove_records(records, workflow_workspace, remove_outputs=False)
+        else:
+            log.info(f"Job {job_id} is {status or 'unknown'}, it will run again.")
+            _remove_records(records, workflow_workspace, remove_outputs=True)
+    return active_job_ids
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake runtimes of rules and critical paths."""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import uuid
+from typing import Callable, Dict, Iterable, List
+
+from reana_workflow_engine_snakemake.config import LOGGING_MODULE
+
+log = logging.getLogger(LOGGING_MODULE)
+
+# weight of the last observed runtime in the runtime estimate of a rule
+RUNTIME_SMOOTHING = 0.3
+
+# relative change of the runtime estimate of a rule worth prioritising jobs again
+RUNTIME_CHANGE_THRESHOLD = 0.2
+
+
+def get_runtimes_file(
+    runtimes_dir: str, user_id: str, workflow_file: str, rules: Iterable[str]
+) -> str:
+    """Get the file keeping the runtimes of the rules of a user's workflow.
+
+    :param workflow_file: Snakefile of the workflow, relative to the workspace.
+    :param rules: Names of the rules of the workflow.
+    """
+    digest = hashlib.sha256(
+        json.dumps([os.path.normpath(workflow_file), sorted(rules)]).encode()
+    ).hexdigest()
+    return os.path.join(runtimes_dir, user_id or "unknown-user", f"{digest}.json")
+
+
+class RuleRuntimes:
+    """Runtimes of the jobs of each rule, observed by previous workflow runs.
+
+    The runtime of a rule is estimated with an exponential moving average of
+    the runtimes of its jobs, so that it follows changes of the workflow.
+
+    :param path: JSON file keeping the runtimes between workflow runs.
+    """
+
+    def __init__(self, path: str):
+        """Initialise the rule runtimes with the ones saved by previous runs."""
+        self.path = path
+        self._lock = threading.Lock()
+        self._runtimes: Dict[str, Dict] = {}
+        try:
+            with open(path) as runtimes_file:
+                self._runtimes = json.load(runtimes_file)
+        except (OSError, ValueError):
+            pass
+
+    def observe(self, rule: str, runtime: float) -> bool:
+        """Record the runtime of a job of the rule, in seconds.
+
+        :return: Whether the runtime estimate of the rule changed significantly.
+        """
+        with self._lock:
+            known = self._runtimes.get(rule)
+            if known is None:
+                self._runtimes[rule] = {"runtime": runtime, "count": 1}
+                return True
+            change = RUNTIME_SMOOTHING * (runtime - known["runtime"])
+            changed = abs(change) > RUNTIME_CHANGE_THRESHOLD * known["runtime"]
+            known["runtime"] += change
+            known["count"] += 1
+            return changed
+
+    def estimate(self, rule: str) -> float:
+        """Estimate the runtime of a job of the rule.
+
+        Rules that never ran take the mean runtime of the known rules, or one
+        second if none is known, so that critical paths are then the longest
+        chains of jobs.
+        """
+        with self._lock:
+            if rule in self._runtimes:
+                return self._runtimes[rule]["runtime"]
+            runtimes = [known["runtime"] for known in self._runtimes.values()]
+        return sum(runtimes) / len(runtimes) if runtimes else 1.0
+
+    def save(self) -> None:
+        """Save the runtimes for the next workflow runs."""
+        with self._lock:
+            runtimes = json.dumps(self._runtimes, indent=2, sort_keys=True)
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.{uuid.uuid4()}.tmp"
+            with open(tmp_path, "w") as tmp_file:
+                tmp_file.write(runtimes)
+            os.replace(tmp_path, self.path)
+        except OSError as exception:
+            log.warning(f"Could not save the runtimes of the rules: {exception}")
+
+
+def get_remaining_paths(
+    levels: Iterable[Iterable],
+    get_children: Callable[[object], Iterable],
+    get_runtime: Callable[[object], float],
+) -> Dict:
+    """Estimate the longest path from each job to the end of the workflow.
+
+    :param levels: Jobs sorted topologically, as levels of jobs depending only
+        on the jobs of the previous levels.
+    :param get_children: Function giving the jobs depending on a job, jobs
+        missing from ``levels`` are ignored.
+    :param get_runtime: Function estimating the runtime of a job.
+    :return: Runtime of the longest chain of jobs starting with each job.
+    """
+    remaining: Dict = {}
+    reversed_levels: List = list(levels)[::-1]
+    for level in reversed_levels:
+        for job in level:
+            remaining[job] = get_runtime(job) + max(
+                (remaining[child] for child in get_children(job) if child in remaining),
+                default=0.0,
+            )
+    return remaining
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake cache speeding up the start of workflow runs."""
+
+import hashlib
+import json
+import logging
+import os
+import uuid
+from typing import Callable, Dict, Iterable, List, Optional
+
+from snakemake import __version__ as snakemake_version
+from snakemake.parser import Shell
+from snakemake.sourcecache import LocalSourceFile
+
+from reana_workflow_engine_snakemake.cache import get_relative_path
+from reana_workflow_engine_snakemake.config import LOGGING_MODULE
+
+log = logging.getLogger(LOGGING_MODULE)
+
+
+def _write_json(path: str, content: Dict) -> None:
+    """Write the JSON file atomically, so that it is never read half written."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{uuid.uuid4()}.tmp"
+    with open(tmp_path, "w") as tmp_file:
+        json.dump(content, tmp_file)
+    os.replace(tmp_path, path)
+
+
+def _get_sources(workflow_file: str, sources: Iterable[str]) -> List[str]:
+    """Get the Snakefiles of a run, starting with the requested one."""
+    return list(dict.fromkeys([os.path.normpath(workflow_file), *sources]))
+
+
+def _read_json(path: str) -> Optional[Dict]:
+    try:
+        with open(path) as json_file:
+            return json.load(json_file)
+    except (OSError, ValueError):
+        return None
+
+
+class StartupCache:
+    """Cache of the work done by Snakemake before running the first job.
+
+    - Parsed Snakefiles are kept by content, so that they are not parsed again
+      by later runs.
+    - The state of the workspace after the last successful run is recorded,
+      so that the DAG does not have to be built again when nothing changed:
+      the requested Snakefile and its includes, the workflow parameters, the
+      engine configuration, the config files and the input and output files of
+      the jobs by size and modification time, and the names of the files in
+      the directories of the latter, e.g. new samples found with
+      ``glob_wildcards``. The rest of the workspace is not looked at, so that
+      checking its state costs less than building the DAG.
+
+    :param cache_dir: Directory where the cache is kept, which can be shared by
+        the runs of different workspaces.
+    :param excluded_paths: Paths relative to the workspace that are not part of
+        its state, e.g. the Snakemake metadata and the workflow report.
+    """
+
+    def __init__(self, cache_dir: str, excluded_paths: Iterable[str] = ()):
+        """Initialise the startup cache."""
+        self.cache_dir = cache_dir
+        self.excluded_paths = {os.path.normpath(path) for path in excluded_paths}
+        # Snakefiles parsed during the workflow run
+        self.sources: List[str] = []
+
+    def _get_last_run_file(self, workflow_workspace: str) -> str:
+        workspace_hash = hashlib.sha256(workflow_workspace.encode()).hexdigest()
+        return os.path.join(self.cache_dir, "runs", f"{workspace_hash}.json")
+
+    def wrap_parse(self, parse: Callable) -> Callable:
+        """Make ``snakemake.parser.parse`` reuse the already parsed Snakefiles."""
+
+        def cached_parse(path, workflow, overwrite_shellcmd=None, rulecount=0):
+            if not isinstance(path, LocalSourceFile):
+                return parse(path, workflow, overwrite_shellcmd, rulecount)
+            self.sources.append(path.get_path_or_uri())
+            with open(path.get_path_or_uri(), "rb") as snakefile:
+                digest = hashlib.sha256(snakefile.read())
+            digest.update(
+                json.dumps(
+                    [snakemake_version, path.get_path_or_uri(), overwrite_shellcmd]
+                ).encode()
+            )
+            cache_file = os.path.join(
+                self.cache_dir, "parse", f"{digest.hexdigest()}-{rulecount}.json"
+            )
+            cached = _read_json(cache_file)
+            if cached:
+                # set as a side effect of parsing
+                Shell.overwrite_cmd = overwrite_shellcmd
+                linemap = {int(line): orig for line, orig in cached["linemap"].items()}
+                return cached["code"], linemap, cached["rulecount"]
+            code, linemap, rulecount = parse(
+                path, workflow, overwrite_shellcmd, rulecount
+            )
+            _write_json(
+                cache_file,
+                {"code": code, "linemap": linemap, "rulecount": rulecount},
+            )
+            return code, linemap, rulecount
+
+        return cached_parse
+
+    def _is_excluded(self, path: str) -> bool:
+        return any(
+            path == excluded or path.startswith(excluded + os.sep)
+            for excluded in self.excluded_paths
+        )
+
+    def _get_workspace_state(
+        self,
+        workflow_workspace: str,
+        sources: List[str],
+        files: List[str],
+        run_config: Dict,
+    ) -> str:
+        """Hash everything the DAG of the workflow depends on."""
+        digest = hashlib.sha256(
+            json.dumps(
+                [snakemake_version, sources, files, run_config],
+                sort_keys=True,
+                default=str,
+            ).encode()
+        )
+        for source in sources:
+            with open(os.path.join(workflow_workspace, source), "rb") as source_file:
+                digest.update(hashlib.sha256(source_file.read()).digest())
+        directories = set()
+        for path in files:
+            absolute_path = os.path.join(workflow_workspace, path)
+            directories.add(os.path.dirname(absolute_path))
+            try:
+                stat = os.stat(absolute_path)
+            except FileNotFoundError:
+                digest.update(f"{path}\0missing\0".encode())
+                continue
+            digest.update(f"{path}\0{stat.st_size}\0{stat.st_mtime_ns}\0".encode())
+        for directory in sorted(directories):
+            relative_directory = get_relative_path(directory, workflow_workspace)
+            try:
+                names = sorted(os.listdir(directory))
+            except FileNotFoundError:
+                names = []
+            if relative_directory is not None:
+                names = [
+                    name
+                    for name in names
+                    if not self._is_excluded(
+                        os.path.normpath(os.path.join(relative_directory, name))
+                    )
+                ]
+            digest.update(json.dumps([directory, names]).encode())
+        return digest.hexdigest()
+
+    def is_up_to_date(
+        self,
+        workflow_workspace: str,
+        workflow_file: str,
+        workflow_parameters: Dict,
+        engine_config: Dict,
+    ) -> bool:
+        """Check whether nothing changed since the last successful run.
+
+        :param workflow_file: Snakefile of the run, relative to the workspace.
+        :param engine_config: Configuration of the engine changing the jobs of
+            the workflow, e.g. the default container image.
+        """
+        last_run = _read_json(self._get_last_run_file(workflow_workspace))
+        if not last_run:
+            return False
+        try:
+            state = self._get_workspace_state(
+                workflow_workspace,
+                _get_sources(workflow_file, last_run["sources"]),
+                last_run["files"],
+                [workflow_file, workflow_parameters, engine_config],
+            )
+        except (OSError, KeyError) as exception:
+            # e.g. an included Snakefile was removed
+            log.debug(f"Could not check the last workflow run: {exception}")
+            return False
+        return state == last_run["state"]
+
+    def record_run(
+        self,
+        workflow_workspace: str,
+        workflow_file: str,
+        workflow_parameters: Dict,
+        engine_config: Dict,
+        files: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Record the state of the workspace after a successful run.
+
+        :param files: Files the DAG of the workflow depends on, i.e. the config
+            files and the input and output files of its jobs. Those of the last
+            run are kept when not given, e.g. when no job had to run, and the
+            run is not recorded if there is none.
+        """
+        sources = _get_sources(
+            workflow_file,
+            [os.path.relpath(source, workflow_workspace) for source in self.sources],
+        )
+        if files is None:
+            last_run = _read_json(self._get_last_run_file(workflow_workspace))
+            if not last_run or "files" not in last_run:
+                log.debug("Not recording the workflow run, its files are unknown.")
+                return
+            files = last_run["files"]
+        else:
+            files = sorted({os.path.normpath(str(path)) for path in files})
+        try:
+            state = self._get_workspace_state(
+                workflow_workspace,
+                sources,
+                files,
+                [workflow_file, workflow_parameters, engine_config],
+            )
+        except OSError as exception:
+            log.warning(f"Could not record the workflow run: {exception}")
+            return
+        _write_json(
+            self._get_last_run_file(workflow_workspace),
+            {"sources": sources, "files": files, "state": state},
+        )
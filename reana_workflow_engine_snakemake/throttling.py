@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake throttling of job submissions."""
+
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Tuple
+
+from bravado.exception import HTTPError
+from requests.exceptions import ConnectionError, ConnectTimeout, Timeout
+
+# job-controller responses meaning that it cannot take more requests for now
+OVERLOAD_STATUS_CODES = (429, 502, 503, 504)
+
+# job-controller responses meaning that it did not take the request at all
+RETRY_STATUS_CODES = (429, 503)
+
+DEFAULT_COMPUTE_BACKEND = "kubernetes"
+"""Compute backend of the jobs not asking for one."""
+
+
+def parse_limits(limits: str) -> Dict[str, int]:
+    """Parse limits given as ``name:limit`` pairs separated by commas."""
+    parsed = {}
+    for limit in filter(None, (limit.strip() for limit in limits.split(","))):
+        name, _, value = limit.partition(":")
+        parsed[name.strip()] = int(value)
+    return parsed
+
+
+def is_overload_error(exception: Exception) -> bool:
+    """Check whether a request failed because job-controller is overloaded."""
+    if isinstance(exception, HTTPError):
+        return exception.status_code in OVERLOAD_STATUS_CODES
+    return isinstance(exception, (ConnectionError, Timeout))
+
+
+def is_retriable_error(exception: Exception) -> bool:
+    """Check whether a submission failed before job-controller took it.
+
+    Submissions are not idempotent, so they are only sent again when it is
+    certain that no job was created. Jobs may have been created when the
+    response was lost, for instance on read timeouts or gateway errors.
+    """
+    if isinstance(exception, HTTPError):
+        return exception.status_code in RETRY_STATUS_CODES
+    return isinstance(exception, ConnectTimeout)
+
+
+class SubmissionThrottle:
+    """Limit the jobs in flight and slow down submissions under load.
+
+    Every submitted job takes a slot of its compute backend and of each of its
+    rules until it is done, group jobs running several rules. Jobs that would
+    go over the limit of their backend or of one of their rules are queued,
+    and dispatched once other jobs release their slots.
+
+    Submissions are delayed when job-controller takes longer than
+    ``latency_target`` seconds to accept jobs or reports to be overloaded. The
+    delay doubles on every slow submission, up to ``max_delay`` seconds, and is
+    halved on every fast one.
+
+    :param dispatch: Function submitting the queued items once they can go.
+    :param backend_limits: Maximum number of jobs in flight per compute
+        backend, no limit for missing backends or limits of 0.
+    """
+
+    def __init__(
+        self,
+        dispatch: Callable,
+        backend_limits: Dict[str, int],
+        latency_target: float,
+        max_delay: float,
+        min_delay: float = 0.1,
+    ):
+        """Initialise the submission throttle."""
+        self.dispatch = dispatch
+        self.backend_limits = backend_limits
+        self.latency_target = latency_target
+        self.max_delay = max_delay
+        self.min_delay = min(min_delay, max_delay)
+        self.delay = 0.0
+        self.overloads = 0
+        self.max_queued = 0
+        self._lock = threading.Lock()
+        # (compute backend, rules) of the slots, by id of the object holding them
+        self._slots: Dict[int, Tuple[str, Tuple[str, ...]]] = {}
+        # number of items holding slots, by ("backend", name) and ("rule", name)
+        self._in_flight: Dict[Tuple[str, str], int] = {}
+        self._rule_limits: Dict[str, int] = {}
+        self._queues: Dict[Tuple[str, Tuple[str, ...]], Deque] = {}
+        self._queued = 0
+
+    def _fits(self, backend: str, rules: Tuple[str, ...]) -> bool:
+        backend_limit = self.backend_limits.get(backend, 0)
+        if backend_limit and self._in_flight.get(("backend", backend), 0) >= (
+            backend_limit
+        ):
+            return False
+        for rule in rules:
+            rule_limit = self._rule_limits.get(rule, 0)
+            if rule_limit and self._in_flight.get(("rule", rule), 0) >= rule_limit:
+                return False
+        return True
+
+    def _take(self, key_object, backend: str, rules: Tuple[str, ...]) -> None:
+        self._slots[id(key_object)] = (backend, rules)
+        for key in [("backend", backend)] + [("rule", rule) for rule in rules]:
+            self._in_flight[key] = self._in_flight.get(key, 0) + 1
+
+    def admit(
+        self, item, key_object, compute_backend: str, rule_limits: Dict[str, int]
+    ) -> bool:
+        """Take a slot for the item, or queue it if there is none left.
+
+        :param item: What is dispatched once queued items can go.
+        :param key_object: Object holding the slot until it is released.
+        :param rule_limits: Maximum number of jobs in flight of each rule run by
+            the item, no limit for limits of 0.
+        :return: Whether the item can be submitted right away.
+        """
+        backend = compute_backend or DEFAULT_COMPUTE_BACKEND
+        rules = tuple(sorted(rule_limits))
+        with self._lock:
+            for rule, rule_limit in rule_limits.items():
+                if rule_limit:
+                    self._rule_limits[rule] = rule_limit
+            queue = self._queues.get((backend, rules))
+            if not queue and self._fits(backend, rules):
+                self._take(key_object, backend, rules)
+                return True
+            self._queues.setdefault((backend, rules), deque()).append(
+                (item, key_object)
+            )
+            self._queued += 1
+            self.max_queued = max(self.max_queued, self._queued)
+            return False
+
+    def release(self, key_object) -> None:
+        """Release the slot held by a job, dispatching the queued items that fit."""
+        to_dispatch = []
+        with self._lock:
+            slot = self._slots.pop(id(key_object), None)
+            if slot is None:
+                return
+            self._in_flight[("backend", slot[0])] -= 1
+            for rule in slot[1]:
+                self._in_flight[("rule", rule)] -= 1
+            for (backend, rules), queue in list(self._queues.items()):
+                while queue and self._fits(backend, rules):
+                    item, queued_key_object = queue.popleft()
+                    self._take(queued_key_object, backend, rules)
+                    self._queued -= 1
+                    to_dispatch.append(item)
+                if not queue:
+                    del self._queues[(backend, rules)]
+        for item in to_dispatch:
+            self.dispatch(item)
+
+    def record_submission(self, latency: float, overloaded: bool = False) -> None:
+        """Adapt the submission delay to how job-controller handled a submission."""
+        with self._lock:
+            if overloaded:
+                self.overloads += 1
+            if overloaded or latency > self.latency_target:
+                self.delay = min(self.max_delay, max(self.min_delay, self.delay * 2))
+            elif self.delay > self.min_delay:
+                self.delay /= 2
+            else:
+                self.delay = 0.0
+
+    def wait(self) -> None:
+        """Wait before submitting, if job-controller is under load."""
+        delay = self.delay
+        if delay:
+            time.sleep(delay)
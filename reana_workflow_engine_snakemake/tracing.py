@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake tracing of the lifecycle of jobs."""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+from reana_workflow_engine_snakemake.config import LOGGING_MODULE
+
+log = logging.getLogger(LOGGING_MODULE)
+
+JOB_EVENTS = ("ready", "run", "submitted", "started", "finished", "detected", "done")
+"""Events of the lifecycle of a job, in order."""
+
+PHASES = {
+    "run": "scheduling",
+    "submitted": "submission",
+    "started": "queueing",
+    "finished": "execution",
+    "detected": "detection",
+    "done": "callback",
+}
+"""Phase of the lifecycle of a job ending with each event."""
+
+
+class TracedJob:
+    """Times of the lifecycle events of a job."""
+
+    __slots__ = ("jobid", "name", "dependencies", "job_id", "events")
+
+    def __init__(self, jobid, name: str, dependencies: List):
+        """Initialise the traced job."""
+        self.jobid = jobid
+        self.name = name
+        self.dependencies = dependencies
+        self.job_id: Optional[str] = None
+        self.events: Dict[str, float] = {}
+
+
+class JobTracer:
+    """Record when each job goes through the steps of its lifecycle.
+
+    - ``ready``: the last job it depends on is done, or the run started.
+    - ``run``: Snakemake asks the executor to run it.
+    - ``submitted``: job-controller accepted it.
+    - ``started``: job-controller was first seen running it.
+    - ``finished``: job-controller finished it. Unless a job status event
+      said so, the last time the job was seen active, or else its submission,
+      is used, so that the detection phase is an upper bound.
+    - ``detected``: the executor found out that it is done.
+    - ``done``: Snakemake handled its end.
+
+    Events of job-controller are recorded by job-controller id, as the jobs of
+    a bundle share it.
+    """
+
+    def __init__(self, enabled: bool = True):
+        """Initialise the job tracer."""
+        self.enabled = enabled
+        self.start = time.time()
+        self._lock = threading.Lock()
+        self._jobs: Dict = {}
+        # jobs of Snakemake groups are traced as their group
+        self._groups: Dict = {}
+        self._job_id_events: Dict[str, Dict[str, float]] = {}
+
+    def add_job(self, job, dependencies: Iterable) -> None:
+        """Start tracing a job that Snakemake asked to run."""
+        if not self.enabled:
+            return
+        now = time.time()
+        with self._lock:
+            if job.is_group():
+                for member in job:
+                    self._groups[member] = job
+            traced = TracedJob(job.jobid, job.name, list(dependencies))
+            traced.events["run"] = now
+            self._jobs[job] = traced
+
+    def record(self, jobs: Iterable, event: str, job_id: Optional[str] = None) -> None:
+        """Record an event of the given jobs, with their job-controller id."""
+        if not self.enabled:
+            return
+        now = time.time()
+        with self._lock:
+            for job in jobs:
+                traced = self._jobs.get(job)
+                if traced is None:
+                    continue
+                traced.events[event] = now
+                if job_id:
+                    traced.job_id = job_id
+
+    def record_job_id(self, job_id: str, event: str, overwrite: bool = True) -> None:
+        """Record an event of job-controller about one of its jobs."""
+        if not self.enabled:
+            return
+        now = time.time()
+        with self._lock:
+            events = self._job_id_events.setdefault(job_id, {})
+            if overwrite or event not in events:
+                events[event] = now
+
+    def _get_events(self, traced: TracedJob) -> Dict[str, float]:
+        """Get the events of a job, in order and never going back in time."""
+        events = dict(traced.events)
+        job_id_events = self._job_id_events.get(traced.job_id, {})
+        if "started" in job_id_events:
+            events["started"] = job_id_events["started"]
+        finished = job_id_events.get("finished", job_id_events.get("seen_active"))
+        if finished or "submitted" in events:
+            events["finished"] = finished or events["submitted"]
+        ordered, last = {}, self.start
+        for event in JOB_EVENTS:
+            if event in events:
+                last = ordered[event] = max(events[event], last)
+        return ordered
+
+    def _get_dependencies(self, job, jobs: Dict) -> List:
+        """Get the traced jobs done that the job depends on."""
+        dependencies = (
+            self._groups.get(dependency, dependency)
+            for dependency in self._jobs[job].dependencies
+        )
+        return [
+            dependency
+            for dependency in dependencies
+            if dependency is not job and "done" in jobs.get(dependency, {})
+        ]
+
+    def _get_job_events(self) -> Dict:
+        """Get the events of all the jobs, with when they were ready."""
+        with self._lock:
+            jobs = {job: self._get_events(traced) for job, traced in self._jobs.items()}
+        for job, events in jobs.items():
+            ready = max(
+                (jobs[dep]["done"] for dep in self._get_dependencies(job, jobs)),
+                default=self.start,
+            )
+            jobs[job] = {"ready": min(ready, events["run"]), **events}
+        return jobs
+
+    @staticmethod
+    def _get_phases(events: Dict[str, float]) -> Dict[str, float]:
+        """Get the time spent in each phase, ending with the next recorded event."""
+        phases, times = {}, list(events.items())
+        for (_, previous), (event, now) in zip(times, times[1:]):
+            phases[PHASES[event]] = now - previous
+        return phases
+
+    def summarise(self) -> Dict:
+        """Find the critical path of the run and the time of each phase along it.
+
+        The critical path goes back from the last job done, through the
+        dependency done last of each job, i.e. the one that made it ready.
+        """
+        jobs = {
+            job: events
+            for job, events in self._get_job_events().items()
+            if "done" in events
+        }
+        path, job = [], max(jobs, key=lambda job: jobs[job]["done"], default=None)
+        while job is not None:
+            path.append(job)
+            job = max(
+                self._get_dependencies(job, jobs),
+                key=lambda dep: jobs[dep]["done"],
+                default=None,
+            )
+        path.reverse()
+
+        phase_totals = dict.fromkeys(PHASES.values(), 0.0)
+        path_phases = dict.fromkeys(PHASES.values(), 0.0)
+        critical_path = []
+        for job, events in jobs.items():
+            for phase, duration in self._get_phases(events).items():
+                phase_totals[phase] += duration
+        for job in path:
+            phases = self._get_phases(jobs[job])
+            for phase, duration in phases.items():
+                path_phases[phase] += duration
+            critical_path.append(
+                {
+                    "jobid": self._jobs[job].jobid,
+                    "rule": self._jobs[job].name,
+                    "job_id": self._jobs[job].job_id,
+                    "phases": phases,
+                }
+            )
+        return {
+            "jobs": len(jobs),
+            "makespan": jobs[path[-1]]["done"] - self.start if path else 0.0,
+            "critical_path": {"jobs": critical_path, "phases": path_phases},
+            "phases": phase_totals,
+        }
+
+    def to_chrome_trace(self) -> Dict:
+        """Get the job phases in the Chrome trace event format, e.g. for Perfetto."""
+        jobs = self._get_job_events()
+        trace_events = [
+            {"name": "process_name", "ph": "M", "pid": 1, "args": {"name": "workflow"}}
+        ]
+        for tid, (job, events) in enumerate(jobs.items(), 1):
+            traced = self._jobs[job]
+            trace_events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": 1,
+                    "tid": tid,
+                    "args": {"name": f"{traced.name} ({traced.jobid})"},
+                }
+            )
+            times = list(events.items())
+            for (_, previous), (event, now) in zip(times, times[1:]):
+                trace_events.append(
+                    {
+                        "name": PHASES[event],
+                        "cat": traced.name,
+                        "ph": "X",
+                        "pid": 1,
+                        "tid": tid,
+                        "ts": (previous - self.start) * 1e6,
+                        "dur": (now - previous) * 1e6,
+                        "args": {"jobid": str(traced.jobid), "job_id": traced.job_id},
+                    }
+                )
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def write(self, path: str) -> Dict:
+        """Write the trace, and its summary next to it, returning the summary."""
+        summary = self.summarise()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as trace_file:
+            json.dump(self.to_chrome_trace(), trace_file)
+        with open(f"{os.path.splitext(path)[0]}.summary.json", "w") as summary_file:
+            json.dump(summary, summary_file, indent=2)
+        path_phases = summary["critical_path"]["phases"]
+        log.info(
+            f"Job trace written to {path}. Critical path of "
+            f"{len(summary['critical_path']['jobs'])} jobs took "
+            f"{summary['makespan']:.1f}s: "
+            + ", ".join(
+                f"{phase} {duration:.1f}s"
+                for phase, duration in path_phases.items()
+                if duration
+            )
+        )
+        return summary
@@ -8,18 +8,37 @@
 
 """REANA-Workflow-Engine-Snakemake utilities."""
 
+import os
+
 from reana_commons.publisher import WorkflowStatusPublisher
 from reana_commons.utils import build_progress_message
-from snakemake.jobs import Job
+
+
+def truncate_command(command: str, max_length: int) -> str:
+    """Shorten a command to be logged to its first ``max_length`` characters."""
+    if not max_length or len(command) <= max_length:
+        return command
+    return f"{command[:max_length]}... ({len(command) - max_length} more characters)"
+
+
+def get_workspace_user(workflow_workspace: str) -> str:
+    """Get the id of the user owning a workspace, or ``""`` if unknown.
+
+    REANA workspaces are kept in ``users/<user id>/workflows/<workflow id>``.
+    """
+    workflows_dir = os.path.dirname(os.path.normpath(workflow_workspace))
+    user_dir = os.path.dirname(workflows_dir)
+    if os.path.basename(workflows_dir) != "workflows" or (
+        os.path.basename(os.path.dirname(user_dir)) != "users"
+    ):
+        return ""
+    return os.path.basename(user_dir)
 
 
 def publish_workflow_start(
-    workflow_uuid: str, publisher: WorkflowStatusPublisher, job: Job
+    workflow_uuid: str, publisher: WorkflowStatusPublisher, job_count: int
 ):
     """Publish to MQ the start of the workflow."""
-    job_count = len(
-        [j for j in (job.dag._needrun | job.dag._finished) if not j.rule.norun]
-    )
     total_jobs = {"total": job_count, "job_ids": []}
     status_running = 1
     publisher.publish_workflow_status(
@@ -27,16 +46,3 @@ def publish_workflow_start(
         status=status_running,
         message={"progress": build_progress_message(total=total_jobs)},
     )
-
-
-def publish_job_submission(
-    workflow_uuid: str, publisher: WorkflowStatusPublisher, reana_job_id: str
-):
-    """Publish to MQ the job submission."""
-    running_jobs = {"total": 1, "job_ids": [reana_job_id]}
-    status_running = 1
-    publisher.publish_workflow_status(
-        workflow_uuid,
-        status=status_running,
-        message={"progress": build_progress_message(running=running_jobs)},
-    )
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Pytest configuration for REANA-Workflow-Engine-Snakemake."""
+
+from __future__ import absolute_import, print_function
+
+import subprocess
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from reana_workflow_engine_snakemake import executor
+
+
+class StubJobControllerAPIClient:
+    """In-process replacement of ``JobControllerAPIClient``.
+
+    Jobs are run synchronously with ``subprocess`` when submitted, so that
+    their outputs exist in the workspace by the time Snakemake checks them.
+    Listing all jobs at once is only available when ``list_jobs`` is set,
+    mimicking the requests sent with the HTTP client of the bravado client,
+    and batch submission only when ``submit_batch`` is set.
+    """
+
+    def __init__(
+        self, status_latency=0, submit_latency=0, list_jobs=False, submit_batch=False
+    ):
+        """Initialise the stub job controller."""
+        self.status_latency = status_latency
+        self.submit_latency = submit_latency
+        self.statuses = {}
+        self.submit_calls = 0
+        self.check_status_calls = 0
+        self.get_jobs_calls = 0
+        self.submit_batch_calls = 0
+        self._lock = threading.Lock()
+        self._client = object()
+        if list_jobs:
+            self._client = SimpleNamespace(
+                swagger_spec=SimpleNamespace(
+                    api_url="http://job-controller",
+                    http_client=SimpleNamespace(request=self._request),
+                )
+            )
+        if submit_batch:
+            self.submit_batch = self._submit_batch
+
+    def submit(self, **job_request_body):
+        """Run the job command and record its final status."""
+        with self._lock:
+            self.submit_calls += 1
+        time.sleep(self.submit_latency)
+        return {"job_id": self._run_job(job_request_body)}
+
+    def _submit_batch(self, job_request_bodies):
+        """Run the commands of many jobs and record their final statuses."""
+        with self._lock:
+            self.submit_batch_calls += 1
+        time.sleep(self.submit_latency)
+        return [{"job_id": self._run_job(body)} for body in job_request_bodies]
+
+    def _run_job(self, job_request_body):
+        """Run the job command and record its final status."""
+        with self._lock:
+            job_id = f"job-{len(self.statuses) + 1}"
+            self.statuses[job_id] = "running"
+        returncode = subprocess.run(job_request_body["cmd"], shell=True).returncode
+        self.statuses[job_id] = "finished" if returncode == 0 else "failed"
+        return job_id
+
+    def check_status(self, job_id):
+        """Return the status of a job after the configured latency."""
+        with self._lock:
+            self.check_status_calls += 1
+        time.sleep(self.status_latency)
+        return SimpleNamespace(status=self.statuses[job_id])
+
+    def _request(self, request_params):
+        """Return all jobs after the configured latency, as a bravado future."""
+        assert request_params == {"method": "GET", "url": "http://job-controller/jobs"}
+        with self._lock:
+            self.get_jobs_calls += 1
+        time.sleep(self.status_latency)
+        jobs = {
+            job_id: {"job_id": job_id, "status": status}
+            for job_id, status in self.statuses.items()
+        }
+        response = SimpleNamespace(json=lambda: {"jobs": jobs})
+        return SimpleNamespace(result=lambda timeout=None: response)
+
+
+class StubWorkflowStatusPublisher:
+    """In-memory replacement of ``WorkflowStatusPublisher``."""
+
+    def __init__(self):
+        """Initialise the stub publisher."""
+        self.messages = []
+
+    def publish_workflow_status(self, workflow_uuid, status, logs="", message=None):
+        """Record the published message."""
+        self.messages.append(
+            {
+                "workflow_uuid": workflow_uuid,
+                "status": status,
+                "logs": logs,
+                "message": message,
+            }
+        )
+
+
+@pytest.fixture
+def workflow_workspace(tmp_path, monkeypatch):
+    """Workspace with a Snakefile scattering over a few samples."""
+    (tmp_path / "Snakefile").write_text(
+        "rule all:\n"
+        '    input: expand("{sample}.txt", sample=range(config.get("samples", 5)))\n'
+        "\n"
+        "rule sample:\n"
+        '    output: "{sample}.txt"\n'
+        '    shell: "echo {wildcards.sample} > {output}"\n'
+    )
+    monkeypatch.setenv("workflow_workspace", str(tmp_path))
+    monkeypatch.setenv("workflow_uuid", "workflow-uuid")
+    monkeypatch.setattr(executor, "POLL_JOBS_STATUS_SLEEP_IN_SECONDS", 0.1)
+    monkeypatch.setattr(executor, "POLL_JOBS_STATUS_MIN_SLEEP_IN_SECONDS", 0.05)
+    return tmp_path
+
+
+@pytest.fixture
+def run_workflow(workflow_workspace):
+    """Run the workspace Snakefile with the REANA executor and stub services."""
+
+    def _run_workflow(
+        rjc_api_client,
+        publisher=None,
+        workflow_parameters=None,
+        operational_options=None,
+    ):
+        return executor.run_jobs(
+            rjc_api_client,
+            publisher or StubWorkflowStatusPublisher(),
+            str(workflow_workspace),
+            "Snakefile",
+            workflow_parameters or {},
+            operational_options=operational_options or {},
+        )
+
+    return _run_workflow
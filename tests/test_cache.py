@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake job result cache tests."""
+
+from __future__ import absolute_import, print_function
+
+import os
+
+import pytest
+
+from conftest import StubJobControllerAPIClient, StubWorkflowStatusPublisher
+from reana_workflow_engine_snakemake import executor
+from reana_workflow_engine_snakemake.cache import MANIFEST_FILE, JobResultCache
+
+SCRIPT = 'cat "$1" && echo "$2"\n'
+
+IMAGE = "docker://docker.io/library/python@sha256:" + "0" * 64
+
+SNAKEFILE = (
+    "rule all:\n"
+    '    input: expand("{sample}.txt", sample=range(3))\n'
+    "\n"
+    "rule sample:\n"
+    '    input: "data.txt"\n'
+    '    output: "{sample}.txt"\n'
+    "    resources: job_cache=1\n"
+    f'    container: "{IMAGE}"\n'
+    '    shell: "sh ./sample.sh {input} {wildcards.sample} > {output}"\n'
+)
+
+
+@pytest.fixture
+def run_in_workspace(tmp_path, monkeypatch):
+    """Run the workflow in a new workspace, with the job result cache enabled."""
+    monkeypatch.setattr(executor, "SNAKEMAKE_JOB_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(executor, "POLL_JOBS_STATUS_MIN_SLEEP_IN_SECONDS", 0.05)
+    monkeypatch.setenv("workflow_uuid", "workflow-uuid")
+
+    def _run_in_workspace(
+        name, data, user="user-1", snakefile=SNAKEFILE, script=SCRIPT
+    ):
+        workspace = tmp_path / "users" / user / "workflows" / name
+        workspace.mkdir(parents=True)
+        (workspace / "Snakefile").write_text(snakefile)
+        (workspace / "sample.sh").write_text(script)
+        (workspace / "data.txt").write_text(data)
+        monkeypatch.setenv("workflow_workspace", str(workspace))
+        rjc_api_client = StubJobControllerAPIClient()
+        assert executor.run_jobs(
+            rjc_api_client,
+            StubWorkflowStatusPublisher(),
+            str(workspace),
+            "Snakefile",
+            {},
+            operational_options={"report_mode": "skip"},
+        )
+        return workspace, rjc_api_client
+
+    return _run_in_workspace
+
+
+def test_job_results_reused_across_runs(run_in_workspace):
+    """Test that identical jobs of another run are restored from the cache."""
+    _, rjc_api_client = run_in_workspace("first", "data\n")
+    assert rjc_api_client.submit_calls == 3
+
+    workspace, rjc_api_client = run_in_workspace("second", "data\n")
+    assert rjc_api_client.submit_calls == 0
+    assert (workspace / "2.txt").read_text() == "data\n2\n"
+
+    # jobs whose inputs changed run again
+    workspace, rjc_api_client = run_in_workspace("third", "other data\n")
+    assert rjc_api_client.submit_calls == 3
+    assert (workspace / "2.txt").read_text() == "other data\n2\n"
+
+
+def test_job_results_dependencies(run_in_workspace):
+    """Test that jobs whose script changed, or of other users, run again."""
+    run_in_workspace("first", "data\n")
+
+    _, rjc_api_client = run_in_workspace("other-user", "data\n", user="user-2")
+    assert rjc_api_client.submit_calls == 3
+
+    workspace, rjc_api_client = run_in_workspace(
+        "changed-script", "data\n", script='cat "$1" && echo "sample $2"\n'
+    )
+    assert rjc_api_client.submit_calls == 3
+    assert (workspace / "2.txt").read_text() == "data\nsample 2\n"
+
+
+@pytest.mark.parametrize(
+    "snakefile",
+    [
+        SNAKEFILE.replace("    resources: job_cache=1\n", ""),
+        SNAKEFILE.replace(IMAGE, "docker://docker.io/library/python:3.12"),
+    ],
+)
+def test_jobs_not_cached(run_in_workspace, snakefile):
+    """Test that jobs not opting in, or with images behind tags, are not cached."""
+    run_in_workspace("first", "data\n", snakefile=snakefile)
+    _, rjc_api_client = run_in_workspace("second", "data\n", snakefile=snakefile)
+    assert rjc_api_client.submit_calls == 3
+
+
+def test_least_recently_used_results_evicted(tmp_path):
+    """Test that the least recently used results are evicted when over size."""
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    (workspace / "output.txt").write_text("0123456789")
+    cache = JobResultCache(str(tmp_path / "cache"), max_size=35, link_mode="copy")
+    for age, key in enumerate(("key-a", "key-b", "key-c")):
+        cache.store(key, ["output.txt"], str(workspace))
+        manifest = os.path.join(cache._get_entry_dir(key), MANIFEST_FILE)
+        os.utime(manifest, (1000 + age, 1000 + age))
+    # using results makes them the most recently used
+    assert cache.restore("key-a", ["output.txt"], str(workspace))
+
+    cache.store("key-d", ["output.txt"], str(workspace))
+    assert not cache.restore("key-b", ["output.txt"], str(workspace))
+    assert cache.restore("key-a", ["output.txt"], str(workspace))
+    assert cache.stats == {"hits": 2, "misses": 1, "stores": 4, "evictions": 1}
+
+
+@pytest.mark.parametrize("link_mode", ["reflink", "copy"])
+def test_cached_results_not_shared_with_workspaces(tmp_path, link_mode):
+    """Test that changes to stored or restored outputs do not reach the cache."""
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    output = workspace / "output.txt"
+    output.write_text("0123456789")
+    cache = JobResultCache(str(tmp_path / "cache"), max_size=100, link_mode=link_mode)
+    cache.store("key", ["output.txt"], str(workspace))
+    cached_output = os.path.join(cache._get_entry_dir("key"), "outputs", "output.txt")
+    os.utime(cached_output, (1000, 1000))
+
+    with open(output, "r+") as output_file:
+        output_file.write("changed")
+    assert cache.restore("key", ["output.txt"], str(workspace))
+    assert output.read_text() == "0123456789"
+    assert output.stat().st_mtime > 1000
+    assert os.path.getmtime(cached_output) == 1000
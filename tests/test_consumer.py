@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake job status consumer tests."""
+
+from __future__ import absolute_import, print_function
+
+import time
+
+from kombu import Connection
+from reana_commons import consumer
+from reana_commons.publisher import BasePublisher
+
+from conftest import StubJobControllerAPIClient
+from reana_workflow_engine_snakemake import executor
+from reana_workflow_engine_snakemake.consumer import (
+    JobStatusConsumer,
+    JobStatusEvents,
+    get_job_status_queue,
+)
+
+
+class EventPublishingJobControllerAPIClient(StubJobControllerAPIClient):
+    """Stub job controller publishing job status events instead of being polled."""
+
+    def __init__(self, queue):
+        """Initialise the stub job controller and its event publisher."""
+        super().__init__()
+        self.queue = queue
+
+    def submit(self, **job_request_body):
+        """Run the job and publish its final status."""
+        response = super().submit(**job_request_body)
+        _get_publisher(self.queue, job_request_body["workflow_uuid"])._publish(
+            {
+                "workflow_uuid": job_request_body["workflow_uuid"],
+                "job_id": response["job_id"],
+                "status": self.statuses[response["job_id"]],
+            }
+        )
+        return response
+
+
+def _get_publisher(queue, workflow_uuid):
+    """Get a publisher of the job status events of a workflow."""
+    workflow_queue = get_job_status_queue(queue, workflow_uuid)
+    return BasePublisher(
+        workflow_queue, workflow_queue, connection=Connection("memory://")
+    )
+
+
+def test_job_status_consumer():
+    """Test consuming job status events of the workflow jobs only."""
+    events = []
+    job_status_consumer = JobStatusConsumer(
+        "test-job-status",
+        workflow_uuid="workflow-uuid",
+        on_job_status=lambda job_id, status: events.append((job_id, status)),
+        connection=Connection("memory://"),
+    )
+    job_status_consumer.start()
+    publisher = _get_publisher("test-job-status", "workflow-uuid")
+    # misrouted events of other workflows are not handled
+    publisher._publish(
+        {"workflow_uuid": "other-uuid", "job_id": "job-1", "status": "failed"}
+    )
+    publisher._publish(
+        {"workflow_uuid": "workflow-uuid", "job_id": "job-2", "status": "finished"}
+    )
+    deadline = time.monotonic() + 5
+    while not events and time.monotonic() < deadline:
+        time.sleep(0.05)
+    job_status_consumer.stop()
+    assert events == [("job-2", "finished")]
+
+
+def test_job_status_consumers_of_concurrent_workflows():
+    """Test that workflows running at the same time get their own events."""
+    events = {"workflow-a": [], "workflow-b": []}
+    job_status_consumers = []
+    for workflow_uuid, job_ids in events.items():
+        job_status_consumer = JobStatusConsumer(
+            "test-concurrent-job-status",
+            workflow_uuid=workflow_uuid,
+            on_job_status=lambda job_id, status, job_ids=job_ids: job_ids.append(
+                job_id
+            ),
+            connection=Connection("memory://"),
+        )
+        job_status_consumer.start()
+        job_status_consumers.append(job_status_consumer)
+    for job in range(10):
+        workflow_uuid = "workflow-a" if job % 2 else "workflow-b"
+        _get_publisher("test-concurrent-job-status", workflow_uuid)._publish(
+            {"workflow_uuid": workflow_uuid, "job_id": job, "status": "finished"}
+        )
+    deadline = time.monotonic() + 5
+    while sum(map(len, events.values())) < 10 and time.monotonic() < deadline:
+        time.sleep(0.05)
+    for job_status_consumer in job_status_consumers:
+        job_status_consumer.stop()
+    assert events == {
+        "workflow-a": ["1", "3", "5", "7", "9"],
+        "workflow-b": ["0", "2", "4", "6", "8"],
+    }
+
+
+def test_job_status_events_dropped():
+    """Test that events of unknown jobs are only kept while jobs are submitted."""
+    events = JobStatusEvents(max_age=60)
+    events.add("job-1", "finished")
+    events.add("job-2", "failed")
+    assert events.pop({"job-1"}, submitting=True) == {"job-1": "finished"}
+    assert len(events) == 1
+    assert events.pop(set(), submitting=False) == {}
+    assert len(events) == 0
+
+    events = JobStatusEvents(max_age=0)
+    events.add("job-3", "finished")
+    assert events.pop(set(), submitting=True) == {}
+    assert len(events) == 0
+
+
+def test_run_jobs_with_job_status_events(run_workflow, monkeypatch):
+    """Test detecting finished jobs from job status events, without polling."""
+    monkeypatch.setattr(consumer, "MQ_CONNECTION_STRING", "memory://")
+    monkeypatch.setattr(executor, "SNAKEMAKE_JOB_STATUS_QUEUE", "test-job-events")
+    monkeypatch.setattr(executor, "POLL_JOBS_STATUS_EVENTS_SLEEP_IN_SECONDS", 30)
+    rjc_api_client = EventPublishingJobControllerAPIClient("test-job-events")
+    start = time.monotonic()
+    assert run_workflow(rjc_api_client)
+    assert rjc_api_client.check_status_calls == 0
+    assert time.monotonic() - start < 30
@@ -0,0 +1,507 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake executor tests."""
+
+from __future__ import absolute_import, print_function
+
+import multiprocessing
+import os
+import threading
+import time
+
+import pytest
+from snakemake import snakemake
+
+from conftest import StubJobControllerAPIClient, StubWorkflowStatusPublisher
+from reana_workflow_engine_snakemake import executor
+from reana_workflow_engine_snakemake.bundling import sum_time_limits
+
+
+def test_run_jobs(run_workflow, workflow_workspace):
+    """Test running a workflow with the REANA executor."""
+    rjc_api_client = StubJobControllerAPIClient()
+    assert run_workflow(rjc_api_client)
+    assert rjc_api_client.submit_calls == 5
+    assert (workflow_workspace / "4.txt").read_text() == "4\n"
+
+
+def test_job_statuses_checked_concurrently(run_workflow):
+    """Test that slow job status requests do not add up in a polling sweep."""
+    rjc_api_client = StubJobControllerAPIClient(status_latency=0.5)
+    start = time.monotonic()
+    assert run_workflow(rjc_api_client, workflow_parameters={"samples": 10})
+    assert rjc_api_client.check_status_calls >= 10
+    assert time.monotonic() - start < 10 * rjc_api_client.status_latency
+
+
+def test_jobs_submitted_concurrently(run_workflow):
+    """Test that slow job submissions do not add up when many jobs are ready."""
+    rjc_api_client = StubJobControllerAPIClient(submit_latency=0.5)
+    start = time.monotonic()
+    assert run_workflow(rjc_api_client, workflow_parameters={"samples": 10})
+    assert rjc_api_client.submit_calls == 10
+    assert time.monotonic() - start < 10 * rjc_api_client.submit_latency
+
+
+def test_jobs_submitted_in_batch(run_workflow, monkeypatch):
+    """Test that jobs ready at the same time are submitted in one request."""
+    monkeypatch.setattr(executor, "SNAKEMAKE_BATCH_SUBMISSION", True)
+    rjc_api_client = StubJobControllerAPIClient(submit_latency=0.5, submit_batch=True)
+    start = time.monotonic()
+    assert run_workflow(rjc_api_client, workflow_parameters={"samples": 10})
+    assert rjc_api_client.submit_batch_calls == 1
+    assert rjc_api_client.submit_calls == 0
+    assert time.monotonic() - start < 2 * rjc_api_client.submit_latency
+
+
+def test_jobs_submitted_one_by_one_without_batch_support(run_workflow, monkeypatch):
+    """Test that batches are not tried with clients that cannot submit them."""
+    monkeypatch.setattr(executor, "SNAKEMAKE_BATCH_SUBMISSION", True)
+    rjc_api_client = StubJobControllerAPIClient()
+    batches = []
+    monkeypatch.setattr(
+        executor, "submit_job_batch", lambda *args: batches.append(args)
+    )
+    assert run_workflow(rjc_api_client, workflow_parameters={"samples": 10})
+    assert rjc_api_client.submit_calls == 10
+    assert not batches
+
+
+def test_job_submission_error(run_workflow):
+    """Test that jobs failing to be submitted make the workflow fail."""
+    rjc_api_client = StubJobControllerAPIClient()
+    rjc_api_client.submit = lambda **job_request_body: {}
+    assert not run_workflow(rjc_api_client)
+
+
+def test_bulk_job_status_check(run_workflow):
+    """Test that all job statuses are fetched in one request when supported."""
+    rjc_api_client = StubJobControllerAPIClient(list_jobs=True)
+    assert run_workflow(rjc_api_client, workflow_parameters={"samples": 10})
+    assert rjc_api_client.get_jobs_calls >= 1
+    assert rjc_api_client.check_status_calls == 0
+
+
+def test_bulk_job_status_check_fallback(run_workflow):
+    """Test falling back to one request per job without a job listing."""
+    rjc_api_client = StubJobControllerAPIClient(list_jobs=False)
+    assert run_workflow(rjc_api_client, workflow_parameters={"samples": 10})
+    assert rjc_api_client.get_jobs_calls == 0
+    assert rjc_api_client.check_status_calls >= 10
+
+
+def test_workflow_start_published_once(run_workflow):
+    """Test that the total number of jobs is only published once."""
+    publisher = StubWorkflowStatusPublisher()
+    assert run_workflow(StubJobControllerAPIClient(), publisher)
+    totals = [
+        msg["message"]["progress"]["total"]["total"]
+        for msg in publisher.messages
+        if "total" in msg["message"]["progress"]
+    ]
+    assert totals == [5]
+
+
+CHECKPOINT_SNAKEFILE = (
+    "rule all:\n"
+    "    input: lambda wildcards: processed_samples(wildcards)\n"
+    "\n"
+    "checkpoint discover:\n"
+    '    output: directory("samples")\n'
+    '    shell: "mkdir -p {output} && touch {output}/a {output}/b {output}/c"\n'
+    "\n"
+    "def processed_samples(wildcards):\n"
+    "    samples = checkpoints.discover.get().output[0]\n"
+    '    names = glob_wildcards(os.path.join(samples, "{name}")).name\n'
+    "    # leave out the `.snakemake_timestamp` file of directory outputs\n"
+    '    return [f"{name}.processed" for name in names if name[0] != "."]\n'
+    "\n"
+    "rule process:\n"
+    '    input: "samples/{name}"\n'
+    '    output: "{name}.processed"\n'
+    '    shell: "cp {input} {output}"\n'
+)
+"""Snakefile whose jobs are only known once its checkpoint is finished."""
+
+
+def test_workflow_start_published_after_checkpoint(run_workflow, workflow_workspace):
+    """Test that the total number of jobs is published again after checkpoints."""
+    (workflow_workspace / "Snakefile").write_text(CHECKPOINT_SNAKEFILE)
+    publisher = StubWorkflowStatusPublisher()
+    assert run_workflow(StubJobControllerAPIClient(), publisher)
+    totals = [
+        msg["message"]["progress"]["total"]["total"]
+        for msg in publisher.messages
+        if "total" in msg["message"]["progress"]
+    ]
+    assert totals == [1, 4]
+
+
+@pytest.mark.parametrize("file_status_prefetch", [False, True])
+def test_checkpoint_dag_update_with_file_cache(
+    run_workflow, workflow_workspace, file_status_prefetch
+):
+    """Test that the DAG update after checkpoints is timed and sees new files."""
+    (workflow_workspace / "Snakefile").write_text(CHECKPOINT_SNAKEFILE)
+    rjc_api_client = StubJobControllerAPIClient()
+    options = {"file_status_prefetch": file_status_prefetch, "report_mode": "skip"}
+    assert run_workflow(rjc_api_client, operational_options=options)
+
+    assert executor.CHECKPOINT_UPDATE_DURATION.count == 1
+    assert rjc_api_client.submit_calls == 4
+    assert (workflow_workspace / "c.processed").exists()
+    assert not executor.REANAClusterExecutor.workflow_dag.workflow.iocache.active
+
+
+def test_checkpoints_finished_one_after_another(run_workflow, workflow_workspace):
+    """Test that the file status cached by a DAG update is not kept by the next."""
+    (workflow_workspace / "Snakefile").write_text(
+        "rule all:\n"
+        '    input: expand("{i}/done", i=range(3))\n'
+        "\n"
+        "checkpoint discover:\n"
+        '    output: directory("{i}/samples")\n'
+        '    shell: "mkdir -p {output} && touch {output}/a {output}/b"\n'
+        "\n"
+        "def processed_samples(wildcards):\n"
+        "    samples = checkpoints.discover.get(i=wildcards.i).output[0]\n"
+        '    names = glob_wildcards(os.path.join(samples, "{name}")).name\n'
+        '    return [f"{wildcards.i}/{name}.processed" for name in names '
+        'if name[0] != "."]\n'
+        "\n"
+        "rule process:\n"
+        '    input: "{i}/samples/{name}"\n'
+        '    output: "{i}/{name}.processed"\n'
+        '    shell: "cp {input} {output}"\n'
+        "\n"
+        "rule gather:\n"
+        "    input: processed_samples\n"
+        '    output: "{i}/done"\n'
+        '    shell: "touch {output}"\n'
+    )
+    rjc_api_client = StubJobControllerAPIClient()
+    assert run_workflow(rjc_api_client, operational_options={"report_mode": "skip"})
+
+    assert executor.CHECKPOINT_UPDATE_DURATION.count == 3
+    assert rjc_api_client.submit_calls == 12
+    assert all((workflow_workspace / str(i) / "done").exists() for i in range(3))
+
+
+def _write_report(dag, path):
+    """Write the number of jobs of the DAG and the working directory as report."""
+    with open(path, "w") as report:
+        report.write(f"{len(list(dag.jobs))} {os.getcwd()}")
+
+
+def test_report_generated_from_workflow_run_dag(
+    run_workflow, workflow_workspace, monkeypatch
+):
+    """Test that the report does not require building the DAG again."""
+    snakemake_calls = []
+
+    def _snakemake(**kwargs):
+        snakemake_calls.append(kwargs)
+        return snakemake(**kwargs)
+
+    monkeypatch.setattr(executor, "snakemake", _snakemake)
+    monkeypatch.setattr(executor, "auto_report", _write_report)
+    cwd = os.getcwd()
+    assert run_workflow(StubJobControllerAPIClient())
+    assert len(snakemake_calls) == 1
+    # the report is rendered in the workspace without changing the engine's
+    # working directory
+    assert (workflow_workspace / "report.html").read_text() == f"6 {workflow_workspace}"
+    assert os.getcwd() == cwd
+
+
+def test_report_skipped(run_workflow, workflow_workspace, monkeypatch):
+    """Test that the report is not generated by the run in other report modes."""
+    monkeypatch.setattr(executor, "auto_report", _write_report)
+    for report_mode in ("skip", "deferred"):
+        assert run_workflow(
+            StubJobControllerAPIClient(),
+            operational_options={"report_mode": report_mode},
+        )
+    assert not (workflow_workspace / "report.html").exists()
+
+    assert executor.generate_report(str(workflow_workspace), "Snakefile", {})
+    assert (workflow_workspace / "report.html").exists()
+
+
+def test_report_timeout(run_workflow, workflow_workspace, monkeypatch):
+    """Test that the report generation is given up after the timeout."""
+    monkeypatch.setattr(executor, "auto_report", lambda dag, path: time.sleep(60))
+    assert run_workflow(
+        StubJobControllerAPIClient(), operational_options={"report_mode": "skip"}
+    )
+    cwd = os.getcwd()
+    start = time.monotonic()
+    assert not executor.generate_report(
+        str(workflow_workspace), "Snakefile", {}, timeout=0.5
+    )
+    assert time.monotonic() - start < 5
+    assert os.getcwd() == cwd
+    assert not any(
+        child.name == "reana-report" for child in multiprocessing.active_children()
+    )
+
+
+def test_local_jobs(run_workflow, workflow_workspace, monkeypatch):
+    """Test that tiny jobs can run inside the engine instead of job-controller."""
+    monkeypatch.setattr(executor, "SNAKEMAKE_LOCAL_RUN_JOBS", True)
+    (workflow_workspace / "Snakefile").write_text(
+        "rule all:\n"
+        '    input: "merged.txt"\n'
+        "\n"
+        "rule sample:\n"
+        '    output: "{sample}.txt"\n'
+        '    shell: "echo {wildcards.sample} > {output}"\n'
+        "\n"
+        "rule touch:\n"
+        '    input: "a.txt"\n'
+        '    output: "b.txt"\n'
+        "    resources: local=1\n"
+        '    shell: "cp {input} {output}"\n'
+        "\n"
+        "rule merge:\n"
+        '    input: "b.txt"\n'
+        '    output: "merged.txt"\n'
+        "    run:\n"
+        '        shell("cat {input} > {output}")\n'
+    )
+    rjc_api_client = StubJobControllerAPIClient()
+    publisher = StubWorkflowStatusPublisher()
+    assert run_workflow(rjc_api_client, publisher=publisher)
+    assert rjc_api_client.submit_calls == 1
+    assert (workflow_workspace / "merged.txt").read_text() == "a\n"
+
+    # local jobs are counted without job-controller ids
+    finished = [
+        message["message"]["progress"]["finished"]
+        for message in publisher.messages
+        if message["message"] and "finished" in message["message"]["progress"]
+    ]
+    assert sum(progress["total"] for progress in finished) == 3
+    assert [job_id for progress in finished for job_id in progress["job_ids"]] == [
+        "job-1"
+    ]
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_jobs_bundled(run_workflow, workflow_workspace, monkeypatch, parallel):
+    """Test that jobs ready at the same time are run in a few REANA jobs."""
+    monkeypatch.setattr(executor, "SNAKEMAKE_JOB_BUNDLE_SIZE", 4)
+    monkeypatch.setattr(executor, "SNAKEMAKE_JOB_BUNDLE_PARALLEL", parallel)
+    rjc_api_client = StubJobControllerAPIClient()
+    publisher = StubWorkflowStatusPublisher()
+    assert run_workflow(
+        rjc_api_client, publisher=publisher, workflow_parameters={"samples": 8}
+    )
+    assert rjc_api_client.submit_calls == 2
+    assert (workflow_workspace / "7.txt").read_text() == "7\n"
+    assert not list(workflow_workspace.glob(".snakemake/reana/bundles/*"))
+    finished = sum(
+        message["message"]["progress"].get("finished", {}).get("total", 0)
+        for message in publisher.messages
+        if message["message"]
+    )
+    assert finished == 8
+    # each REANA job is published once, whatever its number of jobs
+    running = [
+        message["message"]["progress"]["running"]
+        for message in publisher.messages
+        if message["message"] and "running" in message["message"]["progress"]
+    ]
+    assert sum(progress["total"] for progress in running) == 8
+    assert sorted(job_id for progress in running for job_id in progress["job_ids"]) == [
+        "job-1",
+        "job-2",
+    ]
+
+
+def test_jobs_with_memory_limit_bundled_in_sequence(
+    run_workflow, workflow_workspace, monkeypatch
+):
+    """Test that jobs sharing the memory limit of a bundle do not run in parallel."""
+    monkeypatch.setattr(executor, "SNAKEMAKE_JOB_BUNDLE_SIZE", 4)
+    monkeypatch.setattr(executor, "SNAKEMAKE_JOB_BUNDLE_PARALLEL", True)
+    (workflow_workspace / "Snakefile").write_text(
+        "rule all:\n"
+        '    input: expand("{sample}.txt", sample=range(4))\n'
+        "\n"
+        "rule sample:\n"
+        '    output: "{sample}.txt"\n'
+        '    resources: kubernetes_memory_limit="1Gi"\n'
+        '    shell: "echo {wildcards.sample} > {output}"\n'
+    )
+    rjc_api_client = StubJobControllerAPIClient()
+    commands = []
+    submit = rjc_api_client.submit
+
+    def _submit(**job_request_body):
+        commands.append(job_request_body["cmd"])
+        return submit(**job_request_body)
+
+    rjc_api_client.submit = _submit
+    assert run_workflow(rjc_api_client)
+    assert len(commands) == 1
+    assert "&" not in commands[0].replace("&&", "")
+
+
+def test_sum_time_limits():
+    """Test that the time limits of jobs run one by one are added up."""
+    assert sum_time_limits(
+        [
+            {
+                "kubernetes_job_timeout": 60,
+                "slurm_time": "30",
+                "htcondor_max_runtime": "",
+            },
+            {"kubernetes_job_timeout": 90, "slurm_time": "1-1:30"},
+        ]
+    ) == {"kubernetes_job_timeout": 150, "slurm_time": "1-02:00:00"}
+    with pytest.raises(ValueError):
+        sum_time_limits([{"htcondor_max_runtime": "espresso"}])
+    with pytest.raises(ValueError):
+        sum_time_limits([{"kubernetes_job_timeout": 60}, {}])
+
+
+@pytest.mark.parametrize(
+    "resources, submit_calls, time_limits",
+    [
+        (
+            'kubernetes_job_timeout=100, slurm_time="30"',
+            1,
+            {"kubernetes_job_timeout": 400, "slurm_time": "0-02:00:00"},
+        ),
+        ('htcondor_max_runtime="espresso"', 4, {"htcondor_max_runtime": "espresso"}),
+    ],
+)
+def test_bundled_jobs_time_limits(
+    run_workflow, workflow_workspace, monkeypatch, resources, submit_calls, time_limits
+):
+    """Test that bundles run in sequence get the time limits of all their jobs."""
+    monkeypatch.setattr(executor, "SNAKEMAKE_JOB_BUNDLE_SIZE", 4)
+    (workflow_workspace / "Snakefile").write_text(
+        "rule all:\n"
+        '    input: expand("{sample}.txt", sample=range(4))\n'
+        "\n"
+        "rule sample:\n"
+        '    output: "{sample}.txt"\n'
+        f"    resources: {resources}\n"
+        '    shell: "echo {wildcards.sample} > {output}"\n'
+    )
+    rjc_api_client = StubJobControllerAPIClient()
+    job_request_bodies = []
+    submit = rjc_api_client.submit
+
+    def _submit(**job_request_body):
+        job_request_bodies.append(job_request_body)
+        return submit(**job_request_body)
+
+    rjc_api_client.submit = _submit
+    assert run_workflow(rjc_api_client)
+    assert len(job_request_bodies) == submit_calls
+    for job_request_body in job_request_bodies:
+        assert {field: job_request_body[field] for field in time_limits} == time_limits
+
+
+def test_bundled_job_failure(run_workflow, workflow_workspace, monkeypatch):
+    """Test that the jobs of a bundle fail independently."""
+    monkeypatch.setattr(executor, "SNAKEMAKE_JOB_BUNDLE_SIZE", 5)
+    (workflow_workspace / "Snakefile").write_text(
+        "rule all:\n"
+        '    input: expand("{sample}.txt", sample=range(5))\n'
+        "\n"
+        "rule sample:\n"
+        '    output: "{sample}.txt"\n'
+        '    shell: "test {wildcards.sample} != 3 && echo {wildcards.sample} > {output}"\n'
+    )
+    rjc_api_client = StubJobControllerAPIClient()
+    assert not run_workflow(rjc_api_client)
+    assert rjc_api_client.submit_calls == 1
+    assert (workflow_workspace / "4.txt").exists()
+    assert not (workflow_workspace / "3.txt").exists()
+
+
+def test_group_jobs(run_workflow, workflow_workspace):
+    """Test that the jobs of a Snakemake group run in one REANA job."""
+    (workflow_workspace / "Snakefile").write_text(
+        "rule all:\n"
+        '    input: "b.txt"\n'
+        "\n"
+        "rule a:\n"
+        '    output: "a.txt"\n'
+        '    group: "ab"\n'
+        '    shell: "echo a > {output}"\n'
+        "\n"
+        "rule b:\n"
+        '    input: "a.txt"\n'
+        '    output: "b.txt"\n'
+        '    group: "ab"\n'
+        '    shell: "cat {input} > {output} && echo b >> {output}"\n'
+    )
+    rjc_api_client = StubJobControllerAPIClient()
+    assert run_workflow(rjc_api_client)
+    assert rjc_api_client.submit_calls == 1
+    assert (workflow_workspace / "b.txt").read_text() == "a\nb\n"
+
+
+def test_group_jobs_rule_limits(run_workflow, workflow_workspace, monkeypatch):
+    """Test that group jobs are admitted with the limits of each of their rules."""
+    (workflow_workspace / "Snakefile").write_text(
+        "rule all:\n"
+        '    input: "b.txt"\n'
+        "\n"
+        "rule a:\n"
+        '    output: "a.txt"\n'
+        '    group: "ab"\n'
+        "    resources: max_running_jobs=1\n"
+        '    shell: "echo a > {output}"\n'
+        "\n"
+        "rule b:\n"
+        '    input: "a.txt"\n'
+        '    output: "b.txt"\n'
+        '    group: "ab"\n'
+        '    shell: "cat {input} > {output} && echo b >> {output}"\n'
+    )
+    admitted = []
+    admit = executor.SubmissionThrottle.admit
+
+    def record_admit(self, item, key_object, compute_backend, rule_limits):
+        admitted.append(rule_limits)
+        return admit(self, item, key_object, compute_backend, rule_limits)
+
+    monkeypatch.setattr(executor.SubmissionThrottle, "admit", record_admit)
+    rjc_api_client = StubJobControllerAPIClient()
+    assert run_workflow(rjc_api_client)
+    assert admitted == [{"a": 1, "b": 0}]
+
+
+def test_group_jobs_with_different_environments(run_workflow, workflow_workspace):
+    """Test that jobs needing different environments are not run in one job."""
+    (workflow_workspace / "Snakefile").write_text(
+        "rule all:\n"
+        '    input: "b.txt"\n'
+        "\n"
+        "rule a:\n"
+        '    output: "a.txt"\n'
+        '    group: "ab"\n'
+        '    container: "docker://docker.io/library/python:3.12"\n'
+        '    shell: "echo a > {output}"\n'
+        "\n"
+        "rule b:\n"
+        '    input: "a.txt"\n'
+        '    output: "b.txt"\n'
+        '    group: "ab"\n'
+        '    shell: "cat {input} > {output} && echo b >> {output}"\n'
+    )
+    rjc_api_client = StubJobControllerAPIClient()
+    assert not run_workflow(rjc_api_client)
+    assert rjc_api_client.submit_calls == 0
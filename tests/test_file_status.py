@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake workspace file status tests."""
+
+from __future__ import absolute_import, print_function
+
+import os
+
+from snakemake import io as snakemake_io
+from snakemake.io import IOCache, _IOFile
+
+from conftest import StubJobControllerAPIClient
+from reana_workflow_engine_snakemake.file_status import WorkspaceSnapshot
+
+
+def _make_old(*paths):
+    """Make the modification time of the paths older than the racy interval."""
+    for path in paths:
+        os.utime(path, (1000000000, 1000000000), follow_symlinks=False)
+
+
+def test_workspace_snapshot(tmp_path):
+    """Test that the snapshot follows created, removed and invalidated files."""
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "b.txt").write_text("b")
+    (tmp_path / "a.txt").write_text("a")
+    (tmp_path / "link").symlink_to("a.txt")
+    (tmp_path / "broken").symlink_to("missing.txt")
+    (tmp_path / ".snakemake").mkdir()
+    (tmp_path / ".snakemake" / "metadata").write_text("")
+    _make_old(tmp_path / "a.txt", tmp_path / "sub", tmp_path)
+
+    snapshot = WorkspaceSnapshot(str(tmp_path), excluded_paths=[".snakemake"])
+    snapshot.scan()
+    assert snapshot.get("a.txt").mtime == 1000000000
+    assert snapshot.get("sub/b.txt").size == 1
+    assert snapshot.get("link").target_mtime == 1000000000
+    assert snapshot.get("broken") is None
+    assert snapshot.get(".snakemake").is_dir
+    assert snapshot.get(".snakemake/metadata") is None
+
+    os.utime(tmp_path / "a.txt", (2000000000, 2000000000))
+    (tmp_path / "sub" / "b.txt").unlink()
+    (tmp_path / "sub" / "c.txt").write_text("c")
+    snapshot.refresh()
+    assert snapshot.get("a.txt").mtime == 1000000000
+    assert snapshot.get("sub/b.txt") is None
+    assert snapshot.get("sub/c.txt")
+
+    snapshot.invalidate(["a.txt"])
+    snapshot.refresh()
+    assert snapshot.get("a.txt").mtime == 2000000000
+
+    iocache = IOCache(max_wait_time=0)
+    snapshot.fill_iocache(iocache)
+    assert iocache.exists_local[_IOFile("sub/c.txt")]
+    missing = _IOFile("sub/b.txt")
+    assert missing in iocache.exists_local and not iocache.exists_local[missing]
+    assert iocache.mtime[_IOFile("a.txt")].local() == 2000000000
+
+
+def test_run_workflow_with_file_status_prefetch(run_workflow, workflow_workspace):
+    """Test that the DAG built from the prefetched file status is correct."""
+    iocache_class = snakemake_io.IOCache
+    options = {"file_status_prefetch": True}
+    assert run_workflow(StubJobControllerAPIClient(), operational_options=options)
+    assert snakemake_io.IOCache is iocache_class
+
+    rjc_api_client = StubJobControllerAPIClient()
+    assert run_workflow(rjc_api_client, operational_options=options)
+    assert rjc_api_client.submit_calls == 0
+
+    os.remove(workflow_workspace / "3.txt")
+    assert run_workflow(rjc_api_client, operational_options=options)
+    assert rjc_api_client.submit_calls == 1
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake job-controller HTTP client tests."""
+
+from __future__ import absolute_import, print_function
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+import requests
+from bravado.requests_client import RequestsClient
+from jsonschema.exceptions import ValidationError
+from reana_commons.api_client import JobControllerAPIClient
+from reana_commons.config import OPENAPI_SPECS
+
+from reana_workflow_engine_snakemake.executor import list_job_statuses
+from reana_workflow_engine_snakemake.http_client import configure_http_client
+
+
+class StubJobControllerHandler(BaseHTTPRequestHandler):
+    """Answer requests with running job statuses after a short delay."""
+
+    protocol_version = "HTTP/1.1"  # keep connections alive
+
+    def do_GET(self):
+        """Return the job status, or all jobs as job-controller does."""
+        time.sleep(float(self.headers.get("X-Latency", 0)))
+        if self.path == "/jobs":
+            jobs = {
+                job_id: {"cmd": "date", "docker_img": "busybox", "status": "running"}
+                for job_id in ("job-1", "job-2")
+            }
+            body = json.dumps({"jobs": jobs}).encode()
+        else:
+            body = json.dumps({"status": "running"}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        """Create a job."""
+        time.sleep(float(self.headers.get("X-Latency", 0)))
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = json.dumps({"job_id": "job-1"}).encode()
+        self.send_response(201)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        """Do not log requests."""
+
+
+@pytest.fixture
+def job_controller_url():
+    """Local HTTP server standing in for job-controller."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubJobControllerHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def _rjc_api_client():
+    """Job-controller client stand-in with a bravado HTTP client."""
+    http_client = RequestsClient()
+    return (
+        SimpleNamespace(
+            _client=SimpleNamespace(
+                swagger_spec=SimpleNamespace(http_client=http_client)
+            )
+        ),
+        http_client.session,
+    )
+
+
+def test_connections_reused(job_controller_url):
+    """Test that concurrent requests share a bounded number of connections."""
+    rjc_api_client, session = _rjc_api_client()
+    adapter = configure_http_client(rjc_api_client, pool_size=4)
+
+    def _get(_):
+        return session.get(
+            f"{job_controller_url}/jobs/job-1", headers={"X-Latency": "0.01"}
+        ).json()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        responses = list(pool.map(_get, range(40)))
+    assert responses == [{"status": "running"}] * 40
+
+    stats = adapter.get_stats()
+    assert stats["requests"] == 40
+    assert stats["connections"] <= 4
+    assert stats["reuse_ratio"] >= 0.9
+    assert stats["wait_time"] > 0
+
+
+def test_default_timeout(job_controller_url):
+    """Test that requests without a timeout get the default one."""
+    rjc_api_client, session = _rjc_api_client()
+    configure_http_client(rjc_api_client, read_timeout=0.1)
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        session.get(f"{job_controller_url}/jobs/job-1", headers={"X-Latency": "1"})
+    # job submissions have no read timeout
+    response = session.post(
+        f"{job_controller_url}/jobs", json={}, headers={"X-Latency": "0.3"}
+    )
+    assert response.json() == {"job_id": "job-1"}
+
+
+def test_unsupported_http_client():
+    """Test that clients not sending requests with a session are left as is."""
+    assert configure_http_client(SimpleNamespace(_client=object())) is None
+
+
+def test_list_job_statuses(job_controller_url, monkeypatch):
+    """Test listing jobs with the job-controller client of REANA-Commons."""
+    monkeypatch.setitem(
+        OPENAPI_SPECS,
+        "reana-job-controller",
+        (job_controller_url, "reana_job_controller.json"),
+    )
+    rjc_api_client = JobControllerAPIClient("reana-job-controller")
+    # the response does not match the job list of the specification
+    with pytest.raises(ValidationError):
+        rjc_api_client._client.jobs.get_jobs().result()
+
+    statuses = list_job_statuses(rjc_api_client)
+    assert statuses == {"job-1": "running", "job-2": "running"}
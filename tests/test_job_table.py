@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake job table tests."""
+
+from __future__ import absolute_import, print_function
+
+from conftest import StubJobControllerAPIClient
+from reana_workflow_engine_snakemake import executor
+from reana_workflow_engine_snakemake.job_table import CHECKING, WAITING, JobTable
+
+
+def _make_table(count):
+    table = JobTable()
+    for i in range(count):
+        table.add(f"job-{i}", f"id-{i}", callback=None, error_callback=None)
+    return table
+
+
+def test_sweeps_go_through_all_jobs_in_turn():
+    """Test that limited sweeps check the jobs that waited for the longest."""
+    table = _make_table(5)
+
+    first = table.start_sweep(limit=3)
+    assert [active_job.job_id for active_job in first] == ["id-0", "id-1", "id-2"]
+    assert table.count(CHECKING) == 3
+    table.remove(first[0])
+    table.end_sweep()
+
+    second = table.start_sweep(limit=3)
+    assert [active_job.job_id for active_job in second] == ["id-3", "id-4", "id-1"]
+    assert len(table) == 4
+    assert table.count(WAITING) == 1
+    table.end_sweep()
+
+    assert len(table.start_sweep()) == 4
+    table.add("job-5", "id-5", callback=None, error_callback=None)
+    table.end_sweep()
+    assert table.count(WAITING) == 5
+
+
+def test_sweep_of_given_jobs():
+    """Test that sweeps can check given jobs only, e.g. after status events."""
+    table = _make_table(3)
+    assert table.get_state("id-1") == WAITING
+
+    checked = table.start_sweep(["id-1", "unknown-id"])
+    assert [active_job.job_id for active_job in checked] == ["id-1"]
+    assert table.get_state("id-1") == CHECKING
+    # jobs being checked are not taken by other sweeps
+    assert table.start_sweep(["id-1"]) == []
+
+
+def test_limited_sweeps(run_workflow, monkeypatch):
+    """Test that workflows finish when sweeps check few jobs at a time."""
+    monkeypatch.setattr(executor, "SNAKEMAKE_MAX_JOBS_PER_SWEEP", 2)
+    rjc_api_client = StubJobControllerAPIClient()
+    assert run_workflow(rjc_api_client)
+    assert rjc_api_client.check_status_calls == 5
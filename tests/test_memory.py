@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake memory profiling and footprint tests."""
+
+from __future__ import absolute_import, print_function
+
+import time
+import tracemalloc
+
+from conftest import StubJobControllerAPIClient
+from reana_workflow_engine_snakemake.executor import REANAClusterExecutor
+from reana_workflow_engine_snakemake.memory import MemoryProfiler
+from reana_workflow_engine_snakemake.utils import truncate_command
+
+
+def test_memory_profiler(tmp_path):
+    """Test that snapshots list the allocations and their growth."""
+    profiler = MemoryProfiler(str(tmp_path / "memory"), interval=0.05, top=5)
+    profiler.start()
+    allocations = [bytearray(1024) for _ in range(1000)]
+    time.sleep(0.2)
+    profiler.stop()
+
+    assert not tracemalloc.is_tracing()
+    assert profiler.snapshots >= 2
+    first = (tmp_path / "memory" / "memory-0001.txt").read_text()
+    assert "test_memory.py" in first and "bytearray(1024)" in first
+    last = (tmp_path / "memory" / f"memory-{profiler.snapshots:04d}.txt").read_text()
+    assert last.startswith("Time: ") and " KiB)" in last
+    assert len(allocations) == 1000
+
+
+def test_truncate_command():
+    """Test that only long commands are truncated."""
+    assert truncate_command("echo 1", 10) == "echo 1"
+    assert truncate_command("echo 1" * 10, 0) == "echo 1" * 10
+    assert truncate_command("echo 12345", 4) == "echo... (6 more characters)"
+
+
+def test_run_workflow_releases_finished_jobs(run_workflow, workflow_workspace):
+    """Test that finished jobs keep no expanded state, and memory is profiled."""
+    options = {"report_mode": "skip", "memory_profile_interval": 60}
+    assert run_workflow(StubJobControllerAPIClient(), operational_options=options)
+
+    assert list(
+        (workflow_workspace / ".snakemake" / "reana" / "memory").glob("memory-*")
+    )
+    dag = REANAClusterExecutor.workflow_dag
+    jobs = [job for job in dag.jobs if job.rule.name == "sample"]
+    assert len(jobs) == 5 and all(dag.finished(job) for job in jobs)
+    assert all(job._params is None and job._resources is None for job in jobs)
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake executor metrics tests."""
+
+from __future__ import absolute_import, print_function
+
+import json
+import socket
+
+import pytest
+import requests
+
+from conftest import StubJobControllerAPIClient
+from reana_workflow_engine_snakemake import executor
+from reana_workflow_engine_snakemake.metrics import MetricsRegistry, metrics
+
+
+def test_prometheus_format():
+    """Test that metrics are rendered in the Prometheus text format."""
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1))
+    counter = registry.counter("requests_total", "Requests.")
+    for value in (0.05, 0.5, 5):
+        histogram.observe(value)
+        counter.inc()
+
+    assert registry.to_prometheus().splitlines() == [
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{le="0.1"} 1',
+        'latency_seconds_bucket{le="1.0"} 2',
+        'latency_seconds_bucket{le="+Inf"} 3',
+        "latency_seconds_sum 5.55",
+        "latency_seconds_count 3",
+        "# HELP requests_total Requests.",
+        "# TYPE requests_total counter",
+        "requests_total 3.0",
+    ]
+    assert registry.to_dict()["latency_seconds"]["max"] == 5
+
+
+def test_metrics_http_server():
+    """Test that metrics can be scraped over HTTP."""
+    registry = MetricsRegistry()
+    registry.gauge("active_jobs", "Active jobs.").set(3)
+    port = registry.start_http_server(0, address="127.0.0.1")
+    try:
+        response = requests.get(f"http://127.0.0.1:{port}/metrics")
+    finally:
+        registry.stop_http_server()
+    assert "active_jobs 3" in response.text
+
+
+def test_metrics_summary(run_workflow, workflow_workspace):
+    """Test that the metrics of the workflow run are written in the workspace."""
+    assert run_workflow(StubJobControllerAPIClient())
+    summary = json.loads(
+        (workflow_workspace / ".snakemake" / "reana" / "metrics.json").read_text()
+    )
+    assert summary["reana_snakemake_jobs_submitted_total"] == 5
+    assert summary["reana_snakemake_jobs_finished_total"] == 5
+    assert summary["reana_snakemake_job_submission_seconds"]["count"] >= 1
+    assert summary["reana_snakemake_publish_seconds"]["count"] >= 1
+
+
+def test_metrics_server_stopped_on_error(run_workflow, workflow_workspace, monkeypatch):
+    """Test that the metrics are written and no longer served if the run fails."""
+    with socket.socket() as free_socket:
+        free_socket.bind(("127.0.0.1", 0))
+        port = free_socket.getsockname()[1]
+    monkeypatch.setattr(executor, "SNAKEMAKE_METRICS_PORT", port)
+
+    def _snakemake(**kwargs):
+        raise RuntimeError("Snakemake crashed.")
+
+    monkeypatch.setattr(executor, "snakemake", _snakemake)
+    with pytest.raises(RuntimeError):
+        run_workflow(StubJobControllerAPIClient())
+    assert metrics._server is None
+    assert (workflow_workspace / ".snakemake" / "reana" / "metrics.json").exists()
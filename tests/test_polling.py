@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake job status polling tests."""
+
+from __future__ import absolute_import, print_function
+
+from reana_workflow_engine_snakemake.polling import AdaptivePollScheduler
+
+
+def test_poll_scheduler_backoff():
+    """Test that the polling interval backs off up to the maximum when idle."""
+    poll_scheduler = AdaptivePollScheduler(min_interval=1, max_interval=10)
+    poll_scheduler.job_submitted("job-1", "rule")
+    assert [poll_scheduler.sweep_done() for _ in range(5)] == [2, 4, 8, 10, 10]
+
+    # jobs submitted while others are running do not reset the interval
+    poll_scheduler.job_submitted("job-2", "rule")
+    assert poll_scheduler.interval == 10
+
+    poll_scheduler.job_done("job-1")
+    poll_scheduler.job_done("job-2")
+    assert poll_scheduler.sweep_done() == 1
+    assert poll_scheduler.sweep_done() == 2
+    poll_scheduler.job_submitted("job-3", "rule")
+    assert poll_scheduler.interval == 1
+
+
+def test_poll_scheduler_saved_latency():
+    """Test that the latency saved when detecting finished jobs is recorded."""
+    poll_scheduler = AdaptivePollScheduler(min_interval=1, max_interval=10)
+    poll_scheduler.job_submitted("job-1", "rule")
+    poll_scheduler.job_submitted("job-2", "rule")
+    poll_scheduler.job_done("job-1")
+    poll_scheduler.job_done("job-2", finished=False)
+    assert poll_scheduler.sweep_done() == 1
+    assert poll_scheduler.detected_jobs == 2
+    assert 19 < poll_scheduler.saved_latency <= 20
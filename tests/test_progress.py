@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake job progress publishing tests."""
+
+from __future__ import absolute_import, print_function
+
+import threading
+import time
+
+from conftest import StubWorkflowStatusPublisher
+from reana_workflow_engine_snakemake.config import JobStatus
+from reana_workflow_engine_snakemake.progress import JobProgressAggregator
+
+
+def test_job_progress_merged():
+    """Test that job progress updates are merged into one message."""
+    publisher = StubWorkflowStatusPublisher()
+    progress = JobProgressAggregator(
+        publisher, "workflow-uuid", max_events=3, max_delay=60
+    )
+    progress.add(JobStatus.running, "job-1")
+    progress.add(JobStatus.running, "job-2")
+    assert publisher.messages == []
+    progress.add(JobStatus.finished, "job-1")
+    assert publisher.messages[0]["status"] == 1
+    assert publisher.messages[0]["message"]["progress"] == {
+        "running": {"total": 2, "job_ids": ["job-1", "job-2"]},
+        "finished": {"total": 1, "job_ids": ["job-1"]},
+    }
+    assert progress.saved_messages == 2
+
+
+def test_job_progress_failed_published_right_away():
+    """Test that failed jobs are published without waiting."""
+    publisher = StubWorkflowStatusPublisher()
+    progress = JobProgressAggregator(
+        publisher, "workflow-uuid", max_events=100, max_delay=60
+    )
+    progress.add(JobStatus.running, "job-1")
+    progress.add(JobStatus.failed, "job-1")
+    assert len(publisher.messages) == 1
+    assert publisher.messages[0]["status"] == 3
+
+
+def test_job_progress_published_after_delay():
+    """Test that buffered job progress updates are published after a delay."""
+    publisher = StubWorkflowStatusPublisher()
+    progress = JobProgressAggregator(
+        publisher, "workflow-uuid", max_events=100, max_delay=0.1
+    )
+    progress.add(JobStatus.running, "job-1")
+    time.sleep(0.5)
+    assert len(publisher.messages) == 1
+    progress.close()
+    assert len(publisher.messages) == 1
+
+
+def test_job_progress_counts_jobs_of_shared_job_ids():
+    """Test that job ids are published once, and jobs without ids are counted."""
+    publisher = StubWorkflowStatusPublisher()
+    progress = JobProgressAggregator(
+        publisher, "workflow-uuid", max_events=100, max_delay=60
+    )
+    progress.add(JobStatus.running, "bundle-1", count=3)
+    progress.add(JobStatus.running, None)
+    progress.add(JobStatus.finished, "bundle-1")
+    progress.add(JobStatus.finished, "bundle-1")
+    progress.close()
+    assert publisher.messages[0]["message"]["progress"] == {
+        "running": {"total": 4, "job_ids": ["bundle-1"]},
+        "finished": {"total": 2, "job_ids": ["bundle-1"]},
+    }
+
+
+class ExclusivePublisher(StubWorkflowStatusPublisher):
+    """Publisher recording whether it was used by several threads at once."""
+
+    def __init__(self):
+        """Initialise the publisher."""
+        super().__init__()
+        self.active = 0
+        self.overlaps = 0
+        self._lock = threading.Lock()
+
+    def publish_workflow_status(self, *args, **kwargs):
+        """Record the message, detecting concurrent publications."""
+        with self._lock:
+            self.active += 1
+            self.overlaps += self.active > 1
+        time.sleep(0.001)
+        super().publish_workflow_status(*args, **kwargs)
+        with self._lock:
+            self.active -= 1
+
+
+def test_job_progress_published_with_workflow_statuses():
+    """Test that timer flushes and other workflow statuses do not overlap."""
+    publisher = ExclusivePublisher()
+    progress = JobProgressAggregator(
+        publisher, "workflow-uuid", max_events=100, max_delay=0.001
+    )
+    for attempt in range(50):
+        progress.add(JobStatus.running, f"job-{attempt}")
+        time.sleep(0.001)
+        progress.publish_workflow_status("workflow-uuid", 1)
+    progress.close()
+    assert publisher.overlaps == 0
+    published_ids = [
+        job_id
+        for message in publisher.messages
+        if message["message"]
+        for job_id in message["message"]["progress"]["running"]["job_ids"]
+    ]
+    assert published_ids == [f"job-{attempt}" for attempt in range(50)]
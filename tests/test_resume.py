@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake resume tests."""
+
+from __future__ import absolute_import, print_function
+
+import json
+from base64 import urlsafe_b64encode
+
+from conftest import StubJobControllerAPIClient
+from reana_workflow_engine_snakemake.resume import read_incomplete_jobs
+
+
+def _mark_incomplete(workflow_workspace, output_file, job_id):
+    """Record an output file as being produced by a started job."""
+    incomplete_dir = workflow_workspace / ".snakemake" / "incomplete"
+    incomplete_dir.mkdir(parents=True, exist_ok=True)
+    record = incomplete_dir / urlsafe_b64encode(output_file.encode()).decode()
+    record.write_text(json.dumps({"external_jobid": job_id}))
+
+
+class InterruptedJobController(StubJobControllerAPIClient):
+    """Job controller still running a job of an interrupted workflow run."""
+
+    def __init__(self, workflow_workspace, samples=(1,), **kwargs):
+        """Initialise the job controller with the running job."""
+        super().__init__(**kwargs)
+        self.workflow_workspace = workflow_workspace
+        self.samples = samples
+        self.statuses["previous-job"] = "running"
+
+    def check_status(self, job_id):
+        """Finish the running job once it is checked by the resumed run."""
+        status = super().check_status(job_id)
+        if job_id == "previous-job" and self.check_status_calls > 1:
+            for sample in self.samples:
+                (self.workflow_workspace / f"{sample}.txt").write_text(f"{sample}\n")
+            self.statuses[job_id] = "finished"
+        return status
+
+
+def test_read_incomplete_jobs(workflow_workspace):
+    """Test that the started jobs are read from the Snakemake records."""
+    _mark_incomplete(workflow_workspace, "1.txt", "job-a")
+    _mark_incomplete(workflow_workspace, "2.txt", "job-a")
+    _mark_incomplete(workflow_workspace, "3.txt", "job-b")
+
+    jobs = read_incomplete_jobs(str(workflow_workspace))
+    assert {job_id: sorted(o for o, _ in r) for job_id, r in jobs.items()} == {
+        "job-a": ["1.txt", "2.txt"],
+        "job-b": ["3.txt"],
+    }
+
+
+def test_resume_reattaches_running_jobs(run_workflow, workflow_workspace):
+    """Test that jobs still running are followed instead of being resubmitted."""
+    _mark_incomplete(workflow_workspace, "1.txt", "previous-job")
+    (workflow_workspace / ".snakemake" / "locks").mkdir()
+    (workflow_workspace / ".snakemake" / "locks" / "0.input.lock").touch()
+    rjc_api_client = InterruptedJobController(workflow_workspace)
+
+    assert run_workflow(rjc_api_client, operational_options={"resume": True})
+    assert rjc_api_client.submit_calls == 4
+    assert rjc_api_client.statuses["previous-job"] == "finished"
+    assert (workflow_workspace / "1.txt").read_text() == "1\n"
+    assert not read_incomplete_jobs(str(workflow_workspace))
+
+
+def test_resume_reattaches_running_bundles(run_workflow, workflow_workspace):
+    """Test that the jobs of a bundle still running are followed together."""
+    for sample in (1, 2, 3):
+        _mark_incomplete(workflow_workspace, f"{sample}.txt", "previous-job")
+    rjc_api_client = InterruptedJobController(workflow_workspace, samples=(1, 2, 3))
+
+    assert run_workflow(rjc_api_client, operational_options={"resume": True})
+    assert rjc_api_client.submit_calls == 2
+    assert (workflow_workspace / "3.txt").read_text() == "3\n"
+    assert not read_incomplete_jobs(str(workflow_workspace))
+
+
+def test_resume_reruns_failed_jobs(run_workflow, workflow_workspace):
+    """Test that jobs that failed while the engine was down run again."""
+    (workflow_workspace / "1.txt").write_text("partial")
+    _mark_incomplete(workflow_workspace, "1.txt", "previous-job")
+    rjc_api_client = StubJobControllerAPIClient()
+    rjc_api_client.statuses["previous-job"] = "failed"
+
+    assert run_workflow(rjc_api_client, operational_options={"resume": True})
+    assert rjc_api_client.submit_calls == 5
+    assert (workflow_workspace / "1.txt").read_text() == "1\n"
+
+
+def test_resume_keeps_finished_jobs(run_workflow, workflow_workspace):
+    """Test that jobs that finished while the engine was down are not rerun."""
+    (workflow_workspace / "1.txt").write_text("1\n")
+    _mark_incomplete(workflow_workspace, "1.txt", "previous-job")
+    rjc_api_client = StubJobControllerAPIClient()
+    rjc_api_client.statuses["previous-job"] = "finished"
+
+    assert run_workflow(rjc_api_client, operational_options={"resume": True})
+    assert rjc_api_client.submit_calls == 4
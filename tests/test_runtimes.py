@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake rule runtimes tests."""
+
+from __future__ import absolute_import, print_function
+
+import json
+import os
+
+import pytest
+
+from conftest import StubJobControllerAPIClient, StubWorkflowStatusPublisher
+from reana_workflow_engine_snakemake import executor
+from reana_workflow_engine_snakemake.runtimes import (
+    RuleRuntimes,
+    get_remaining_paths,
+    get_runtimes_file,
+)
+
+
+def test_get_remaining_paths():
+    """Test that each job gets the runtime of its longest path to the end."""
+    children = {"a": ["b", "c"], "b": ["d"], "c": ["d"], "d": [], "e": ["d"]}
+    runtimes = {"a": 1.0, "b": 5.0, "c": 2.0, "d": 1.0, "e": 1.0}
+    remaining = get_remaining_paths(
+        [["a", "e"], ["b", "c"], ["d"]], children.get, runtimes.get
+    )
+    assert remaining == {"a": 7.0, "b": 6.0, "c": 3.0, "d": 1.0, "e": 2.0}
+
+
+def test_rule_runtimes(tmp_path):
+    """Test that rule runtimes are averaged, estimated and saved."""
+    path = tmp_path / "runtimes" / "rules.json"
+    runtimes = RuleRuntimes(str(path))
+    assert runtimes.estimate("fit") == 1.0
+
+    runtimes.observe("fit", 10.0)
+    runtimes.observe("fit", 20.0)
+    runtimes.observe("plot", 2.0)
+    assert runtimes.estimate("fit") == pytest.approx(13.0)
+    assert runtimes.estimate("skim") == pytest.approx(7.5)
+
+    runtimes.save()
+    assert RuleRuntimes(str(path)).estimate("fit") == pytest.approx(13.0)
+
+
+def test_runtime_estimate_changes(tmp_path):
+    """Test that significant changes of the runtime estimates are reported."""
+    runtimes = RuleRuntimes(str(tmp_path / "rules.json"))
+    assert runtimes.observe("fit", 10.0)
+    assert not runtimes.observe("fit", 12.0)
+    assert runtimes.observe("fit", 30.0)
+
+
+def test_runtimes_files_of_users_and_workflows():
+    """Test that workflows of other users or Snakefiles do not share runtimes."""
+    runtimes_file = get_runtimes_file("runtimes", "user-1", "Snakefile", ["a", "b"])
+    assert runtimes_file == get_runtimes_file(
+        "runtimes", "user-1", "./Snakefile", ["b", "a"]
+    )
+    assert runtimes_file != get_runtimes_file(
+        "runtimes", "user-2", "Snakefile", ["a", "b"]
+    )
+    assert runtimes_file != get_runtimes_file(
+        "runtimes", "user-1", "other.smk", ["a", "b"]
+    )
+
+
+def test_run_workflows_with_critical_path_priority(
+    workflow_workspace, tmp_path_factory, monkeypatch
+):
+    """Test that the runtimes of the rules are shared by the runs of a user."""
+    shared_volume = tmp_path_factory.mktemp("shared")
+    monkeypatch.setattr(
+        executor, "SNAKEMAKE_JOB_CACHE_DIR", str(shared_volume / "job-cache")
+    )
+    monkeypatch.setattr(
+        executor, "SNAKEMAKE_CRITICAL_PATH_UPDATE_INTERVAL_IN_SECONDS", 0
+    )
+    prioritise = executor.REANAClusterExecutor._prioritise_critical_path
+    calls = []
+    monkeypatch.setattr(
+        executor.REANAClusterExecutor,
+        "_prioritise_critical_path",
+        lambda self: calls.append(self) or prioritise(self),
+    )
+    for samples, workflow in ((5, "workflow-1"), (7, "workflow-2")):
+        workspace = shared_volume / "users" / "user-1" / "workflows" / workflow
+        workspace.mkdir(parents=True)
+        (workspace / "Snakefile").write_text(
+            (workflow_workspace / "Snakefile").read_text()
+        )
+        monkeypatch.setenv("workflow_workspace", str(workspace))
+        assert executor.run_jobs(
+            StubJobControllerAPIClient(),
+            StubWorkflowStatusPublisher(),
+            str(workspace),
+            "Snakefile",
+            {"samples": samples},
+            operational_options={
+                "critical_path_priority": True,
+                "report_mode": "skip",
+            },
+        )
+    # jobs are prioritised again once the first runtime of the rule is known
+    assert len(calls) > 2
+
+    runtimes_file = get_runtimes_file(
+        str(shared_volume / "job-cache" / "rule-runtimes"),
+        "user-1",
+        "Snakefile",
+        ["all", "sample"],
+    )
+    with open(runtimes_file) as runtimes:
+        assert json.load(runtimes)["sample"]["count"] == 5 + 7
+
+
+def test_critical_path_estimations_debounced(
+    run_workflow, workflow_workspace, monkeypatch
+):
+    """Test that paths are not estimated again at every observed runtime."""
+    prioritise = executor.REANAClusterExecutor._prioritise_critical_path
+    calls = []
+    monkeypatch.setattr(
+        executor.REANAClusterExecutor,
+        "_prioritise_critical_path",
+        lambda self: calls.append(self) or prioritise(self),
+    )
+    options = {"critical_path_priority": True}
+    assert run_workflow(StubJobControllerAPIClient(), operational_options=options)
+    assert len(calls) == 1
+
+
+def test_run_workflow_with_instant_rules(
+    run_workflow, workflow_workspace, tmp_path, monkeypatch
+):
+    """Test that jobs are run when all the known runtimes are zero."""
+    monkeypatch.setattr(executor, "SNAKEMAKE_RULE_RUNTIMES_DIR", str(tmp_path))
+    runtimes_file = get_runtimes_file(str(tmp_path), "", "Snakefile", ["all", "sample"])
+    os.makedirs(os.path.dirname(runtimes_file))
+    with open(runtimes_file, "w") as runtimes:
+        json.dump({"sample": {"runtime": 0.0, "count": 1}}, runtimes)
+    options = {"critical_path_priority": True}
+    assert run_workflow(StubJobControllerAPIClient(), operational_options=options)
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake startup cache tests."""
+
+from __future__ import absolute_import, print_function
+
+import pytest
+
+from conftest import StubJobControllerAPIClient, StubWorkflowStatusPublisher
+from reana_workflow_engine_snakemake import executor
+
+OPTIONS = {"startup_cache": True, "report_mode": "skip"}
+
+
+def test_unchanged_workspace_not_run_again(
+    run_workflow, workflow_workspace, monkeypatch
+):
+    """Test that runs are skipped when nothing changed since the last one."""
+    assert run_workflow(StubJobControllerAPIClient(), operational_options=OPTIONS)
+    cache_dir = workflow_workspace / ".snakemake" / "reana" / "startup-cache"
+    assert len(list((cache_dir / "parse").iterdir())) == 1
+
+    snakemake_calls = []
+    monkeypatch.setattr(
+        executor, "snakemake", lambda **kwargs: snakemake_calls.append(kwargs) or True
+    )
+    assert run_workflow(StubJobControllerAPIClient(), operational_options=OPTIONS)
+    assert not snakemake_calls
+
+    # changes of the parameters or of the workspace files invalidate the cache
+    run_workflow(
+        StubJobControllerAPIClient(),
+        workflow_parameters={"samples": 3},
+        operational_options=OPTIONS,
+    )
+    assert len(snakemake_calls) == 1
+    (workflow_workspace / "0.txt").write_text("changed\n")
+    run_workflow(StubJobControllerAPIClient(), operational_options=OPTIONS)
+    assert len(snakemake_calls) == 2
+
+
+def test_parsed_snakefile_reused(run_workflow, workflow_workspace):
+    """Test that Snakefiles parsed by previous runs are not parsed again."""
+    assert run_workflow(StubJobControllerAPIClient(), operational_options=OPTIONS)
+    (workflow_workspace / "1.txt").unlink()
+    parse = executor.snakemake_workflow.parse
+    calls = []
+    executor.snakemake_workflow.parse = lambda *args: calls.append(args)
+    try:
+        rjc_api_client = StubJobControllerAPIClient()
+        assert run_workflow(rjc_api_client, operational_options=OPTIONS)
+    finally:
+        executor.snakemake_workflow.parse = parse
+    assert not calls
+    assert rjc_api_client.submit_calls == 1
+
+
+def test_run_configuration_changes_invalidate_cache(
+    workflow_workspace, tmp_path_factory, monkeypatch
+):
+    """Test that runs of another Snakefile, engine or external input are not skipped."""
+    external_input = tmp_path_factory.mktemp("external") / "data.txt"
+    external_input.write_text("data\n")
+    snakefile = (
+        "rule all:\n"
+        '    input: expand("{sample}.txt", sample=range(2))\n'
+        "\n"
+        "rule sample:\n"
+        f'    input: "{external_input}"\n'
+        '    output: "{sample}.txt"\n'
+        '    shell: "cat {input} > {output}"\n'
+    )
+    for workflow_file in ("Snakefile", "other.smk"):
+        (workflow_workspace / workflow_file).write_text(snakefile)
+
+    def _run_workflow(workflow_file):
+        return executor.run_jobs(
+            StubJobControllerAPIClient(),
+            StubWorkflowStatusPublisher(),
+            str(workflow_workspace),
+            workflow_file,
+            {},
+            operational_options=OPTIONS,
+        )
+
+    assert _run_workflow("Snakefile")
+    snakemake_calls = []
+    monkeypatch.setattr(
+        executor, "snakemake", lambda **kwargs: snakemake_calls.append(kwargs) or True
+    )
+    assert _run_workflow("Snakefile")
+    assert not snakemake_calls
+
+    _run_workflow("other.smk")
+    assert len(snakemake_calls) == 1
+    _run_workflow("other.smk")
+    assert len(snakemake_calls) == 1
+    monkeypatch.setattr(executor, "REANA_DEFAULT_SNAKEMAKE_ENV_IMAGE", "other-image")
+    _run_workflow("other.smk")
+    assert len(snakemake_calls) == 2
+    external_input.write_text("other data\n")
+    _run_workflow("other.smk")
+    assert len(snakemake_calls) == 3
+
+
+def test_only_workflow_files_checked(run_workflow, workflow_workspace, monkeypatch):
+    """Test that only the files the DAG depends on are part of the workspace state."""
+    (workflow_workspace / "data").mkdir()
+    (workflow_workspace / "data" / "a.csv").write_text("a\n")
+    (workflow_workspace / "Snakefile").write_text(
+        'SAMPLES = glob_wildcards("data/{sample}.csv").sample\n'
+        "\n"
+        "rule all:\n"
+        '    input: expand("{sample}.txt", sample=SAMPLES)\n'
+        "\n"
+        "rule sample:\n"
+        '    input: "data/{sample}.csv"\n'
+        '    output: "{sample}.txt"\n'
+        '    shell: "cat {input} > {output}"\n'
+    )
+    (workflow_workspace / "unrelated").mkdir()
+    assert run_workflow(StubJobControllerAPIClient(), operational_options=OPTIONS)
+
+    snakemake_calls = []
+    monkeypatch.setattr(
+        executor, "snakemake", lambda **kwargs: snakemake_calls.append(kwargs) or True
+    )
+    monkeypatch.setattr(
+        executor.os, "walk", lambda *args: pytest.fail("The workspace was walked.")
+    )
+    (workflow_workspace / "unrelated" / "notes.txt").write_text("notes\n")
+    assert run_workflow(StubJobControllerAPIClient(), operational_options=OPTIONS)
+    assert not snakemake_calls
+
+    # new samples next to the inputs invalidate the cache
+    (workflow_workspace / "data" / "b.csv").write_text("b\n")
+    run_workflow(StubJobControllerAPIClient(), operational_options=OPTIONS)
+    assert len(snakemake_calls) == 1
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake submission throttling tests."""
+
+from __future__ import absolute_import, print_function
+
+from types import SimpleNamespace
+
+import pytest
+from bravado.exception import HTTPGatewayTimeout, HTTPServiceUnavailable
+from requests.exceptions import ConnectTimeout, ReadTimeout
+
+from conftest import StubJobControllerAPIClient
+from reana_workflow_engine_snakemake import executor
+from reana_workflow_engine_snakemake.throttling import (
+    SubmissionThrottle,
+    is_retriable_error,
+    parse_limits,
+)
+
+
+class OverloadedJobController(StubJobControllerAPIClient):
+    """Job controller rejecting the first submissions and counting jobs in flight."""
+
+    def __init__(self, rejected_submissions=0, rejection=None, **kwargs):
+        """Initialise the job controller."""
+        super().__init__(**kwargs)
+        self.rejected_submissions = rejected_submissions
+        self.rejection = rejection or HTTPServiceUnavailable(
+            SimpleNamespace(status_code=503)
+        )
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._reported = set()
+
+    def submit(self, **job_request_body):
+        """Reject the submission if still overloaded, otherwise run the job."""
+        with self._lock:
+            if self.rejected_submissions:
+                self.rejected_submissions -= 1
+                raise self.rejection
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        return super().submit(**job_request_body)
+
+    def check_status(self, job_id):
+        """Count the jobs reported as done as no longer in flight."""
+        status = super().check_status(job_id)
+        with self._lock:
+            if status.status != "running" and job_id not in self._reported:
+                self._reported.add(job_id)
+                self.in_flight -= 1
+        return status
+
+
+def test_throttle_limits_jobs_in_flight():
+    """Test that queued jobs are dispatched once slots are released."""
+    dispatched = []
+    throttle = SubmissionThrottle(
+        dispatched.append,
+        parse_limits("slurm:2, htcondor:1"),
+        latency_target=1,
+        max_delay=1,
+    )
+    jobs = [object() for _ in range(4)]
+
+    assert throttle.admit("a", jobs[0], "slurm", {"rule": 0})
+    assert throttle.admit("b", jobs[1], "slurm", {"rule": 0})
+    assert not throttle.admit("c", jobs[2], "slurm", {"rule": 0})
+    assert throttle.admit("d", jobs[3], "", {"rule": 3})
+    assert throttle.max_queued == 1
+
+    throttle.release(jobs[3])
+    assert dispatched == []
+    throttle.release(jobs[0])
+    assert dispatched == ["c"]
+
+
+def test_throttle_limits_rules_of_group_jobs():
+    """Test that group jobs take a slot of each of their rules."""
+    dispatched = []
+    throttle = SubmissionThrottle(dispatched.append, {}, latency_target=1, max_delay=1)
+    jobs = [object() for _ in range(3)]
+
+    assert throttle.admit("group", jobs[0], "", {"a": 1, "b": 0})
+    assert not throttle.admit("a", jobs[1], "", {"a": 1})
+    assert throttle.admit("b", jobs[2], "", {"b": 0})
+
+    throttle.release(jobs[0])
+    assert dispatched == ["a"]
+
+
+def test_throttle_backs_off_under_load():
+    """Test that the submission delay grows with slow submissions and recovers."""
+    throttle = SubmissionThrottle(None, {}, latency_target=1, max_delay=0.4)
+
+    throttle.record_submission(0.1, overloaded=True)
+    throttle.record_submission(2)
+    throttle.record_submission(2)
+    throttle.record_submission(2)
+    assert throttle.delay == 0.4
+    assert throttle.overloads == 1
+    for _ in range(3):
+        throttle.record_submission(0.1)
+    assert throttle.delay == 0.0
+
+
+def test_run_workflow_with_overloaded_job_controller(
+    run_workflow, workflow_workspace, monkeypatch
+):
+    """Test that jobs are resubmitted and kept under the backend limit."""
+    monkeypatch.setattr(
+        executor, "SNAKEMAKE_MAX_JOBS_PER_COMPUTE_BACKEND", "kubernetes:2"
+    )
+    monkeypatch.setattr(executor, "SNAKEMAKE_SUBMISSION_MAX_DELAY_IN_SECONDS", 0.1)
+    rjc_api_client = OverloadedJobController(rejected_submissions=2)
+
+    assert run_workflow(rjc_api_client)
+    assert rjc_api_client.submit_calls == 5
+    assert rjc_api_client.max_in_flight <= 2
+    for sample in range(5):
+        assert (workflow_workspace / f"{sample}.txt").read_text() == f"{sample}\n"
+
+
+@pytest.mark.parametrize(
+    "exception, retriable",
+    [
+        (HTTPServiceUnavailable(SimpleNamespace(status_code=503)), True),
+        (ConnectTimeout(), True),
+        (HTTPGatewayTimeout(SimpleNamespace(status_code=504)), False),
+        (ReadTimeout(), False),
+        (ConnectionError(), False),
+    ],
+)
+def test_is_retriable_error(exception, retriable):
+    """Test that only submissions that did not reach job-controller are retried."""
+    assert is_retriable_error(exception) == retriable
+
+
+def test_read_timeout_submissions_not_retried(
+    run_workflow, workflow_workspace, monkeypatch
+):
+    """Test that jobs are not submitted again when they may have been created."""
+    monkeypatch.setattr(executor, "SNAKEMAKE_SUBMISSION_MAX_DELAY_IN_SECONDS", 0.1)
+    rjc_api_client = OverloadedJobController(
+        rejected_submissions=1, rejection=ReadTimeout()
+    )
+
+    assert not run_workflow(rjc_api_client)
+    # the timed out job failed, and only the other jobs ran
+    assert rjc_api_client.submit_calls == 4
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake job tracing tests."""
+
+from __future__ import absolute_import, print_function
+
+import json
+import pytest
+
+from conftest import StubJobControllerAPIClient
+from reana_workflow_engine_snakemake import executor, tracing
+from reana_workflow_engine_snakemake.tracing import JobTracer
+
+
+class FakeClock:
+    """Clock whose time is set by the test."""
+
+    def __init__(self):
+        """Initialise the clock at time 0."""
+        self.now = 0.0
+
+    def time(self):
+        """Get the current time."""
+        return self.now
+
+
+class FakeJob:
+    """Snakemake job not part of a group."""
+
+    def __init__(self, jobid, name):
+        """Initialise the job."""
+        self.jobid = jobid
+        self.name = name
+
+    def is_group(self):
+        """Check whether the job is a group."""
+        return False
+
+
+def test_critical_path(monkeypatch):
+    """Test that the critical path follows the dependencies done last."""
+    clock = FakeClock()
+    monkeypatch.setattr(tracing, "time", clock)
+    tracer = JobTracer()
+    short, long = FakeJob(1, "short"), FakeJob(2, "long")
+    merge = FakeJob(3, "merge")
+
+    def run(job, dependencies, job_id, duration):
+        tracer.add_job(job, dependencies)
+        clock.now += 1
+        tracer.record([job], "submitted", job_id=job_id)
+        clock.now += duration
+        tracer.record_job_id(job_id, "finished")
+        clock.now += 2
+        tracer.record([job], "detected")
+        tracer.record([job], "done")
+
+    run(short, [], "job-1", 1)
+    clock.now = 0
+    run(long, [], "job-2", 5)
+    run(merge, [short, long], "job-3", 1)
+
+    summary = tracer.summarise()
+    assert [job["rule"] for job in summary["critical_path"]["jobs"]] == [
+        "long",
+        "merge",
+    ]
+    assert summary["makespan"] == 12
+    assert summary["critical_path"]["phases"] == {
+        "scheduling": 0,
+        "submission": 2,
+        "queueing": 0,
+        "execution": 6,
+        "detection": 4,
+        "callback": 0,
+    }
+    assert summary["phases"]["execution"] == 7
+
+
+def test_run_workflow_with_tracing(run_workflow, workflow_workspace, monkeypatch):
+    """Test that the trace and its summary are written for the workflow run."""
+    monkeypatch.setattr(executor, "SNAKEMAKE_TRACE_FILE", "trace/jobs.json")
+
+    assert run_workflow(StubJobControllerAPIClient())
+
+    trace = json.loads((workflow_workspace / "trace" / "jobs.json").read_text())
+    phases = {event["name"] for event in trace["traceEvents"] if event["ph"] == "X"}
+    assert {"scheduling", "submission", "detection", "callback"} <= phases
+    summary = json.loads(
+        (workflow_workspace / "trace" / "jobs.summary.json").read_text()
+    )
+    # the `all` job does not run in the executor
+    assert summary["jobs"] == 5
+    assert summary["critical_path"]["jobs"][-1]["rule"] == "sample"
+    assert sum(summary["critical_path"]["phases"].values()) == pytest.approx(
+        summary["makespan"]
+    )